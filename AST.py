@@ -1,4 +1,7 @@
 class Node(object):
+    # nodes have no __dict__, every subclass lists its attributes in __slots__
+    __slots__ = ("lineno",)
+
     def __init__(self, lineno):
         self.lineno = lineno
     def visit(self, visitor):
@@ -10,6 +13,8 @@ class Node(object):
 
 # used in productions from expr
 class ValueNode(Node):
+    __slots__ = ("value", "typeOfValue")
+
     def __init__(self, value, typeOfValue, lineno=-1):
         super().__init__(lineno)
         self.value = value
@@ -17,26 +22,33 @@ class ValueNode(Node):
 
 # used in productions from start
 class StartNode(Node):
-    def __init__(self, block, nextStart=None, lineno=-1):
+    __slots__ = ("blocks",)
+
+    def __init__(self, blocks, lineno=-1):
         super().__init__(lineno)
-        self.block = block
-        self.nextStart = nextStart
+        self.blocks = blocks
 
 # used in productions from block and next_statements
 class Statement(Node):
-    def __init__(self, statement, nextStatements=None, lineno=-1):
+    __slots__ = ("statements",)
+
+    def __init__(self, statements, lineno=-1):
         super().__init__(lineno)
-        self.statement = statement
-        self.nextStatements = nextStatements
+        self.statements = statements
 
 # used in productions from block
 class BlockStatement(Node):
+    __slots__ = ("nextStatements", "localSlots")
+
     def __init__(self, nextStatements, lineno=-1):
         super().__init__(lineno)
         self.nextStatements = nextStatements
+        self.localSlots = () # frame slots of the variables the block binds, set by the Resolver
 
 # used in productions from action_statement
 class AssignStatement(Node):
+    __slots__ = ("variableId", "action", "newValue")
+
     def __init__(self, variableId, action, newValue, lineno=-1):
         super().__init__(lineno)
         self.variableId = variableId
@@ -45,24 +57,32 @@ class AssignStatement(Node):
 
 # used in productions from action_statement
 class ReturnValue(Node):
+    __slots__ = ("value",)
+
     def __init__(self, value, lineno=-1):
         super().__init__(lineno)
         self.value = value
 
 # used in productions from action_statement
 class PrintValue(Node):
+    __slots__ = ("value",)
+
     def __init__(self, value, lineno=-1):
         super().__init__(lineno)
         self.value = value
 
 # used in productions from action_statement
 class LoopControlNode(Node):
+    __slots__ = ("action",)
+
     def __init__(self, action, lineno=-1):
         super().__init__(lineno)
         self.action = action
 
 # used in production from values
 class Vector(Node):
+    __slots__ = ("value", "nextItem", "isMatrixHead")
+
     def __init__(self, value, nextItem=None, isMatrixHead=False, lineno=-1):
         super().__init__(lineno)
         self.value = value
@@ -70,13 +90,27 @@ class Vector(Node):
         self.isMatrixHead = isMatrixHead
 
 class ValueList(Node):
+    __slots__ = ("value", "nextItem", "weak")
+
     def __init__(self, value, nextItem=None, lineno=-1):
         super().__init__(lineno)
         self.value = value
         self.nextItem = nextItem
         self.weak = False
 
+# used in productions from values instead of a chain of ValueList nodes when all values are numeric literals of one type
+class PackedValues(Node):
+    __slots__ = ("values", "typeOfValue", "weak")
+
+    def __init__(self, values, typeOfValue, lineno=-1):
+        super().__init__(lineno)
+        self.values = values # array of the values, in order
+        self.typeOfValue = typeOfValue
+        self.weak = False
+
 class IndexList(Node):
+    __slots__ = ("index", "nextItem")
+
     def __init__(self, index, nextItem=None, lineno=-1):
         super().__init__(lineno)
         self.index = index
@@ -84,14 +118,38 @@ class IndexList(Node):
 
 # used in production from expr
 class ArithmeticExpression(Node):
+    __slots__ = ("leftExpr", "action", "rightExpr")
+
     def __init__(self, leftExpr, action, rightExpr, lineno=-1):
         super().__init__(lineno)
         self.leftExpr = leftExpr
         self.action = action
         self.rightExpr = rightExpr
 
+    def __reduce__(self):
+        # pickled as a flat chain too, as pickle would otherwise recurse once per operator
+        operand, chain = leftChain(self)
+        return rebuildChain, (operand, [(expression.action, expression.rightExpr, expression.lineno) for expression in chain])
+
+def rebuildChain(operand, links):
+    for action, rightExpr, lineno in links:
+        operand = ArithmeticExpression(operand, action, rightExpr, lineno)
+    return operand
+
+# a + b - c ... parses as a left-nested chain, which visitors go along in a loop rather than recursing once per operator;
+# returns the innermost left operand and the operators from the innermost outwards
+def leftChain(node):
+    chain = []
+    while node.__class__ is ArithmeticExpression:
+        chain.append(node)
+        node = node.leftExpr
+    chain.reverse()
+    return node, chain
+
 # used in production from expr
 class ComparisonExpression(Node):
+    __slots__ = ("leftExpr", "action", "rightExpr")
+
     def __init__(self, leftExpr, action, rightExpr, lineno=-1):
         super().__init__(lineno)
         self.leftExpr = leftExpr
@@ -100,12 +158,16 @@ class ComparisonExpression(Node):
 
 # used in production from expr
 class NegateExpression(Node):
+    __slots__ = ("expr",)
+
     def __init__(self, expr, lineno=-1):
         super().__init__(lineno)
         self.expr = expr
 
 # used in production from flow_control_statement
 class IfStatement(Node):
+    __slots__ = ("condition", "action", "elseAction")
+
     def __init__(self, condition, action, elseAction=None, lineno=-1):
         super().__init__(lineno)
         self.condition = condition
@@ -114,6 +176,8 @@ class IfStatement(Node):
 
 # used in production from flow_control_statement
 class WhileStatement(Node):
+    __slots__ = ("condition", "action")
+
     def __init__(self, condition, action, lineno=-1):
         super().__init__(lineno)
         self.condition = condition
@@ -121,20 +185,27 @@ class WhileStatement(Node):
 
 # used in production from flow_control_statement
 class ForStatement(Node):
+    __slots__ = ("loopVariable", "valueRange", "action", "loopSlot")
+
     def __init__(self, loopVariable, valueRange, action, lineno=-1):
         super().__init__(lineno)
         self.loopVariable = loopVariable
         self.valueRange = valueRange
         self.action = action
+        self.loopSlot = None # frame slot of loopVariable, set by the Resolver
 
 # used in production from expr
 class TransposeExpression(Node):
+    __slots__ = ("value",)
+
     def __init__(self, value, lineno=-1):
         super().__init__(lineno)
         self.value = value
 
 # used in production from range
 class RangeNode(Node):
+    __slots__ = ("rangeStart", "rangeEnd")
+
     def __init__(self, rangeStart, rangeEnd, lineno=-1):
         super().__init__(lineno)
         self.rangeStart = rangeStart
@@ -142,25 +213,34 @@ class RangeNode(Node):
 
 # used in productions from id_expr
 class Variable(Node):
+    __slots__ = ("name", "slot")
+
     def __init__(self, name, lineno=-1):
         super().__init__(lineno)
         self.name = name
+        self.slot = None # set by the Resolver
 
 # used in productions from expr
 class IndexedVariable(Node):
+    __slots__ = ("name", "indexes", "slot")
+
     def __init__(self, name, indexes, lineno=-1):
         super().__init__(lineno)
         self.name = name
         self.indexes = indexes
+        self.slot = None # set by the Resolver
 
 # used in productions from expr
 class MatrixInitiator(Node):
+    __slots__ = ("matrixType", "size")
+
     def __init__(self, matrixType, size, lineno=-1):
         super().__init__(lineno)
         self.matrixType = matrixType
         self.size = size
 
 class Error(Node):
+    __slots__ = ()
+
     def __init__(self, lineno=-1):
         super().__init__(lineno)
-        pass
@@ -0,0 +1,142 @@
+import os
+import sys
+import glob
+import time
+import pickle
+import hashlib
+import tempfile
+from collections import OrderedDict
+
+def implementationVersion():
+    # any change to the interpreter's sources or to the Python version invalidates old entries
+    digest = hashlib.sha256(sys.version.encode())
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*.py"))):
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+def defaultCacheDirectory():
+    return os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "compiler-theory")
+
+class Cache(object):
+    # content-addressed store of checked programs; entries are written to a temporary file and
+    # renamed into place so concurrent writers never expose partial entries, and the least recently
+    # used entries (by modification time, refreshed on every hit) are evicted above maxSize bytes
+    suffix = ".pickle"
+
+    def __init__(self, directory=None, maxSize=64 * 1024 * 1024):
+        self.directory = directory if directory is not None else defaultCacheDirectory()
+        self.maxSize = maxSize
+        self.version = implementationVersion()
+
+    def key(self, source, *options):
+        digest = hashlib.sha256(self.version.encode())
+        digest.update(repr(options).encode())
+        digest.update(source.encode())
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+    def load(self, key):
+        path = self.path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception: # truncated or written by an incompatible version
+            self.remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def store(self, key, value):
+        try:
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, RecursionError, TypeError, AttributeError):
+            return False
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            descriptor, temporaryPath = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(data)
+                os.replace(temporaryPath, self.path(key))
+            except BaseException:
+                self.remove(temporaryPath)
+                raise
+        except OSError:
+            return False
+        self.evict()
+        return True
+
+    def evict(self):
+        # temporary files left behind by writers that died before renaming them
+        for path in glob.glob(os.path.join(self.directory, "*.tmp")):
+            try:
+                if os.stat(path).st_mtime < time.time() - 3600:
+                    self.remove(path)
+            except FileNotFoundError:
+                continue
+
+        entries = []
+        totalSize = 0
+        for path in glob.glob(os.path.join(self.directory, "*" + self.suffix)):
+            try:
+                status = os.stat(path)
+            except FileNotFoundError: # removed by another process in the meantime
+                continue
+            entries.append((status.st_mtime, status.st_size, path))
+            totalSize += status.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if totalSize <= self.maxSize:
+                break
+            self.remove(path)
+            totalSize -= size
+
+    def remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+class MemoryCache(object):
+    # least recently used entries of a long-lived process, in front of an optional on-disk Cache
+    def __init__(self, maxEntries=256, backing=None):
+        self.maxEntries = maxEntries
+        self.backing = backing
+        self.version = backing.version if backing is not None else implementationVersion()
+        self.entries = OrderedDict()
+
+    def key(self, source, *options):
+        digest = hashlib.sha256(self.version.encode())
+        digest.update(repr(options).encode())
+        digest.update(source.encode())
+        return digest.hexdigest()
+
+    def load(self, key):
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+            return value
+        if self.backing is not None:
+            value = self.backing.load(key)
+            if value is not None:
+                self.remember(key, value)
+        return value
+
+    def store(self, key, value):
+        self.remember(key, value)
+        if self.backing is not None:
+            self.backing.store(key, value)
+
+    def remember(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
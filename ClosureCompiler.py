@@ -0,0 +1,310 @@
+import AST
+from TypeChecker import NodeVisitor
+from Interpreter import Interpreter, ScalarValue, ReturnException, UndefinedValue, TRUE, FALSE, BREAK, CONTINUE, stored
+
+# statement closures return None, or the loop control signal that has to be passed up to the enclosing loop
+
+class ClosureCompiler(NodeVisitor):
+    def __init__(self, interpreter=None):
+        # the interpreter provides memory, the calculator and the runtime semantics of complex nodes
+        self.interpreter = interpreter if interpreter is not None else Interpreter()
+
+    def compile(self, ast):
+        return self.visit(ast)
+
+    def run(self, program):
+        return self.interpreter.run(program)
+
+    def sequence(self, statements):
+        if len(statements) == 1:
+            return statements[0]
+
+        def statementList():
+            for statement in statements:
+                signal = statement()
+                if signal is not None:
+                    return signal
+        return statementList
+
+    def visit_ValueNode(self, node):
+        constant = ScalarValue(node.typeOfValue, node.value)
+
+        def valueNode():
+            return constant
+        return valueNode
+
+    def visit_StartNode(self, node):
+        return self.sequence([self.visit(block) for block in node.blocks])
+
+    def visit_Statement(self, node):
+        return self.sequence([self.visit(statement) for statement in node.statements])
+
+    def visit_BlockStatement(self, node):
+        statements = self.visit(node.nextStatements)
+        localSlots = node.localSlots
+        if not localSlots:
+            return statements
+        slots = self.interpreter.scopes.slots
+
+        def blockStatement():
+            for slot in localSlots:
+                slots[slot] = None
+            return statements()
+        return blockStatement
+
+    def visit_AssignStatement(self, node):
+        target = self.visit(node.variableId)
+        newValue = self.visit(node.newValue)
+        slot, name, action, lineno = node.variableId.slot, node.variableId.name, node.action, node.lineno
+        assign = self.interpreter.assign
+        slots = self.interpreter.scopes.slots
+
+        if isinstance(node.variableId, AST.IndexedVariable):
+            def indexedAssignStatement():
+                variableInfo = target()
+                assign(slot, name, True, action, variableInfo, newValue(), lineno)
+            return indexedAssignStatement
+
+        if action == "=":
+            def assignStatement():
+                valueInfo = newValue()
+                if valueInfo.__class__ is ScalarValue:
+                    valueInfo.name = name
+                else:
+                    valueInfo = stored(valueInfo, name)
+                slots[slot] = valueInfo
+            return assignStatement
+
+        operation = self.interpreter.calculator.operationTable[action[0]]
+        getType = self.interpreter.typeTable.getType
+
+        def compoundAssignStatement():
+            variableInfo = target()
+            valueInfo = newValue()
+            if variableInfo.__class__ is ScalarValue and variableInfo.indexIterator is None:
+                result = ScalarValue(getType(variableInfo.typeOfValue, action, valueInfo.typeOfValue), operation(variableInfo.content, valueInfo.content))
+                result.name = name
+                slots[slot] = result
+            else:
+                assign(slot, name, False, action, variableInfo, valueInfo, lineno)
+        return compoundAssignStatement
+
+    def visit_ReturnValue(self, node):
+        value = self.visit(node.value)
+
+        def returnValue():
+            raise ReturnException(value().content)
+        return returnValue
+
+    def visit_PrintValue(self, node):
+        value = self.visit(node.value)
+        printValue = self.interpreter.printValue
+
+        def printStatement():
+            printValue(value())
+        return printStatement
+
+    def visit_LoopControlNode(self, node):
+        signal = BREAK if node.action == "break" else CONTINUE
+
+        def loopControl():
+            return signal
+        return loopControl
+
+    def visit_Vector(self, node):
+        buildVector, vector = self.interpreter.buildVector, self.interpreter.vector
+        value = self.visit(node.value)
+        if node.isMatrixHead:
+            def matrixHead():
+                return buildVector(value(), True)
+            return matrixHead
+
+        rows = [value]
+        nextItem = node.nextItem
+        while nextItem is not None:
+            rows.append(self.visit(nextItem.value))
+            nextItem = nextItem.nextItem
+
+        def vectorRows():
+            return vector([row() for row in rows])
+        return vectorRows
+
+    def visit_ValueList(self, node):
+        valueList = self.interpreter.valueList
+        items = []
+        while node is not None:
+            items.append(self.visit(node.value))
+            node = node.nextItem
+        if len(items) == 1:
+            return items[0]
+
+        def valueListItems():
+            return valueList([item() for item in items])
+        return valueListItems
+
+    def visit_PackedValues(self, node):
+        packedValues = self.interpreter.packedValues
+        typeOfValue, values = node.typeOfValue, node.values
+
+        def packed():
+            return packedValues(typeOfValue, values)
+        return packed
+
+    def visit_IndexList(self, node):
+        buildIndexList = self.interpreter.buildIndexList
+        index, lineno = self.visit(node.index), node.lineno
+        if node.nextItem is None:
+            def singleIndex():
+                return buildIndexList(index(), None, lineno)
+            return singleIndex
+
+        nextIndex = self.visit(node.nextItem)
+
+        def indexList():
+            valueInfo = index()
+            return buildIndexList(valueInfo, nextIndex(), lineno)
+        return indexList
+
+    def visit_ArithmeticExpression(self, node):
+        if node.leftExpr.__class__ is AST.ArithmeticExpression:
+            return self.arithmeticChain(node)
+        left, right = self.visit(node.leftExpr), self.visit(node.rightExpr)
+        action, lineno = node.action, node.lineno
+        operation = self.interpreter.calculator.operationTable[action]
+        getType = self.interpreter.typeTable.getType
+        arithmetic = self.interpreter.arithmetic
+
+        def arithmeticExpression():
+            leftObject = left()
+            rightObject = right()
+            if leftObject.__class__ is ScalarValue and rightObject.__class__ is ScalarValue:
+                return ScalarValue(getType(leftObject.typeOfValue, action, rightObject.typeOfValue), operation(leftObject.content, rightObject.content))
+            return arithmetic(action, leftObject, rightObject, lineno)
+        return arithmeticExpression
+
+    def arithmeticChain(self, node):
+        # one closure runs the whole chain, nesting a closure per operator would recurse as deep as the chain is long
+        operand, chain = AST.leftChain(node)
+        first = self.visit(operand)
+        operationTable = self.interpreter.calculator.operationTable
+        steps = [(expression.action, expression.lineno, operationTable[expression.action], self.visit(expression.rightExpr))
+                 for expression in chain]
+        getType = self.interpreter.typeTable.getType
+        arithmetic = self.interpreter.arithmetic
+
+        def arithmeticChain():
+            leftObject = first()
+            for action, lineno, operation, right in steps:
+                rightObject = right()
+                if leftObject.__class__ is ScalarValue and rightObject.__class__ is ScalarValue:
+                    leftObject = ScalarValue(getType(leftObject.typeOfValue, action, rightObject.typeOfValue), operation(leftObject.content, rightObject.content))
+                else:
+                    leftObject = arithmetic(action, leftObject, rightObject, lineno)
+            return leftObject
+        return arithmeticChain
+
+    def visit_ComparisonExpression(self, node):
+        left, right = self.visit(node.leftExpr), self.visit(node.rightExpr)
+        action = node.action
+        operation = self.interpreter.calculator.operationTable[action]
+        calculate = self.interpreter.calculator.calculate
+
+        def comparisonExpression():
+            leftObject = left()
+            rightObject = right()
+            if leftObject.__class__ is ScalarValue:
+                return TRUE if operation(leftObject.content, rightObject.content) else FALSE
+            return calculate(action, [leftObject, rightObject])
+        return comparisonExpression
+
+    def visit_NegateExpression(self, node):
+        expr = self.visit(node.expr)
+        calculate = self.interpreter.calculator.calculate
+
+        def negateExpression():
+            return calculate("-", [expr()])
+        return negateExpression
+
+    def visit_IfStatement(self, node):
+        condition, action = self.visit(node.condition), self.visit(node.action)
+        if node.elseAction is None:
+            def ifStatement():
+                if condition().content:
+                    return action()
+            return ifStatement
+
+        elseAction = self.visit(node.elseAction)
+
+        def ifElseStatement():
+            if condition().content:
+                return action()
+            return elseAction()
+        return ifElseStatement
+
+    def visit_WhileStatement(self, node):
+        condition, action = self.visit(node.condition), self.visit(node.action)
+
+        def whileStatement():
+            while condition().content:
+                if action() == BREAK:
+                    break
+        return whileStatement
+
+    def visit_ForStatement(self, node):
+        valueRange, action = self.visit(node.valueRange), self.visit(node.action)
+        loopSlot = node.loopSlot
+        slots = self.interpreter.scopes.slots
+
+        def forStatement():
+            rangeOutput = valueRange()
+            loopVariableValue = rangeOutput.getNext()
+            while loopVariableValue is not None:
+                slots[loopSlot] = ScalarValue("integer", value=loopVariableValue)
+                if action() == BREAK:
+                    break
+                loopVariableValue = rangeOutput.getNext()
+        return forStatement
+
+    def visit_TransposeExpression(self, node):
+        value = self.visit(node.value)
+        calculate = self.interpreter.calculator.calculate
+
+        def transposeExpression():
+            return calculate("'", [value()])
+        return transposeExpression
+
+    def visit_RangeNode(self, node):
+        rangeStart, rangeEnd, lineno = self.visit(node.rangeStart), self.visit(node.rangeEnd), node.lineno
+        makeRange = self.interpreter.makeRange
+
+        def rangeNode():
+            valueStart = rangeStart()
+            return makeRange(valueStart, rangeEnd(), lineno)
+        return rangeNode
+
+    def visit_Variable(self, node):
+        slot = node.slot
+        slots = self.interpreter.scopes.slots
+
+        def variable():
+            variableInfo = slots[slot]
+            if variableInfo is None:
+                return UndefinedValue()
+            return variableInfo
+        return variable
+
+    def visit_IndexedVariable(self, node):
+        indexes, slot, name, lineno = self.visit(node.indexes), node.slot, node.name, node.lineno
+        indexVariable = self.interpreter.indexVariable
+
+        def indexedVariable():
+            return indexVariable(slot, name, indexes(), lineno)
+        return indexedVariable
+
+    def visit_MatrixInitiator(self, node):
+        size, matrixType, lineno = self.visit(node.size), node.matrixType, node.lineno
+        initMatrix = self.interpreter.initMatrix
+
+        def matrixInitiator():
+            return initMatrix(matrixType, size(), lineno)
+        return matrixInitiator
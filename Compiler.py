@@ -0,0 +1,239 @@
+import AST
+from TypeChecker import NodeVisitor
+
+# opcodes of the linear instruction stream, every instruction is an (opcode, argument) tuple
+LOAD_CONST = 0
+LOAD_VAR = 1
+BINARY_OP = 2
+COMPARE = 3
+ASSIGN = 4
+JUMP = 5
+JUMP_IF_FALSE = 6
+FOR_ITER = 7
+LOAD_INDEXED = 8
+BUILD_INDEX = 9
+BUILD_LIST = 10
+BUILD_VECTOR = 11
+NEGATE = 12
+TRANSPOSE = 13
+INIT_MATRIX = 14
+MAKE_RANGE = 15
+PRINT = 16
+RETURN = 17
+POP_TOP = 18
+HALT = 19
+LOAD_PACKED = 20
+CLEAR_SLOTS = 21
+
+opcodeNames = {
+    LOAD_CONST: "LOAD_CONST",
+    LOAD_VAR: "LOAD_VAR",
+    BINARY_OP: "BINARY_OP",
+    COMPARE: "COMPARE",
+    ASSIGN: "ASSIGN",
+    JUMP: "JUMP",
+    JUMP_IF_FALSE: "JUMP_IF_FALSE",
+    FOR_ITER: "FOR_ITER",
+    LOAD_INDEXED: "LOAD_INDEXED",
+    BUILD_INDEX: "BUILD_INDEX",
+    BUILD_LIST: "BUILD_LIST",
+    BUILD_VECTOR: "BUILD_VECTOR",
+    NEGATE: "NEGATE",
+    TRANSPOSE: "TRANSPOSE",
+    INIT_MATRIX: "INIT_MATRIX",
+    MAKE_RANGE: "MAKE_RANGE",
+    PRINT: "PRINT",
+    RETURN: "RETURN",
+    POP_TOP: "POP_TOP",
+    HALT: "HALT",
+    LOAD_PACKED: "LOAD_PACKED",
+    CLEAR_SLOTS: "CLEAR_SLOTS",
+}
+
+class LoopContext(object):
+    def __init__(self, continueTarget):
+        self.continueTarget = continueTarget
+        self.breakJumps = []
+
+class Compiler(NodeVisitor):
+    def __init__(self):
+        self.code = []
+        self.loops = []
+
+    def compile(self, ast):
+        self.code = []
+        self.loops = []
+        self.visit(ast)
+        self.emit(HALT)
+        return self.code
+
+    def emit(self, opcode, argument=None):
+        self.code.append((opcode, argument))
+        return len(self.code) - 1
+
+    def patch(self, position, target):
+        opcode, argument = self.code[position]
+        if opcode == FOR_ITER:
+            self.code[position] = (opcode, (argument[0], target))
+        else:
+            self.code[position] = (opcode, target)
+
+    def visit_ValueNode(self, node):
+        self.emit(LOAD_CONST, (node.typeOfValue, node.value))
+
+    def visit_StartNode(self, node):
+        for block in node.blocks:
+            self.visit(block)
+
+    def visit_Statement(self, node):
+        for statement in node.statements:
+            self.visit(statement)
+
+    def visit_BlockStatement(self, node):
+        if node.localSlots:
+            self.emit(CLEAR_SLOTS, node.localSlots)
+        self.visit(node.nextStatements)
+
+    def visit_AssignStatement(self, node):
+        self.visit(node.variableId)
+        self.visit(node.newValue)
+        isIndexed = isinstance(node.variableId, AST.IndexedVariable)
+        self.emit(ASSIGN, (node.variableId.slot, node.variableId.name, isIndexed, node.action, node.lineno))
+
+    def visit_ReturnValue(self, node):
+        self.visit(node.value)
+        self.emit(RETURN)
+
+    def visit_PrintValue(self, node):
+        self.visit(node.value)
+        self.emit(PRINT)
+
+    def visit_LoopControlNode(self, node):
+        loop = self.loops[-1]
+        if node.action == "continue":
+            self.emit(JUMP, loop.continueTarget)
+        else:
+            loop.breakJumps.append(self.emit(JUMP))
+
+    def visit_Vector(self, node):
+        self.visit(node.value)
+        if node.isMatrixHead:
+            self.emit(BUILD_VECTOR, (True, 1))
+            return
+
+        # rows are pushed left to right and built into one value by a single instruction
+        rows = 1
+        nextItem = node.nextItem
+        while nextItem is not None:
+            self.visit(nextItem.value)
+            nextItem = nextItem.nextItem
+            rows += 1
+        self.emit(BUILD_VECTOR, (False, rows))
+
+    def visit_ValueList(self, node):
+        items = 0
+        while node is not None:
+            self.visit(node.value)
+            node = node.nextItem
+            items += 1
+        if items > 1:
+            self.emit(BUILD_LIST, items)
+
+    def visit_PackedValues(self, node):
+        self.emit(LOAD_PACKED, (node.typeOfValue, node.values))
+
+    def visit_IndexList(self, node):
+        self.visit(node.index)
+        if node.nextItem is None:
+            self.emit(BUILD_INDEX, (False, node.lineno))
+        else:
+            self.visit(node.nextItem)
+            self.emit(BUILD_INDEX, (True, node.lineno))
+
+    def visit_ArithmeticExpression(self, node):
+        operand, chain = AST.leftChain(node)
+        self.visit(operand)
+        for expression in chain:
+            self.visit(expression.rightExpr)
+            self.emit(BINARY_OP, (expression.action, expression.lineno))
+
+    def visit_ComparisonExpression(self, node):
+        self.visit(node.leftExpr)
+        self.visit(node.rightExpr)
+        self.emit(COMPARE, node.action)
+
+    def visit_NegateExpression(self, node):
+        self.visit(node.expr)
+        self.emit(NEGATE)
+
+    def visit_IfStatement(self, node):
+        self.visit(node.condition)
+        jumpToElse = self.emit(JUMP_IF_FALSE)
+        self.visit(node.action)
+        if node.elseAction is None:
+            self.patch(jumpToElse, len(self.code))
+            return
+        jumpToEnd = self.emit(JUMP)
+        self.patch(jumpToElse, len(self.code))
+        self.visit(node.elseAction)
+        self.patch(jumpToEnd, len(self.code))
+
+    def visit_WhileStatement(self, node):
+        loopStart = len(self.code)
+        self.visit(node.condition)
+        jumpToEnd = self.emit(JUMP_IF_FALSE)
+
+        loop = LoopContext(loopStart)
+        self.loops.append(loop)
+        self.visit(node.action)
+        self.loops.pop()
+
+        self.emit(JUMP, loopStart)
+        self.patch(jumpToEnd, len(self.code))
+        for position in loop.breakJumps:
+            self.patch(position, len(self.code))
+
+    def visit_ForStatement(self, node):
+        # the range object stays on the stack for the whole loop and is popped at its end
+        self.visit(node.valueRange)
+        loopStart = self.emit(FOR_ITER, (node.loopSlot, None))
+
+        loop = LoopContext(loopStart)
+        self.loops.append(loop)
+        self.visit(node.action)
+        self.loops.pop()
+
+        self.emit(JUMP, loopStart)
+        self.patch(loopStart, len(self.code))
+        for position in loop.breakJumps:
+            self.patch(position, len(self.code))
+        self.emit(POP_TOP)
+
+    def visit_TransposeExpression(self, node):
+        self.visit(node.value)
+        self.emit(TRANSPOSE)
+
+    def visit_RangeNode(self, node):
+        self.visit(node.rangeStart)
+        self.visit(node.rangeEnd)
+        self.emit(MAKE_RANGE, node.lineno)
+
+    def visit_Variable(self, node):
+        self.emit(LOAD_VAR, node.slot)
+
+    def visit_IndexedVariable(self, node):
+        self.visit(node.indexes)
+        self.emit(LOAD_INDEXED, (node.slot, node.name, node.lineno))
+
+    def visit_MatrixInitiator(self, node):
+        self.visit(node.size)
+        self.emit(INIT_MATRIX, (node.matrixType, node.lineno))
+
+def disassemble(code):
+    lines = []
+    for position, (opcode, argument) in enumerate(code):
+        if argument is None:
+            lines.append(f"{position:>6}  {opcodeNames[opcode]}")
+        else:
+            lines.append(f"{position:>6}  {opcodeNames[opcode]:<14} {argument!r}")
+    return "\n".join(lines)
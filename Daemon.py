@@ -0,0 +1,126 @@
+# keeps one warmed-up interpreter process serving `python client.py ...` runs over a Unix socket;
+# programs are checked and compiled in the daemon, which caches them, and every run executes in a
+# forked child so that it starts from the warm state and cannot disturb the daemon or other runs
+import os
+import sys
+import marshal
+import signal
+import socket
+import argparse
+from main import argumentParser, programKind, loadProgram, runProgram, compileProgram, captured, numpy
+from Cache import Cache, MemoryCache
+from client import defaultSocketPath, receiveAll
+
+class Daemon(object):
+    def __init__(self, socketPath, cache=None):
+        self.socketPath = socketPath
+        self.cache = cache
+        self.pid = os.getpid()
+
+    def compile(self, message):
+        argParser = argumentParser(prog="client.py")
+        args = argParser.parse_args(message["argv"])
+
+        if args.storage == "numpy" and numpy is None:
+            argParser.error("--storage numpy requires NumPy to be installed")
+        if args.profile and (args.backend != "tree" or programKind(args) != "ast"):
+            argParser.error("--profile instruments the tree walker and works only with --backend tree")
+        if args.profile_stacks is not None: # the daemon would write the file for whoever sent the request
+            argParser.error("--profile-stacks writes files and is not served by the daemon, run main.py instead")
+
+        filename = os.path.join(message["cwd"], args.filename)
+        if args.filename == "-" and "source" in message:
+            text = message["source"]
+        else:
+            try:
+                with open(filename, "r") as file:
+                    text = file.read()
+            except IOError:
+                print("Cannot open {0} file".format(args.filename))
+                sys.exit(0)
+
+        return args, filename, loadProgram(args, text, None if args.no_cache else self.cache)
+
+    def run(self, connection, listener):
+        message = marshal.loads(receiveAll(connection))
+        prepared, status, stdout, stderr = captured(self.compile, message)
+        if status is not None:
+            self.respond(connection, status, stdout, stderr)
+            return
+
+        if os.fork() != 0:
+            return
+        try:
+            listener.close()
+            args, filename, compiled = prepared
+            _, status, runStdout, runStderr = captured(runProgram, args, compiled, filename)
+            self.respond(connection, status or 0, stdout + runStdout, stderr + runStderr)
+        finally:
+            os._exit(0)
+
+    def respond(self, connection, status, stdout, stderr):
+        try:
+            connection.sendall(marshal.dumps({"stdout": stdout, "stderr": stderr, "status": status}))
+        except OSError: # the client went away
+            pass
+
+    def reap(self):
+        try:
+            while os.waitpid(-1, os.WNOHANG)[0] != 0:
+                pass
+        except ChildProcessError:
+            pass
+
+    def serve(self):
+        if os.path.exists(self.socketPath):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(self.socketPath)
+                    sys.exit(f"A daemon is already listening on {self.socketPath}")
+                except ConnectionRefusedError: # left behind by a daemon that was killed
+                    os.remove(self.socketPath)
+
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # runs are served to the daemon's user only; the umask keeps the socket private until it is chmodded
+            mask = os.umask(0o177)
+            try:
+                listener.bind(self.socketPath)
+            finally:
+                os.umask(mask)
+            os.chmod(self.socketPath, 0o600)
+            listener.listen(64)
+            while True:
+                connection, _ = listener.accept()
+                try:
+                    self.reap()
+                    self.run(connection, listener)
+                finally:
+                    connection.close()
+        finally:
+            if os.getpid() == self.pid:
+                listener.close()
+                os.remove(self.socketPath)
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser(description="serve `python client.py` runs from one warmed-up process")
+    argParser.add_argument("--socket", default=defaultSocketPath(),
+                           help="path of the Unix socket (default: $COMPILER_THEORY_SOCKET or one in $XDG_RUNTIME_DIR)")
+    argParser.add_argument("--memory-cache", type=int, default=256,
+                           help="number of compiled programs kept in memory")
+    argParser.add_argument("--no-cache", action="store_true",
+                           help="do not use the on-disk cache behind the in-memory one")
+    argParser.add_argument("--cache-dir", default=None,
+                           help="directory of the on-disk cache (default: $XDG_CACHE_HOME/compiler-theory)")
+    argParser.add_argument("--cache-size", type=int, default=64 * 1024 * 1024,
+                           help="size in bytes above which least recently used on-disk cache entries are evicted")
+    args = argParser.parse_args()
+
+    # compile once so that the parser and everything a run needs is imported and initialized before forking
+    captured(lambda: compileProgram("x = [1, 2] .+ [3, 4];", "ast"))
+    daemon = Daemon(args.socket, MemoryCache(args.memory_cache, None if args.no_cache else Cache(args.cache_dir, args.cache_size)))
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
@@ -2,13 +2,35 @@ import AST
 from Memory import Memory
 from visit import *
 import sys
-from TypeChecker import TypeTable, TypeInfo, ScalarType, VectorType, MatrixType, RangeType, SuccessType as SuccessValue, UndefinedType as UndefinedValue
-
-sys.setrecursionlimit(10000)
+import operator
+from operator import mul
+from itertools import repeat
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from TypeChecker import matrixProductShape, isMatrixProduct, broadcastShape, TypeTable, TypeInfo, ScalarType, VectorType, MatrixType, RangeType, SuccessType as SuccessValue, UndefinedType as UndefinedValue
+
+# isinstance(x, arrayType) is always False when NumPy is not installed
+arrayType = numpy.ndarray if numpy is not None else ()
+numericTypes = ("integer", "float")
+
+def plainValue(content):
+    # contents leave the interpreter (printing, returning, nesting in lists) as plain Python values
+    if isinstance(content, arrayType):
+        return content.tolist()
+    return content
 
 class ScalarValue(ScalarType):
+    __slots__ = ("indexIterator",)
+
     def __init__(self, typeOfValue, value, name=None, indexIterator=None):
-        super().__init__(typeOfValue=typeOfValue, value=value, name=name)
+        # assigned here instead of through the TypeInfo constructors, a scalar is made for every operation
+        self.entityType = "scalar"
+        self.typeOfValue = typeOfValue
+        self.shapeOfValue = ()
+        self.content = value
+        self.name = name
         self.indexIterator = indexIterator
 
     def rows(self): return 1
@@ -20,17 +42,24 @@ class ScalarValue(ScalarType):
         self.content = value
 
 class VectorValue(VectorType):
+    __slots__ = ("indexIterator",)
+
     def __init__(self, typeOfValue, length, value, isProperVector=True, name=None, indexIterator=None):
         super().__init__(typeOfValue=typeOfValue, length=length, value=value, isProperVector=isProperVector, name=name)
         self.indexIterator = indexIterator
 
     def valueAt(self, _ignore, index):
+        if isinstance(self.content, arrayType):
+            return self.content[index].item()
         return self.content[index]
 
     def setValue(self, _ignore, column, value):
+        upcastIfNeeded(self, value)
         self.content[column] = value
 
 class MatrixValue(MatrixType):
+    __slots__ = ("indexIterator",)
+
     def __init__(self, typeOfValue, rows, columns, value, name=None, indexIterator=None):
         super().__init__(typeOfValue=typeOfValue, rows=rows, columns=columns, value=value, name=name)
         self.indexIterator = indexIterator
@@ -38,17 +67,249 @@ class MatrixValue(MatrixType):
     def valueAt(self, row, column):
         if column is None or column == ":":
             return self.content[row]
+        if isinstance(self.content, arrayType):
+            if row == ":":
+                return self.content[:, column].copy()
+            return self.content[row, column].item()
         if row == ":":
-            values = []
-            for vector in self.content:
-                values = [*values, vector[column]]
-            return values
+            return [vector[column] for vector in self.content]
         return self.content[row][column]
 
     def setValue(self, row, column, value):
+        upcastIfNeeded(self, value)
         self.content[row][column] = value
 
+def stridedValues(variable, offset, stride, length):
+    # elements offset, offset + stride, ... of the values of a vector or a matrix in row-major order; a whole row
+    # is shared, NumPy slices are views, only a column kept in lists is gathered into a new list
+    content = variable.content
+    if variable.isType(VectorValue):
+        if offset == 0 and stride == 1 and length == len(content):
+            return content
+        return content[offset:offset + stride * (length - 1) + 1:stride]
+    if isinstance(content, arrayType):
+        return content.reshape(-1)[offset:offset + stride * (length - 1) + 1:stride]
+    columns = variable.columns()
+    row, column = divmod(offset, columns)
+    if stride == 1 and column + length <= columns:
+        values = content[row]
+        return values if length == columns else values[column:column + length]
+    return [values[column] for values in content[row:row + length]]
+
+class VectorView(VectorValue):
+    # row or column of a matrix, or a whole vector, read through an index: element k is element
+    # offset + k * stride of the base in row-major order; the values are looked up in the base when they
+    # are first used and only copied when a variable keeps the view, see stored
+    __slots__ = ("base", "offset", "stride", "values")
+
+    def __init__(self, base, offset, stride, length, name=None, indexIterator=None):
+        self.entityType = "vector"
+        self.typeOfValue = base.typeOfValue
+        self.shapeOfValue = (length,)
+        self.name = name
+        self.isProperVector = True
+        self.indexIterator = indexIterator
+        self.base = base
+        self.offset = offset
+        self.stride = stride
+        self.values = None
+
+    @property
+    def content(self):
+        if self.values is None:
+            self.values = stridedValues(self.base, self.offset, self.stride, self.shapeOfValue[0])
+        return self.values
+
+    @content.setter
+    def content(self, value):
+        self.values = value
+
+class MatrixView(MatrixValue):
+    # rows x columns block of a matrix starting at (rowStart, colStart), looked up and copied like a VectorView
+    __slots__ = ("base", "rowStart", "colStart", "values")
+
+    def __init__(self, base, rowStart, colStart, rows, columns, name=None, indexIterator=None):
+        self.entityType = "matrix"
+        self.typeOfValue = base.typeOfValue
+        self.shapeOfValue = (rows, columns)
+        self.name = name
+        self.indexIterator = indexIterator
+        self.base = base
+        self.rowStart = rowStart
+        self.colStart = colStart
+        self.values = None
+
+    @property
+    def content(self):
+        if self.values is None:
+            content = self.base.content
+            rows, columns = self.shapeOfValue
+            if (self.rowStart, self.colStart, rows, columns) == (0, 0, *self.base.shapeOfValue):
+                self.values = content
+            elif isinstance(content, arrayType):
+                self.values = content[self.rowStart:self.rowStart + rows, self.colStart:self.colStart + columns]
+            else:
+                self.values = [values[self.colStart:self.colStart + columns] for values in content[self.rowStart:self.rowStart + rows]]
+        return self.values
+
+    @content.setter
+    def content(self, value):
+        self.values = value
+
+views = (VectorView, MatrixView)
+
+def copyOf(valueInfo):
+    # a vector or a matrix with values of its own
+    content = valueInfo.content
+    if valueInfo.isType(MatrixValue):
+        rows, columns = valueInfo.shapeOfValue
+        return MatrixValue(valueInfo.typeOfValue, rows=rows, columns=columns, value=content.copy() if isinstance(content, arrayType) else [list(values) for values in content])
+    return VectorValue(valueInfo.typeOfValue, length=valueInfo.shapeOfValue[0], value=content.copy() if isinstance(content, arrayType) else list(content), isProperVector=valueInfo.isProperVector)
+
+def stored(valueInfo, name):
+    # what a variable keeps of an assigned value: views are copied out of the matrix they look into and a value
+    # another variable holds is copied as well, compound assignments change the values of a variable in place
+    if valueInfo.__class__ is not ScalarValue and (valueInfo.__class__ in views or valueInfo.name is not None):
+        valueInfo = copyOf(valueInfo)
+    valueInfo.name = name
+    return valueInfo
+
+def unshared(valueInfo):
+    # contents a new value can keep: those of a vector or a matrix held by a variable, or looked at through a view, are copied
+    if valueInfo.__class__ is ScalarValue or (valueInfo.name is None and valueInfo.__class__ not in views):
+        return valueInfo.content
+    return copyOf(valueInfo).content
+
+# results of all scalar comparisons; values are never changed in place, so they can be shared
+TRUE = ScalarValue("boolean", True)
+FALSE = ScalarValue("boolean", False)
+
+# integer arrays hold int64 values; integer results that may get beyond them are calculated on Python ints in lists,
+# which keep the arbitrary precision of integers in list storage
+int64Limit = 2 ** 63 - 1
+
+# largest magnitude of the result of an integer operation, from the largest magnitudes of its operands
+integerBounds = {"+": operator.add, "-": operator.add, "*": operator.mul}
+
+def magnitude(values):
+    # largest absolute value in an integer array, without the overflow numpy.abs has for the smallest int64
+    if values.size == 0:
+        return 0
+    return max(int(values.max()), -int(values.min()))
+
+def exceedsInt64(values):
+    # whether a plain value, or plain values in lists, hold an integer int64 arrays cannot; NumPy would turn them into floats
+    if values.__class__ is list:
+        return any(map(exceedsInt64, values))
+    return isinstance(values, int) and abs(values) > int64Limit
+
+def upcastIfNeeded(variable, value):
+    # integer arrays can neither hold integers beyond int64 nor floats next to the integers, which lists keep as they are
+    # and print without a decimal point, so the variable moves to lists
+    if isinstance(variable.content, arrayType) and variable.content.dtype.kind in "iu":
+        if isinstance(value, float) or (isinstance(value, arrayType) and value.dtype.kind == "f") or exceedsInt64(value):
+            variable.content = variable.content.tolist()
+
+# compound assignments that change the values of a range in place: the operation on two elements of lists
+# and the one that updates an array
+compoundOperations = {
+    "+": (operator.add, operator.iadd),
+    "-": (operator.sub, operator.isub),
+    "*": (operator.mul, operator.imul),
+    "/": (operator.truediv, operator.itruediv),
+}
+
+def assignArrayRange(variable, indexRange, valueInfo, operation=None):
+    # vectorized counterpart of setting every index of the range one by one, returns False when shapes do not match exactly;
+    # with an operation, the values in the range are combined with the new ones in place
+    if operation is None and not isinstance(valueInfo.content, arrayType):
+        upcastIfNeeded(variable, valueInfo.content)
+        if not isinstance(variable.content, arrayType): # floats or values beyond int64 moved the variable to lists
+            return assignListRange(variable, indexRange, valueInfo)
+    rows = indexRange.rowEnd - indexRange.rowStart + 1
+    columns = indexRange.colEnd - indexRange.colStart + 1
+    if valueInfo.isType(ScalarValue):
+        value = valueInfo.content
+    elif valueInfo.isType(VectorValue):
+        value = numpy.asarray(valueInfo.content)
+        if value.ndim != 1:
+            return False
+        if indexRange.colStart == indexRange.colEnd: # values are read top-down
+            if value.shape[0] != rows:
+                return False
+            if variable.isType(MatrixValue):
+                value = value.reshape(rows, 1)
+        elif value.shape[0] != columns:
+            return False
+    elif valueInfo.isType(MatrixValue) and variable.isType(MatrixValue):
+        value = numpy.asarray(valueInfo.content)
+        if value.shape != (rows, columns):
+            return False
+    else:
+        return False
+
+    columnSlice = slice(indexRange.colStart, indexRange.colEnd + 1)
+    index = columnSlice if variable.isType(VectorValue) else (slice(indexRange.rowStart, indexRange.rowEnd + 1), columnSlice)
+    if operation is None:
+        upcastIfNeeded(variable, value)
+        if not isinstance(variable.content, arrayType):
+            return assignListRange(variable, indexRange, valueInfo)
+        variable.content[index] = value
+        return True
+    target = variable.content[index]
+    if variable.content.dtype.kind in "iu":
+        if not isinstance(valueInfo.content, arrayType) and exceedsInt64(valueInfo.content):
+            return False
+        value = numpy.asarray(value)
+        if operation == "/" or value.dtype.kind != "i" or integerBounds[operation](magnitude(target), magnitude(value)) > int64Limit:
+            return False # integer arrays cannot hold the result
+    compoundOperations[operation][1](target, value)
+    return True
+
+def assignListRange(variable, indexRange, valueInfo, operation=None):
+    # counterpart of assignArrayRange for values kept in lists, one slice assignment per row of the range
+    rows = indexRange.rowEnd - indexRange.rowStart + 1
+    columns = indexRange.colEnd - indexRange.colStart + 1
+    targets = [variable.content] if variable.isType(VectorValue) else variable.content[indexRange.rowStart:indexRange.rowEnd + 1]
+    if valueInfo.isType(ScalarValue):
+        rowValues = repeat([valueInfo.content] * columns)
+    elif valueInfo.isType(VectorValue):
+        values = plainValue(valueInfo.content)
+        if indexRange.colStart == indexRange.colEnd: # values are read top-down
+            if len(values) != rows:
+                return False
+            column = indexRange.colStart
+            if operation is None:
+                for target, value in zip(targets, values):
+                    target[column] = value
+            else:
+                combine = compoundOperations[operation][0]
+                for target, value in zip(targets, values):
+                    target[column] = combine(target[column], value)
+            return True
+        if len(values) != columns:
+            return False
+        rowValues = repeat(values)
+    elif valueInfo.isType(MatrixValue) and variable.isType(MatrixValue):
+        if valueInfo.shapeOfValue != (rows, columns):
+            return False
+        rowValues = plainValue(valueInfo.content)
+    else:
+        return False
+
+    columnSlice = slice(indexRange.colStart, indexRange.colEnd + 1)
+    if operation is None:
+        for target, values in zip(targets, rowValues):
+            target[columnSlice] = values
+    else:
+        combine = compoundOperations[operation][0]
+        for target, values in zip(targets, rowValues):
+            target[columnSlice] = map(combine, target[columnSlice], values)
+    return True
+
 class RangeValue(RangeType):
+    __slots__ = ("currentStep",)
+
     def __init__(self, start=None, end=None):
         super().__init__(start, end)
         self.currentStep = self.start
@@ -60,16 +321,22 @@ class RangeValue(RangeType):
         self.currentStep += 1
         return output
 
-class ContinueException(Exception):
-    pass
+# loop control signals returned by the tree walker's statement visits instead of raised
+BREAK = "break"
+CONTINUE = "continue"
 
-class BreakException(Exception):
-    pass
+class ReturnSignal(object):
+    def __init__(self, value):
+        self.value = value
 
 class RuntimeException(Exception):
+    log = None # when set to a list, messages are also collected in it
+
     def __init__(self, value):
         super().__init__()
         print(value)
+        if RuntimeException.log is not None:
+            RuntimeException.log.append(value)
 
 class ReturnException(Exception):
     def __init__(self, value):
@@ -93,11 +360,23 @@ def createIndexGenerator(varRowStart, varRowEnd, varColStart, varColEnd):
                 j += 1
             i += 1
 
+class IndexRange(object):
+    # rectangular range of indexes of a variable, iterates like createIndexGenerator
+    def __init__(self, rowStart, rowEnd, colStart, colEnd):
+        self.rowStart = rowStart
+        self.rowEnd = rowEnd
+        self.colStart = colStart
+        self.colEnd = colEnd
+
+    def __iter__(self):
+        return createIndexGenerator(self.rowStart, self.rowEnd, self.colStart, self.colEnd)
+
 class Interpreter(object):
-    def __init__(self):
+    def __init__(self, useArrays=None):
         self.typeTable = TypeTable()
         self.scopes = Memory()
-        self.calculator = Calculator()
+        self.calculator = Calculator(useArrays)
+        self.constants = {} # literal node -> its value, made once per run
 
     @on('node')
     def visit(self, node):
@@ -105,149 +384,117 @@ class Interpreter(object):
 
     @when(AST.ValueNode)
     def visit(self, node):
-        return ScalarValue(node.typeOfValue, value=node.value)
+        constant = self.constants.get(node)
+        if constant is None:
+            constant = self.constants[node] = ScalarValue(node.typeOfValue, value=node.value)
+        return constant
 
     @when(AST.StartNode)
     def visit(self, node):
         try:
-            self.visit(node.block)
-            if node.nextStart is not None:
-                self.visit(node.nextStart)
+            for block in node.blocks:
+                signal = self.visit(block)
+                if signal.__class__ is ReturnSignal:
+                    print(f"Program returned with {plainValue(signal.value)}")
+                    return None
             return SuccessValue()
-        except ReturnException as ret:
-            print(f"Program returned with {ret.value}")
         except RuntimeException:
             print("Terminating further execution")
             sys.exit(0)
 
     @when(AST.Statement)
     def visit(self, node):
-        self.visit(node.statement)
-        if node.nextStatements is not None:
-            self.visit(node.nextStatements)
-        return SuccessValue()
+        # statements return None, or the signal that has to be passed up to the enclosing loop or program
+        for statement in node.statements:
+            signal = self.visit(statement)
+            if signal is not None:
+                return signal
+        return None
 
     @when(AST.BlockStatement)
     def visit(self, node):
-        self.scopes.pushScope()
-        self.visit(node.nextStatements)
-        self.scopes.popScope()
-        return SuccessValue()
+        # variables bound in the block start undefined every time it is entered
+        for slot in node.localSlots:
+            self.scopes.put(slot, None)
+        return self.visit(node.nextStatements)
 
     @when(AST.AssignStatement)
     def visit(self, node):
         variableInfo = self.visit(node.variableId)
         valueInfo = self.visit(node.newValue)
-
-        if node.action == "=":
-            if variableInfo.isType(UndefinedValue) or not isinstance(node.variableId, AST.IndexedVariable):
-                valueInfo.name = node.variableId.name
-                self.scopes.put(node.variableId.name, valueInfo)
-            else:
-                variable = self.scopes.get(node.variableId.name)
-                for varRowIdx, varColIdx, valRowIdx, valColIdx in variableInfo.indexIterator:
-                    variable.setValue(varRowIdx, varColIdx, valueInfo.valueAt(valRowIdx, valColIdx))
-        else: # assign based on previous value
-            newValue = self.calculator.calculate(node.action, [variableInfo, valueInfo])
-
-            if newValue is None:
-                raise RuntimeException(f"Line {node.lineno}: incompatible types {variableInfo.typeOfValue} {node.action} {valueInfo.typeOfValue}")
-                
-            if variableInfo.indexIterator is not None:
-                variable = self.scopes.get(node.variableId.name)
-                if variable.typeOfValue != newValue.typeOfValue:
-                    raise RuntimeException(f"Line {node.lineno}: new value of type {valueInfo.typeOfValue} is incorrect for type {variable.typeOfValue}")
-                for varRowIdx, varColIdx, valRowIdx, valColIdx in variableInfo.indexIterator:
-                    variable.setValue(varRowIdx, varColIdx, newValue.valueAt(valRowIdx, valColIdx))
-            else:
-                newValue.name = variableInfo.name
-                self.scopes.put(variableInfo.name, newValue)
-        return SuccessValue()
+        self.assign(node.variableId.slot, node.variableId.name, isinstance(node.variableId, AST.IndexedVariable), node.action, variableInfo, valueInfo, node.lineno)
 
     @when(AST.ReturnValue)
     def visit(self, node):
         output = self.visit(node.value)
-        raise ReturnException(output.content)
+        return ReturnSignal(output.content)
 
     @when(AST.PrintValue)
     def visit(self, node):
         output = self.visit(node.value)
-        if output.isType(MatrixValue):
-            print("[")
-            for x in output.content:
-                print(f"  {x},")
-            print("]")
-        else:
-            print(output.content)
-        return SuccessValue()
+        self.printValue(output)
 
     @when(AST.LoopControlNode)
     def visit(self, node):
-        if node.action == "continue":
-            raise ContinueException
-        raise BreakException
+        return CONTINUE if node.action == "continue" else BREAK
 
     @when(AST.Vector)
     def visit(self, node):
-        valueInfo = self.visit(node.value)
         if node.isMatrixHead:
-            if valueInfo.isType(MatrixValue):
-                return valueInfo
-            else:
-                return MatrixValue(valueInfo.typeOfValue, rows=1, columns=valueInfo.columns(), value=[valueInfo.content,])
-
-        if node.nextItem is None:
-            if valueInfo.isType(VectorValue):
-                return VectorValue(valueInfo.typeOfValue, length=valueInfo.columns(), value=valueInfo.content)
-            else:
-                return VectorValue(valueInfo.typeOfValue, length=1, value=[valueInfo.content])
-
-        nextValueInfo = self.visit(node.nextItem)
-        nextValue = [valueInfo.content, *nextValueInfo.content] if not nextValueInfo.isType(VectorValue) else [valueInfo.content, nextValueInfo.content]
-        return MatrixValue(valueInfo.typeOfValue, rows=nextValueInfo.rows() + 1, columns=nextValueInfo.columns(), value=nextValue)
+            return self.buildVector(self.visit(node.value), True)
+        rows = []
+        while node is not None:
+            rows.append(self.visit(node.value))
+            node = node.nextItem
+        return self.vector(rows)
 
     @when(AST.ValueList)
     def visit(self, node):
-        valueInfo = self.visit(node.value)
+        items = []
+        while node is not None:
+            items.append(self.visit(node.value))
+            node = node.nextItem
+        return self.valueList(items)
 
-        if node.nextItem is None:
-            return valueInfo
-        
-        nextValueInfo = self.visit(node.nextItem)
-        nextValue = [valueInfo.content, *nextValueInfo.content] if not nextValueInfo.isType(ScalarValue) else [valueInfo.content, nextValueInfo.content]
-        return VectorValue(valueInfo.typeOfValue, length=nextValueInfo.columns() + 1, value=nextValue, isProperVector=False)
+    @when(AST.PackedValues)
+    def visit(self, node):
+        return self.packedValues(node.typeOfValue, node.values)
 
     @when(AST.IndexList)
     def visit(self, node):
         valueInfo = self.visit(node.index)
         if node.nextItem is None:
-            if not valueInfo.isType(ScalarValue) or valueInfo.typeOfValue != "integer":
-                raise RuntimeException(f"Line {node.lineno}: first index is not integer or too many indexes")
-            return valueInfo
-
-        nextValueInfo = self.visit(node.nextItem)
-        if not nextValueInfo.isType(ScalarValue) or nextValueInfo.typeOfValue != "integer":
-            raise RuntimeException(f"Line {node.lineno}: second index is not integer or too many indexes")
-
-        return VectorValue("integer", length=2, value=[valueInfo.content, nextValueInfo.content])
+            return self.buildIndexList(valueInfo, None, node.lineno)
+        return self.buildIndexList(valueInfo, self.visit(node.nextItem), node.lineno)
 
     @when(AST.ArithmeticExpression)
     def visit(self, node):
+        if node.leftExpr.__class__ is AST.ArithmeticExpression:
+            return self.arithmeticChain(node)
         leftObject = self.visit(node.leftExpr)
         rightObject = self.visit(node.rightExpr)
-
-        if not leftObject.correctShapes(rightObject):
-            raise RuntimeException(f"Line {node.lineno}: incorrect shapes {leftObject.shapeOfValue} and {rightObject.shapeOfValue}")
-
-        return self.calculator.calculate(
-            node.action,
-            [leftObject, rightObject]
-        )
+        if leftObject.__class__ is ScalarValue and rightObject.__class__ is ScalarValue:
+            return self.scalarOperation(node.action, leftObject, rightObject)
+        return self.arithmetic(node.action, leftObject, rightObject, node.lineno)
+
+    def arithmeticChain(self, node):
+        # a + b - c ... in a loop, recursing once per operator would overflow the stack on long chains
+        operand, chain = AST.leftChain(node)
+        leftObject = self.visit(operand)
+        for expression in chain:
+            rightObject = self.visit(expression.rightExpr)
+            if leftObject.__class__ is ScalarValue and rightObject.__class__ is ScalarValue:
+                leftObject = self.scalarOperation(expression.action, leftObject, rightObject)
+            else:
+                leftObject = self.arithmetic(expression.action, leftObject, rightObject, expression.lineno)
+        return leftObject
 
     @when(AST.ComparisonExpression)
     def visit(self, node):
         leftObject = self.visit(node.leftExpr)
         rightObject = self.visit(node.rightExpr)
+        if leftObject.__class__ is ScalarValue:
+            return TRUE if self.calculator.operationTable[node.action](leftObject.content, rightObject.content) else FALSE
         return self.calculator.calculate(
             node.action,
             [leftObject, rightObject]
@@ -265,40 +512,27 @@ class Interpreter(object):
             return self.visit(node.action)
         elif node.elseAction is not None:
             return self.visit(node.elseAction)
-        return SuccessValue()
 
     @when(AST.WhileStatement)
     def visit(self, node):
         conditionOutput = self.visit(node.condition)
-        try:
-            while conditionOutput.content:
-                try:
-                    self.visit(node.action)
-                    conditionOutput = self.visit(node.condition)
-                except ContinueException:
-                    pass
-        except BreakException:
-            pass
-
-        return SuccessValue()
+        while conditionOutput.content:
+            signal = self.visit(node.action)
+            if signal is not None and signal is not CONTINUE:
+                return None if signal is BREAK else signal
+            conditionOutput = self.visit(node.condition)
 
     @when(AST.ForStatement)
     def visit(self, node):
         rangeOutput = self.visit(node.valueRange)
         loopVariableValue = rangeOutput.getNext()
 
-        try:
-            while loopVariableValue is not None:
-                try:
-                    self.scopes.put(node.loopVariable, ScalarValue("integer", value=loopVariableValue))
-                    self.visit(node.action)
-                    loopVariableValue = rangeOutput.getNext()
-                except ContinueException:
-                    pass
-        except BreakException:
-            pass
-
-        return SuccessValue()
+        while loopVariableValue is not None:
+            self.scopes.put(node.loopSlot, ScalarValue("integer", value=loopVariableValue))
+            signal = self.visit(node.action)
+            if signal is not None and signal is not CONTINUE:
+                return None if signal is BREAK else signal
+            loopVariableValue = rangeOutput.getNext()
 
     @when(AST.TransposeExpression)
     def visit(self, node):
@@ -309,60 +543,264 @@ class Interpreter(object):
     def visit(self, node):
         valueStart = self.visit(node.rangeStart)
         valueEnd = self.visit(node.rangeEnd)
-        if valueStart.typeOfValue != "integer" or valueEnd.typeOfValue != "integer":
-            raise RuntimeException(f"Line {node.lineno}: invalid range types {valueStart.typeOfValue} : {valueEnd.typeOfValue}")
-        return RangeValue(start=valueStart.content, end=valueEnd.content)
+        return self.makeRange(valueStart, valueEnd, node.lineno)
 
     @when(AST.Variable)
     def visit(self, node):
-        variableInfo = self.scopes.get(node.name)
-        if variableInfo is None:
-            return UndefinedValue()
-        return variableInfo
+        return self.loadVariable(node.slot)
 
     @when(AST.IndexedVariable)
     def visit(self, node):
         indexes = self.visit(node.indexes)
-        variable = self.scopes.get(node.name)
-        if indexes.content == ":" or indexes.content == (":", ":"):
-            variable.indexIterator = createIndexGenerator(0, variable.rows() - 1, 0, variable.columns() - 1)
-            return variable
+        return self.indexVariable(node.slot, node.name, indexes, node.lineno)
 
-        if indexes.isType(ScalarValue):
-            if indexes.content >= variable.columns():
-                raise RuntimeException(f"Line {node.lineno}: index {indexes.content} out of range for {variable.columns()}")
-            if variable.isType(VectorValue):
-                indexIterator = createIndexGenerator(0, 0, indexes.content, indexes.content)
-                return ScalarValue(variable.typeOfValue, value=variable.valueAt(None, indexes.content), name=node.name, indexIterator=indexIterator)
-            if variable.isType(MatrixValue):
-                indexIterator = createIndexGenerator(indexes.content, indexes.content, 0, variable.columns() - 1)
-                return VectorValue(variable.typeOfValue, length=variable.columns(), value=variable.valueAt(indexes.content, None), name=node.name, indexIterator=indexIterator)
+    @when(AST.MatrixInitiator)
+    def visit(self, node):
+        matrixSize = self.visit(node.size)
+        return self.initMatrix(node.matrixType, matrixSize, node.lineno)
 
-        if indexes.content[0] != ":" and indexes.content[0] > variable.rows():
-            raise RuntimeException(f"Line {node.lineno}: row index out of bounds {indexes.content[0]} for matrix of shape {variable.shapeOfValue}")
-        if indexes.content[1] != ":" and indexes.content[1] > variable.columns():
-            raise RuntimeException(f"Line {node.lineno}: column index out of bounds {indexes.content[1]} for matrix of shape {variable.shapeOfValue}")
+    # runtime semantics shared by every backend, operating on already evaluated values
 
-        if indexes.content[0] == ":":
-            indexIterator = createIndexGenerator(0, variable.rows() - 1, indexes.content[1], indexes.content[1])
-            return VectorValue(variable.typeOfValue, length=variable.rows(), value=variable.valueAt(":", indexes.content[1]), name=node.name, indexIterator=indexIterator)
-        if indexes.content[1] == ":":
-            indexIterator = createIndexGenerator(indexes.content[0], indexes.content[0], 0, variable.columns() - 1)
-            return VectorValue(variable.typeOfValue, length=variable.columns(), value=variable.valueAt(indexes.content[0], ":"), name=node.name, indexIterator=indexIterator)
+    def run(self, program, *args):
+        try:
+            program(*args)
+            return SuccessValue()
+        except ReturnException as ret:
+            print(f"Program returned with {plainValue(ret.value)}")
+        except RuntimeException:
+            print("Terminating further execution")
+            sys.exit(0)
 
-        indexIterator = createIndexGenerator(indexes.content[0], indexes.content[0], indexes.content[1], indexes.content[1])
-        return ScalarValue(variable.typeOfValue, value=variable.valueAt(*indexes.content), name=node.name, indexIterator=indexIterator)
+    def assign(self, slot, name, isIndexed, action, variableInfo, valueInfo, lineno):
+        if action == "=":
+            if variableInfo.isType(UndefinedValue) or not isIndexed:
+                self.scopes.put(slot, stored(valueInfo, name))
+            else:
+                self.assignIndexed(self.scopes.get(slot), action, variableInfo, valueInfo, lineno)
+        else: # assign based on previous value
+            if variableInfo.isType(UndefinedValue):
+                # e.g. assigned only in an earlier pass of a loop, whose block has been entered again since
+                raise RuntimeException(f"Line {lineno}: variable {name} is undefined")
+            if variableInfo.indexIterator is not None:
+                self.assignIndexed(self.scopes.get(slot), action, variableInfo, valueInfo, lineno)
+            else:
+                newValue = self.updatedValue(action, variableInfo, valueInfo, lineno)
+                newValue.name = name
+                self.scopes.put(slot, newValue)
+
+    def assignIndexed(self, variable, action, variableInfo, valueInfo, lineno):
+        if action != "=":
+            if variableInfo.__class__ is not ScalarValue and self.updateRange(variable, variableInfo.indexIterator, action, variableInfo, valueInfo):
+                return
+            newValue = self.compoundValue(action, variableInfo, valueInfo, lineno)
+            if variable.typeOfValue != newValue.typeOfValue:
+                raise RuntimeException(f"Line {lineno}: new value of type {valueInfo.typeOfValue} is incorrect for type {variable.typeOfValue}")
+            valueInfo = newValue
+        elif valueInfo.__class__ in views and valueInfo.base is variable:
+            # a view into the written matrix would read elements that the loop below has already overwritten
+            valueInfo = copyOf(valueInfo)
+        indexRange = variableInfo.indexIterator
+        if valueInfo.__class__ is ScalarValue and indexRange.rowStart == indexRange.rowEnd and indexRange.colStart == indexRange.colEnd:
+            variable.setValue(indexRange.rowStart, indexRange.colStart, valueInfo.content)
+            return
+        if isinstance(variable.content, arrayType):
+            if assignArrayRange(variable, variableInfo.indexIterator, valueInfo):
+                return
+        elif assignListRange(variable, variableInfo.indexIterator, valueInfo):
+            return
+        # shapes that do not match exactly are written element by element
+        for varRowIdx, varColIdx, valRowIdx, valColIdx in variableInfo.indexIterator:
+            variable.setValue(varRowIdx, varColIdx, valueInfo.valueAt(valRowIdx, valColIdx))
+
+    def updateRange(self, variable, indexRange, action, variableInfo, valueInfo):
+        # compound assignment to the values of a vector or a matrix in the range, done in place when the new value
+        # broadcasts to the shape of the target and keeps the type of the variable; returns False when a new value
+        # has to be calculated
+        if valueInfo.__class__ is not ScalarValue and broadcastShape(variableInfo.shapeOfValue, valueInfo.shapeOfValue) != variableInfo.shapeOfValue:
+            return False
+        operation = action[0]
+        if self.typeTable.getType(variable.typeOfValue, "." + operation, valueInfo.typeOfValue) != variable.typeOfValue:
+            return False
+        if isinstance(variable.content, arrayType):
+            return assignArrayRange(variable, indexRange, valueInfo, operation)
+        return assignListRange(variable, indexRange, valueInfo, operation)
+
+    def updatedValue(self, action, variableInfo, valueInfo, lineno):
+        # the value of a whole variable after a compound assignment: the variable itself when updateRange changed it
+        if variableInfo.__class__ is not ScalarValue:
+            indexRange = IndexRange(0, variableInfo.rows() - 1, 0, variableInfo.columns() - 1)
+            if self.updateRange(variableInfo, indexRange, action, variableInfo, valueInfo):
+                return variableInfo
+        return self.compoundValue(action, variableInfo, valueInfo, lineno)
+
+    def scalarOperation(self, action, leftObject, rightObject):
+        # what Calculator.calculate does for a scalar left operand, without building its argument list
+        newType = self.typeTable.getType(leftObject.typeOfValue, action, rightObject.typeOfValue)
+        return ScalarValue(newType, self.calculator.operationTable[action](leftObject.content, rightObject.content))
+
+    def compoundValue(self, action, variableInfo, valueInfo, lineno):
+        if variableInfo.__class__ is ScalarValue:
+            return self.scalarOperation(action[0], variableInfo, valueInfo)
+        newValue = self.calculator.calculate(action, [variableInfo, valueInfo])
+        if newValue is None:
+            raise RuntimeException(f"Line {lineno}: incompatible types {variableInfo.typeOfValue} {action} {valueInfo.typeOfValue}")
+        return newValue
+
+    def printValue(self, output):
+        if output.isType(MatrixValue):
+            print("[")
+            for x in plainValue(output.content):
+                print(f"  {x},")
+            print("]")
+        else:
+            print(plainValue(output.content))
 
-    @when(AST.MatrixInitiator)
-    def visit(self, node):
-        matrixSize = self.visit(node.size)
+    def buildVector(self, valueInfo, isMatrixHead=False):
+        store = self.calculator.store
+        if isMatrixHead:
+            if valueInfo.isType(MatrixValue):
+                return MatrixValue(valueInfo.typeOfValue, rows=valueInfo.rows(), columns=valueInfo.columns(), value=store(valueInfo.typeOfValue, unshared(valueInfo), 2))
+            else:
+                return MatrixValue(valueInfo.typeOfValue, rows=1, columns=valueInfo.columns(), value=store(valueInfo.typeOfValue, [plainValue(unshared(valueInfo)),], 2))
+
+        if valueInfo.isType(VectorValue):
+            return VectorValue(valueInfo.typeOfValue, length=valueInfo.columns(), value=store(valueInfo.typeOfValue, unshared(valueInfo), 1))
+        else:
+            return VectorValue(valueInfo.typeOfValue, length=1, value=store(valueInfo.typeOfValue, [valueInfo.content], 1))
+
+    def vector(self, rows):
+        # one row is a vector, more rows are a matrix as wide as the last row; a row that is not a vector is one column
+        last = self.buildVector(rows[-1])
+        if len(rows) == 1:
+            return last
+        values = [plainValue(unshared(valueInfo)) for valueInfo in rows[:-1]]
+        values.append(plainValue(last.content))
+        return MatrixValue(rows[0].typeOfValue, rows=len(rows), columns=last.columns(), value=values)
+
+    def valueList(self, items):
+        # the items are collected in one pass, a last item that is not a scalar has its values spliced in
+        last = items[-1]
+        if len(items) == 1:
+            return last
+        values = [plainValue(unshared(valueInfo)) for valueInfo in items[:-1]]
+        if last.isType(ScalarValue):
+            values.append(last.content)
+        else:
+            values.extend(plainValue(last.content))
+        return VectorValue(items[0].typeOfValue, length=last.columns() + len(items) - 1, value=values, isProperVector=False)
+
+    def packedValues(self, typeOfValue, values):
+        # what valueList makes of the same values as separate items
+        return VectorValue(typeOfValue, length=len(values), value=values.tolist(), isProperVector=False)
+
+    def buildIndexList(self, valueInfo, nextValueInfo, lineno):
+        if valueInfo.__class__ is RangeValue: # kept as an index like ":" is
+            valueInfo = ScalarValue("integer", slice(valueInfo.start, valueInfo.end))
+        if nextValueInfo is None:
+            if not valueInfo.isType(ScalarValue) or valueInfo.typeOfValue != "integer":
+                raise RuntimeException(f"Line {lineno}: first index is not integer or too many indexes")
+            return valueInfo
+
+        if not nextValueInfo.isType(ScalarValue) or nextValueInfo.typeOfValue != "integer":
+            raise RuntimeException(f"Line {lineno}: second index is not integer or too many indexes")
+
+        return VectorValue("integer", length=2, value=[valueInfo.content, nextValueInfo.content])
+
+    def arithmetic(self, action, leftObject, rightObject, lineno):
+        if isMatrixProduct(action, leftObject, rightObject):
+            if matrixProductShape(leftObject.shapeOfValue, rightObject.shapeOfValue) is None:
+                raise RuntimeException(f"Line {lineno}: incorrect shapes {leftObject.shapeOfValue} and {rightObject.shapeOfValue}")
+        elif broadcastShape(leftObject.shapeOfValue, rightObject.shapeOfValue) is None:
+            raise RuntimeException(f"Line {lineno}: incorrect shapes {leftObject.shapeOfValue} and {rightObject.shapeOfValue}")
+
+        return self.calculator.calculate(
+            action,
+            [leftObject, rightObject]
+        )
+
+    def makeRange(self, valueStart, valueEnd, lineno):
+        if valueStart.typeOfValue != "integer" or valueEnd.typeOfValue != "integer":
+            raise RuntimeException(f"Line {lineno}: invalid range types {valueStart.typeOfValue} : {valueEnd.typeOfValue}")
+        return RangeValue(start=valueStart.content, end=valueEnd.content)
+
+    def loadVariable(self, slot):
+        variableInfo = self.scopes.get(slot)
+        if variableInfo is None:
+            return UndefinedValue()
+        return variableInfo
+
+    def indexVariable(self, slot, name, indexes, lineno):
+        return self.indexValue(self.scopes.get(slot), name, indexes, lineno)
+
+    def indexValue(self, variable, name, indexes, lineno):
+        # rows, columns, blocks and whole variables are views that do not copy anything until they are stored
+        if indexes.content == ":":
+            indexIterator = IndexRange(0, variable.rows() - 1, 0, variable.columns() - 1)
+            if variable.isType(MatrixValue):
+                return MatrixView(variable, 0, 0, variable.rows(), variable.columns(), name=name, indexIterator=indexIterator)
+            return VectorView(variable, 0, 1, variable.columns(), name=name, indexIterator=indexIterator)
+
+        if indexes.isType(ScalarValue):
+            if indexes.content.__class__ is slice:
+                if variable.isType(VectorValue):
+                    return self.indexRanges(variable, name, 0, indexes.content, lineno)
+                return self.indexRanges(variable, name, indexes.content, ":", lineno)
+            if indexes.content >= variable.columns():
+                raise RuntimeException(f"Line {lineno}: index {indexes.content} out of range for {variable.columns()}")
+            if variable.isType(VectorValue):
+                indexIterator = IndexRange(0, 0, indexes.content, indexes.content)
+                return ScalarValue(variable.typeOfValue, value=variable.valueAt(None, indexes.content), name=name, indexIterator=indexIterator)
+            if variable.isType(MatrixValue):
+                indexIterator = IndexRange(indexes.content, indexes.content, 0, variable.columns() - 1)
+                return VectorView(variable, indexes.content * variable.columns(), 1, variable.columns(), name=name, indexIterator=indexIterator)
+
+        rowIndex, columnIndex = indexes.content
+        if rowIndex.__class__ is slice or columnIndex.__class__ is slice or rowIndex == ":" or columnIndex == ":":
+            return self.indexRanges(variable, name, rowIndex, columnIndex, lineno)
+
+        if rowIndex > variable.rows():
+            raise RuntimeException(f"Line {lineno}: row index out of bounds {rowIndex} for matrix of shape {variable.shapeOfValue}")
+        if columnIndex > variable.columns():
+            raise RuntimeException(f"Line {lineno}: column index out of bounds {columnIndex} for matrix of shape {variable.shapeOfValue}")
+
+        indexIterator = IndexRange(rowIndex, rowIndex, columnIndex, columnIndex)
+        return ScalarValue(variable.typeOfValue, value=variable.valueAt(rowIndex, columnIndex), name=name, indexIterator=indexIterator)
+
+    def indexRanges(self, variable, name, rowIndex, columnIndex, lineno):
+        # a block of a matrix, part of one of its rows or columns, or part of a vector; an index that is neither
+        # ":" nor a range selects a single row or column
+        rowStart, rowEnd = self.indexBounds(variable, rowIndex, variable.rows(), "row", lineno)
+        colStart, colEnd = self.indexBounds(variable, columnIndex, variable.columns(), "column", lineno)
+        indexIterator = IndexRange(rowStart, rowEnd - 1, colStart, colEnd - 1)
+        offset = rowStart * variable.columns() + colStart
+        if rowIndex.__class__ is not slice and rowIndex != ":":
+            return VectorView(variable, offset, 1, colEnd - colStart, name=name, indexIterator=indexIterator)
+        if columnIndex.__class__ is not slice and columnIndex != ":":
+            return VectorView(variable, offset, variable.columns(), rowEnd - rowStart, name=name, indexIterator=indexIterator)
+        return MatrixView(variable, rowStart, colStart, rowEnd - rowStart, colEnd - colStart, name=name, indexIterator=indexIterator)
+
+    def indexBounds(self, variable, index, size, dimension, lineno):
+        # the first position an index selects along a dimension and the one after the last
+        if index == ":":
+            return 0, size
+        if index.__class__ is slice:
+            if not 0 <= index.start < index.stop <= size:
+                raise RuntimeException(f"Line {lineno}: {dimension} range {index.start}:{index.stop} out of bounds for {variable.entityType} of shape {variable.shapeOfValue}")
+            return index.start, index.stop
+        if not 0 <= index < size:
+            raise RuntimeException(f"Line {lineno}: {dimension} index out of bounds {index} for {variable.entityType} of shape {variable.shapeOfValue}")
+        return index, index + 1
+
+    def initMatrix(self, matrixType, matrixSize, lineno):
         if matrixSize.isType(MatrixValue) or matrixSize.typeOfValue != "integer":
-            raise RuntimeException(f"Line {node.lineno}: matrix initiator dimensions are non-scalar or non-vector but {matrixSize.entityType}, or non-int but {matrixSize.typeOfValue}")
+            raise RuntimeException(f"Line {lineno}: matrix initiator dimensions are non-scalar or non-vector but {matrixSize.entityType}, or non-int but {matrixSize.typeOfValue}")
         if matrixSize.isType(ScalarValue):
-            return MatrixValue("integer", rows=matrixSize.content, columns=matrixSize.content, value=self.calculator.getMatrixValues(node.matrixType, matrixSize.content, matrixSize.content))
-        return MatrixValue("integer", rows=matrixSize.content[0], columns=matrixSize.content[1], value=self.calculator.getMatrixValues(node.matrixType, matrixSize.content[0], matrixSize.content[1]))
+            return MatrixValue("integer", rows=matrixSize.content, columns=matrixSize.content, value=self.calculator.getMatrixValues(matrixType, matrixSize.content, matrixSize.content))
+        return MatrixValue("integer", rows=matrixSize.content[0], columns=matrixSize.content[1], value=self.calculator.getMatrixValues(matrixType, matrixSize.content[0], matrixSize.content[1]))
 
 def transpose(matrix):
+    if isinstance(matrix, arrayType):
+        return numpy.ascontiguousarray(matrix.T)
     rows, cols = len(matrix), len(matrix[0])
     output = [[0] * rows for _ in range(cols)]
 
@@ -374,6 +812,10 @@ def transpose(matrix):
 
 def applyElementwiseOneArg(fun):
     def f(x):
+        if isinstance(x, arrayType): # the scalar function is applied to the whole array at once
+            if x.dtype.kind not in "iu" or magnitude(x) <= int64Limit:
+                return fun(x)
+            x = x.tolist()
         output = [None] * len(x)
         if not isinstance(x[0], list): # vector
             for idx in range(len(x)):
@@ -384,20 +826,61 @@ def applyElementwiseOneArg(fun):
         return output
     return f
 
-def applyElementwiseTwoArg(fun):
+def applyElementwiseTwoArg(fun, bound=None):
+    # a scalar is combined with every element and a vector with every row of a matrix as they are, without
+    # building the broadcast operand; NumPy broadcasts the same way. bound is the one of integerBounds for fun
     def f(x, y):
-        output = [None] * len(x)
-        if not isinstance(x[0], list): # vector
-            for idx in range(len(x)):
-                output[idx] = fun(x[idx], y[idx])
-        else: # matrix
-            for idx in range(len(x)):
-                output[idx] = f(x[idx], y[idx])
-        return output
+        if isinstance(x, arrayType) or isinstance(y, arrayType):
+            # lists next to an array hold what arrays could not, e.g. integers beyond int64, and are not converted
+            if x.__class__ is not list and y.__class__ is not list and not exceedsInt64(x) and not exceedsInt64(y):
+                x, y = numpy.asarray(x), numpy.asarray(y)
+                if bound is None or x.dtype.kind not in "iu" or y.dtype.kind not in "iu" or bound(magnitude(x), magnitude(y)) <= int64Limit:
+                    return fun(x, y)
+            x, y = plainValue(x), plainValue(y)
+        if not isinstance(x, list):
+            if not isinstance(y, list): # scalars
+                return fun(x, y)
+            if isinstance(y[0], list):
+                return [f(x, row) for row in y]
+            return [fun(x, value) for value in y]
+        if not isinstance(y, list):
+            if isinstance(x[0], list):
+                return [f(row, y) for row in x]
+            return [fun(value, y) for value in x]
+        if isinstance(x[0], list): # matrix
+            if isinstance(y[0], list):
+                return [f(row, other) for row, other in zip(x, y)]
+            return [f(row, y) for row in x]
+        if isinstance(y[0], list):
+            return [f(x, row) for row in y]
+        return list(map(fun, x, y)) # vectors
     return f
 
+def matrixProduct(left, right):
+    if isinstance(left, arrayType) or isinstance(right, arrayType):
+        if left.__class__ is list or right.__class__ is list: # see applyElementwiseTwoArg
+            return matrixProduct(plainValue(left), plainValue(right))
+        if left.dtype.kind in "iu" and right.dtype.kind in "iu" and left.size and right.size:
+            # integer products go through BLAS as floats when every partial sum is exactly representable
+            bound = magnitude(left) * magnitude(right) * left.shape[-1]
+            if bound < 2 ** 53:
+                return numpy.rint(numpy.matmul(left.astype(float), right.astype(float))).astype(numpy.result_type(left, right))
+            if bound > int64Limit: # the sums could overflow int64, they are made of Python ints
+                return matrixProduct(left.tolist(), right.tolist())
+        return numpy.matmul(left, right)
+
+    # the right operand is transposed once so that every result element is a dot product of two rows
+    if isinstance(left[0], list):
+        if isinstance(right[0], list):
+            columns = list(zip(*right))
+            return [[sum(map(mul, row, column)) for column in columns] for row in left]
+        return [sum(map(mul, row, right)) for row in left]
+    return [sum(map(mul, left, column)) for column in zip(*right)]
+
 class Calculator():
-    def __init__(self):
+    def __init__(self, useArrays=None):
+        # vectors and matrices of numbers are kept in NumPy arrays unless told otherwise or NumPy is missing
+        self.useArrays = numpy is not None if useArrays is None else useArrays and numpy is not None
         self.typeTable = TypeTable()
         self.operationTable = {
             "+": lambda x, y: x + y,
@@ -405,10 +888,10 @@ class Calculator():
             "neg": lambda x: -x,
             "*": lambda x, y: x * y,
             "/": lambda x, y: x / y,
-            ".+": applyElementwiseTwoArg(lambda x, y: x + y),
-            ".-": applyElementwiseTwoArg(lambda x, y: x - y),
+            ".+": applyElementwiseTwoArg(lambda x, y: x + y, integerBounds["+"]),
+            ".-": applyElementwiseTwoArg(lambda x, y: x - y, integerBounds["-"]),
             ".neg": applyElementwiseOneArg(lambda x: -x),
-            ".*": applyElementwiseTwoArg(lambda x, y: x * y),
+            ".*": applyElementwiseTwoArg(lambda x, y: x * y, integerBounds["*"]),
             "./": applyElementwiseTwoArg(lambda x, y: x / y),
             "'": transpose,
             "<": lambda x, y: x < y,
@@ -448,15 +931,41 @@ class Calculator():
 
     def _calculateDouble(self, leftObject, operation, rightObject):
         newType = self.typeTable.getType(leftObject.typeOfValue, operation, rightObject.typeOfValue)
+        if isMatrixProduct(operation, leftObject, rightObject):
+            return self._multiplyMatrices(leftObject, newType, rightObject)
         newValue = self.operationTable[operation](leftObject.content, rightObject.content)
 
-        if leftObject.isType(ScalarValue):
+        # the result has the shape of the operand the other one is broadcast to
+        shaped = rightObject if len(rightObject.shapeOfValue) > len(leftObject.shapeOfValue) else leftObject
+        if shaped.isType(ScalarValue):
             return ScalarValue(newType, newValue)
-        if leftObject.isType(VectorValue):
-            return VectorValue(newType, leftObject.columns(), newValue)
-        return MatrixValue(newType, leftObject.rows(), leftObject.columns(), newValue)
+        if shaped.isType(VectorValue):
+            return VectorValue(newType, shaped.columns(), newValue)
+        return MatrixValue(newType, shaped.rows(), shaped.columns(), newValue)
+
+    def _multiplyMatrices(self, leftObject, newType, rightObject):
+        shape = matrixProductShape(leftObject.shapeOfValue, rightObject.shapeOfValue)
+        newValue = matrixProduct(leftObject.content, rightObject.content)
+        if len(shape) == 2:
+            return MatrixValue(newType, shape[0], shape[1], newValue)
+        return VectorValue(newType, shape[0], newValue)
+
+    def store(self, typeOfValue, values, dimensions):
+        if not self.useArrays or typeOfValue not in numericTypes or isinstance(values, arrayType):
+            return values
+        try:
+            array = numpy.array(values)
+        except ValueError: # rows of different lengths
+            return values
+        if array.ndim != dimensions or array.dtype.kind not in "iuf": # e.g. vectors of vectors stay lists
+            return values
+        return array
 
     def getMatrixValues(self, valueType, rows, columns):
+        if self.useArrays:
+            if valueType == "eye":
+                return numpy.eye(rows, columns, dtype=int)
+            return numpy.full((rows, columns), 1 if valueType == "ones" else 0)
         value = 1 if valueType == "ones" else 0
         values = [[value] * columns for _ in range(rows)]
         if valueType == "eye":
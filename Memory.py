@@ -1,22 +1,15 @@
 class Memory:
-    def __init__(self):
-        self.scopes = [{}]
+    # flat frame of variable slots, slot numbers are assigned by the Resolver
+    def __init__(self, size=0):
+        self.slots = [None] * size
 
-    def get(self, name):
-        for scope_idx in range(len(self.scopes) - 1, -1, -1):
-            if name in self.scopes[scope_idx]:
-                return self.scopes[scope_idx][name]
-        return None
+    def reserve(self, size):
+        # extends in place, so backends may keep a reference to the slot list
+        if size > len(self.slots):
+            self.slots.extend([None] * (size - len(self.slots)))
 
-    def put(self, name, value):
-        for scope_idx in range(len(self.scopes) - 1, -1, -1):
-            if name in self.scopes[scope_idx]:
-                self.scopes[scope_idx][name] = value
-                return
-        self.scopes[-1][name] = value
+    def get(self, slot):
+        return self.slots[slot]
 
-    def pushScope(self):
-        self.scopes.append({})
-
-    def popScope(self):
-        self.scopes.pop()
+    def put(self, slot, value):
+        self.slots[slot] = value
@@ -0,0 +1,211 @@
+import math
+import AST
+from TypeChecker import NodeVisitor, TypeAnnotator, ScalarType
+from Interpreter import Calculator
+
+def countNodes(node):
+    # Statement nodes only group statements and visitSequence flattens them into the enclosing list,
+    # so they are not counted and the difference is what was folded, simplified or dropped
+    count = 0
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, list):
+            pending.extend(node)
+        elif isinstance(node, AST.Node):
+            count += node.__class__ is not AST.Statement
+            pending.extend(getattr(node, name) for cls in node.__class__.__mro__ for name in getattr(cls, "__slots__", ()))
+    return count
+
+class Optimizer(NodeVisitor):
+    # folds literal-only expressions, drops neutral operands and dead if branches;
+    # every visit returns the node that replaces the visited one, or None when it is removed
+    def __init__(self):
+        calculator = Calculator(False)
+        self.operationTable = calculator.operationTable
+        self.typeTable = calculator.typeTable
+        self.types = {}
+
+    def optimize(self, ast):
+        self.types = TypeAnnotator().annotate(ast)
+        nodesBefore = countNodes(ast)
+        ast = self.visit(ast)
+        return ast, nodesBefore - countNodes(ast)
+
+    def fold(self, node, operation, typeOfValue, *values):
+        if typeOfValue is None:
+            return node
+        try:
+            value = self.operationTable[operation](*values)
+        except (ArithmeticError, TypeError, ValueError): # left for the program to fail on when it runs
+            return node
+        if value.__class__ is float and not math.isfinite(value):
+            return node
+        return AST.ValueNode(value, typeOfValue, lineno=node.lineno)
+
+    def staticType(self, node):
+        typeInfo = self.types.get(node)
+        if typeInfo is None or not typeInfo.isType(ScalarType):
+            return None
+        return typeInfo.typeOfValue
+
+    def isLiteral(self, node, value):
+        return isinstance(node, AST.ValueNode) and node.typeOfValue == "integer" and node.value == value
+
+    def simplify(self, node):
+        # x * 1 and x - 0 keep the value of any integer or float x, x + 0 would turn -0.0 into 0.0
+        left, right, action = node.leftExpr, node.rightExpr, node.action
+        if action == "*":
+            if self.isLiteral(right, 1) and self.staticType(left) in ("integer", "float"):
+                return left
+            if self.isLiteral(left, 1) and self.staticType(right) in ("integer", "float"):
+                return right
+        elif action == "+":
+            if self.isLiteral(right, 0) and self.staticType(left) == "integer":
+                return left
+            if self.isLiteral(left, 0) and self.staticType(right) == "integer":
+                return right
+        elif action == "-":
+            if self.isLiteral(right, 0) and self.staticType(left) in ("integer", "float"):
+                return left
+        return node
+
+    def fresh(self, original, optimized):
+        # assigning or transposing a bare variable shares its value object, so an identity
+        # may not turn an expression that produced a new value into a variable read
+        if optimized is not original and isinstance(optimized, (AST.Variable, AST.IndexedVariable)):
+            return original
+        return optimized
+
+    def visitSequence(self, nodes):
+        output = []
+        for node in nodes:
+            node = self.visit(node)
+            if isinstance(node, AST.Statement):
+                output.extend(node.statements)
+            elif node is not None:
+                output.append(node)
+        return output
+
+    def visit_ValueNode(self, node):
+        return node
+
+    def visit_StartNode(self, node):
+        node.blocks = self.visitSequence(node.blocks)
+        return node
+
+    def visit_Statement(self, node):
+        node.statements = self.visitSequence(node.statements)
+        return node
+
+    def visit_BlockStatement(self, node):
+        self.visit(node.nextStatements)
+        return node
+
+    def visit_AssignStatement(self, node):
+        node.variableId = self.visit(node.variableId)
+        node.newValue = self.fresh(node.newValue, self.visit(node.newValue))
+        return node
+
+    def visit_ReturnValue(self, node):
+        node.value = self.visit(node.value)
+        return node
+
+    def visit_PrintValue(self, node):
+        node.value = self.visit(node.value)
+        return node
+
+    def visit_LoopControlNode(self, node):
+        return node
+
+    def visit_Vector(self, node):
+        item = node
+        while item is not None:
+            item.value = self.visit(item.value)
+            item = item.nextItem
+        return node
+
+    def visit_ValueList(self, node):
+        item = node
+        while item is not None:
+            item.value = self.visit(item.value)
+            item = item.nextItem
+        return node
+
+    def visit_PackedValues(self, node):
+        return node
+
+    def visit_IndexList(self, node):
+        item = node
+        while item is not None:
+            if isinstance(item.index, AST.Node):
+                item.index = self.visit(item.index)
+            item = item.nextItem
+        return node
+
+    def visit_ArithmeticExpression(self, node):
+        operand, chain = AST.leftChain(node)
+        left = self.visit(operand)
+        for expression in chain:
+            expression.leftExpr = left
+            expression.rightExpr = right = self.visit(expression.rightExpr)
+            if isinstance(left, AST.ValueNode) and isinstance(right, AST.ValueNode) and "." not in expression.action:
+                typeOfValue = self.typeTable.getType(left.typeOfValue, expression.action, right.typeOfValue)
+                left = self.fold(expression, expression.action, typeOfValue, left.value, right.value)
+            else:
+                left = self.simplify(expression)
+        return left
+
+    def visit_ComparisonExpression(self, node):
+        node.leftExpr = self.visit(node.leftExpr)
+        node.rightExpr = self.visit(node.rightExpr)
+        left, right = node.leftExpr, node.rightExpr
+        if isinstance(left, AST.ValueNode) and isinstance(right, AST.ValueNode):
+            typeOfValue = self.typeTable.getType(left.typeOfValue, node.action, right.typeOfValue)
+            return self.fold(node, node.action, typeOfValue, left.value, right.value)
+        return node
+
+    def visit_NegateExpression(self, node):
+        node.expr = self.visit(node.expr)
+        if isinstance(node.expr, AST.ValueNode):
+            return self.fold(node, "neg", node.expr.typeOfValue, node.expr.value)
+        return node
+
+    def visit_IfStatement(self, node):
+        node.condition = self.visit(node.condition)
+        node.action = self.visit(node.action)
+        if node.elseAction is not None:
+            node.elseAction = self.visit(node.elseAction)
+        if not isinstance(node.condition, AST.ValueNode):
+            return node
+        return node.action if node.condition.value else node.elseAction
+
+    def visit_WhileStatement(self, node):
+        node.condition = self.visit(node.condition)
+        node.action = self.visit(node.action)
+        return node
+
+    def visit_ForStatement(self, node):
+        node.valueRange = self.visit(node.valueRange)
+        node.action = self.visit(node.action)
+        return node
+
+    def visit_TransposeExpression(self, node):
+        node.value = self.fresh(node.value, self.visit(node.value))
+        return node
+
+    def visit_RangeNode(self, node):
+        node.rangeStart = self.visit(node.rangeStart)
+        node.rangeEnd = self.visit(node.rangeEnd)
+        return node
+
+    def visit_Variable(self, node):
+        return node
+
+    def visit_IndexedVariable(self, node):
+        node.indexes = self.visit(node.indexes)
+        return node
+
+    def visit_MatrixInitiator(self, node):
+        node.size = self.visit(node.size)
+        return node
@@ -0,0 +1,89 @@
+import sys
+import AST
+from time import perf_counter
+from Interpreter import Interpreter
+
+class Totals(object):
+    # calls, cumulative and self time of one node class or source line; nodes of the same class or on the
+    # same line nested inside each other count their cumulative time only once, for the outermost one
+    def __init__(self):
+        self.calls = 0
+        self.cumulative = 0.0
+        self.own = 0.0
+        self.active = 0
+
+class Profiler(Interpreter):
+    # tree walker that times every visit; the plain Interpreter is not instrumented at all,
+    # profiling is switched on by running the program with this class instead
+    def __init__(self, useArrays=None):
+        super().__init__(useArrays)
+        self.nodeTypes = {}
+        self.lines = {}
+        self.containers = Totals() # not reported, see visit
+        self.childTimes = []
+        self.stacks = [0.0, {}] # self time and callees of the root of the collapsed stacks
+        self.frame = self.stacks
+
+    def visit(self, node):
+        if not isinstance(node, AST.Node):
+            return Interpreter.visit(self, node)
+
+        name = node.__class__.__name__
+        nodeType = self.nodeTypes.get(name)
+        if nodeType is None:
+            nodeType = self.nodeTypes[name] = Totals()
+        if node.__class__ is AST.StartNode or node.__class__ is AST.Statement:
+            # a program and a list of statements take the line of their first statement, whose own time they are not
+            line = self.containers
+        else:
+            line = self.lines.get(node.lineno)
+            if line is None:
+                line = self.lines[node.lineno] = Totals()
+        label = f"{name}:{node.lineno}"
+        caller = self.frame
+        frame = caller[1].get(label)
+        if frame is None:
+            frame = caller[1][label] = [0.0, {}]
+
+        nodeType.active += 1
+        line.active += 1
+        self.frame = frame
+        self.childTimes.append(0.0)
+        start = perf_counter()
+        try:
+            return Interpreter.visit(self, node)
+        finally:
+            elapsed = perf_counter() - start
+            own = elapsed - self.childTimes.pop()
+            if self.childTimes:
+                self.childTimes[-1] += elapsed
+            self.frame = caller
+            frame[0] += own
+            for totals in (nodeType, line):
+                totals.active -= 1
+                totals.calls += 1
+                totals.own += own
+                if totals.active == 0:
+                    totals.cumulative += elapsed
+
+    def report(self, sourceLines=None, top=20, file=sys.stderr):
+        print(f"{'line':>6} {'visits':>10} {'self ms':>10} {'cum ms':>10}  source", file=file)
+        hotLines = sorted(self.lines.items(), key=lambda item: item[1].own, reverse=True)[:top]
+        for lineno, totals in hotLines:
+            text = sourceLines[lineno - 1].strip() if sourceLines is not None and 0 < lineno <= len(sourceLines) else ""
+            print(f"{lineno:>6} {totals.calls:>10} {totals.own * 1000:>10.2f} {totals.cumulative * 1000:>10.2f}  {text}", file=file)
+        print(file=file)
+        print(f"{'node':<22} {'visits':>10} {'self ms':>10} {'cum ms':>10}", file=file)
+        for name, totals in sorted(self.nodeTypes.items(), key=lambda item: item[1].own, reverse=True):
+            print(f"{name:<22} {totals.calls:>10} {totals.own * 1000:>10.2f} {totals.cumulative * 1000:>10.2f}", file=file)
+
+    def writeStacks(self, file):
+        # collapsed stacks as read by flamegraph.pl and speedscope, weighted by self time in microseconds
+        pending = [((), self.stacks)]
+        while pending:
+            path, (own, callees) = pending.pop()
+            weight = round(own * 1000000)
+            if path and weight > 0:
+                file.write(f"{';'.join(path)} {weight}\n")
+            for label in sorted(callees, reverse=True):
+                pending.append(((*path, label), callees[label]))
@@ -0,0 +1,334 @@
+import AST
+from array import array
+from TypeChecker import NodeVisitor
+from Interpreter import Interpreter, ScalarValue, ReturnException, RuntimeException, UndefinedValue, stored
+
+# language type of a scalar held as a plain Python value
+scalarTypes = {bool: "boolean", int: "integer", float: "float", str: "string"}
+
+# how tightly the Python operators scalars are emitted with bind, operands binding less tightly are parenthesised
+precedences = {"+": 1, "-": 1, "*": 2, "/": 2}
+comparisonPrecedence = 0
+negationPrecedence = 3
+atomPrecedence = 4
+
+class PythonGenerator(NodeVisitor):
+    # scalars are emitted as plain Python values and operators, vectors and matrices
+    # stay runtime values and go through the same helpers as the interpreter
+    def __init__(self):
+        self.lines = []
+        self.indent = 0
+        self.constants = {}
+        self.boxedSlots = set()
+        self.variables = {}
+        self.scalars = {}
+
+    def generate(self, ast):
+        # a variable is a plain Python value only if nothing but scalars is ever assigned to it; a variable found to
+        # hold other values is boxed and the program generated again, until no more variables have to be
+        self.boxedSlots = set()
+        while True:
+            boxedSlots = len(self.boxedSlots)
+            source = self.generateProgram(ast)
+            if len(self.boxedSlots) == boxedSlots:
+                return source
+
+    def generateProgram(self, ast):
+        self.constants = {}
+        self.variables = {}
+        self.scalars = {}
+        self.lines = ["def program():"]
+        self.indent = 0
+        self.emitBlock(ast)
+        # variables start undefined, like the slots of the interpreter
+        self.indent = 1
+        self.emitUndefined(1, self.variables)
+        # boxed literals are made once, when the module is loaded
+        constants = [f"{name} = ScalarValue({typeOfValue!r}, {source})" for (typeOfValue, source), name in self.constants.items()]
+        return "\n".join(constants + self.lines) + "\n"
+
+    def emit(self, line):
+        self.lines.append("    " * self.indent + line)
+
+    def emitBlock(self, node):
+        self.indent += 1
+        emitted = len(self.lines)
+        self.visit(node)
+        if len(self.lines) == emitted: # e.g. a body emptied by the Optimizer
+            self.emit("pass")
+        self.indent -= 1
+
+    def emitUndefined(self, position, slots):
+        lines = [f"{self.variableName(self.variables[slot], slot)} = {'undefined' if slot in self.boxedSlots else 'None'}" for slot in slots]
+        self.lines[position:position] = ["    " * self.indent + line for line in lines]
+
+    def isScalar(self, node):
+        # only values that are scalars whatever the program does are emitted as plain Python values
+        isScalar = self.scalars.get(node)
+        if isScalar is None:
+            nodeClass = node.__class__
+            if nodeClass is AST.ValueNode:
+                isScalar = True
+            elif nodeClass is AST.Variable:
+                isScalar = node.slot not in self.boxedSlots
+            elif nodeClass is AST.ArithmeticExpression:
+                operand, chain = AST.leftChain(node)
+                isScalar = self.isScalar(operand)
+                for expression in chain:
+                    isScalar = self.scalars[expression] = isScalar and expression.action in precedences and self.isScalar(expression.rightExpr)
+            elif nodeClass is AST.ComparisonExpression:
+                isScalar = self.isScalar(node.leftExpr) and self.isScalar(node.rightExpr)
+            elif nodeClass is AST.NegateExpression:
+                isScalar = self.isScalar(node.expr)
+            elif nodeClass is AST.ValueList:
+                isScalar = node.nextItem is None and self.isScalar(node.value)
+            else:
+                isScalar = False
+            self.scalars[node] = isScalar
+        return isScalar
+
+    def boxSlot(self, slot):
+        self.boxedSlots.add(slot)
+
+    def precedence(self, node):
+        while node.__class__ is AST.ValueList:
+            node = node.value
+        if not self.isScalar(node):
+            return atomPrecedence
+        if node.__class__ is AST.ArithmeticExpression:
+            return precedences[node.action]
+        if node.__class__ is AST.ComparisonExpression:
+            return comparisonPrecedence
+        if node.__class__ is AST.NegateExpression or (node.__class__ is AST.ValueNode and repr(node.value).startswith("-")):
+            return negationPrecedence
+        return atomPrecedence
+
+    def operand(self, node, precedence):
+        return self.wrapped(node, self.visit(node), precedence)
+
+    def wrapped(self, node, source, precedence):
+        return source if self.precedence(node) >= precedence else f"({source})"
+
+    def raw(self, node):
+        source = self.visit(node)
+        return source if self.isScalar(node) else f"{source}.content"
+
+    def boxed(self, node):
+        return self.boxedSource(node, self.visit(node))
+
+    def boxedSource(self, node, source):
+        if isinstance(node, AST.ValueNode):
+            key = (node.typeOfValue, repr(node.value)) # not the value, 0.0 and -0.0 are equal
+            if key not in self.constants:
+                self.constants[key] = f"c_{len(self.constants)}"
+            return self.constants[key]
+        return f"box({source})" if self.isScalar(node) else source
+
+    def variableName(self, name, slot):
+        # a local of program() for every slot, as a name can be bound in several blocks
+        self.variables[slot] = name
+        return f"v_{name}_{slot}"
+
+    def visit_ValueNode(self, node):
+        return repr(node.value)
+
+    def visit_StartNode(self, node):
+        for block in node.blocks:
+            self.visit(block)
+
+    def visit_Statement(self, node):
+        for statement in node.statements:
+            self.visit(statement)
+
+    def visit_BlockStatement(self, node):
+        # variables bound in the block are undefined again every time it is entered
+        position = len(self.lines)
+        self.visit(node.nextStatements)
+        self.emitUndefined(position, [slot for slot in node.localSlots if slot in self.variables])
+
+    def visit_AssignStatement(self, node):
+        name, slot = node.variableId.name, node.variableId.slot
+        variable = self.variableName(name, slot)
+        if isinstance(node.variableId, AST.IndexedVariable) or not self.isScalar(node.newValue):
+            self.boxSlot(slot)
+
+        if isinstance(node.variableId, AST.IndexedVariable):
+            target = f"indexValue({variable}, {name!r}, {self.visit(node.variableId.indexes)}, {node.lineno})"
+            self.emit(f"assignIndexed({variable}, {node.action!r}, {target}, {self.boxed(node.newValue)}, {node.lineno})")
+        elif slot not in self.boxedSlots:
+            self.emit(f"{variable} {node.action} {self.visit(node.newValue)}")
+        elif node.action == "=":
+            self.emit(f"{variable} = stored({self.boxed(node.newValue)}, {name!r})")
+        else:
+            self.emit(f"{variable} = compoundAssign({variable}, {name!r}, {node.action!r}, {self.boxed(node.newValue)}, {node.lineno})")
+
+    def visit_ReturnValue(self, node):
+        self.emit(f"raise ReturnException({self.raw(node.value)})")
+
+    def visit_PrintValue(self, node):
+        if self.isScalar(node.value):
+            self.emit(f"print({self.visit(node.value)})")
+        else:
+            self.emit(f"printValue({self.visit(node.value)})")
+
+    def visit_LoopControlNode(self, node):
+        self.emit(node.action)
+
+    def visit_Vector(self, node):
+        if node.isMatrixHead:
+            return f"buildVector({self.visit(node.value)}, True)"
+        rows = []
+        while node is not None:
+            rows.append(self.boxed(node.value))
+            node = node.nextItem
+        return f"vector([{', '.join(rows)}])"
+
+    def visit_ValueList(self, node):
+        if node.nextItem is None:
+            return self.visit(node.value)
+        items = []
+        while node is not None:
+            items.append(self.boxed(node.value))
+            node = node.nextItem
+        return f"valueList([{', '.join(items)}])"
+
+    def visit_PackedValues(self, node):
+        return f"packedValues({node.typeOfValue!r}, array({node.values.typecode!r}, {node.values.tolist()!r}))"
+
+    def visit_IndexList(self, node):
+        nextIndex = self.visit(node.nextItem) if node.nextItem is not None else None
+        return f"buildIndexList({self.boxed(node.index)}, {nextIndex}, {node.lineno})"
+
+    def visit_ArithmeticExpression(self, node):
+        # chains of operators are left-associative, so only a right operand of the same precedence needs parentheses;
+        # the chain is built up in a loop from its innermost operator
+        operand, chain = AST.leftChain(node)
+        left, source = operand, self.visit(operand)
+        for expression in chain:
+            if self.isScalar(expression):
+                precedence = precedences[expression.action]
+                source = f"{self.wrapped(left, source, precedence)} {expression.action} {self.operand(expression.rightExpr, precedence + 1)}"
+            else:
+                source = f"arithmetic({expression.action!r}, {self.boxedSource(left, source)}, {self.boxed(expression.rightExpr)}, {expression.lineno})"
+            left = expression
+        return source
+
+    def visit_ComparisonExpression(self, node):
+        # Python chains comparisons, so comparisons compared again are parenthesised
+        if self.isScalar(node):
+            return f"{self.operand(node.leftExpr, comparisonPrecedence + 1)} {node.action} {self.operand(node.rightExpr, comparisonPrecedence + 1)}"
+        return f"calculate({node.action!r}, [{self.boxed(node.leftExpr)}, {self.boxed(node.rightExpr)}])"
+
+    def visit_NegateExpression(self, node):
+        if self.isScalar(node):
+            return f"-{self.operand(node.expr, negationPrecedence)}"
+        return f"calculate('-', [{self.visit(node.expr)}])"
+
+    def visit_IfStatement(self, node):
+        self.emit(f"if {self.raw(node.condition)}:")
+        self.emitBlock(node.action)
+        if node.elseAction is not None:
+            self.emit("else:")
+            self.emitBlock(node.elseAction)
+
+    def visit_WhileStatement(self, node):
+        self.emit(f"while {self.raw(node.condition)}:")
+        self.emitBlock(node.action)
+
+    def visit_ForStatement(self, node):
+        valueRange = node.valueRange
+        variable = self.variableName(node.loopVariable, node.loopSlot)
+        valueRange = f"forRange({self.raw(valueRange.rangeStart)}, {self.raw(valueRange.rangeEnd)})"
+        if node.loopSlot not in self.boxedSlots:
+            self.emit(f"for {variable} in {valueRange}:")
+            self.emitBlock(node.action)
+            return
+        self.emit(f"for loopValue in {valueRange}:")
+        self.indent += 1
+        self.emit(f"{variable} = ScalarValue('integer', loopValue)")
+        self.indent -= 1
+        self.emitBlock(node.action)
+
+    def visit_RangeNode(self, node):
+        # ranges of for loops are emitted by visit_ForStatement, these are the ranges of indexes
+        return f"makeRange({self.boxed(node.rangeStart)}, {self.boxed(node.rangeEnd)}, {node.lineno})"
+
+    def visit_TransposeExpression(self, node):
+        return f"calculate(\"'\", [{self.boxed(node.value)}])"
+
+    def visit_Variable(self, node):
+        return self.variableName(node.name, node.slot)
+
+    def visit_IndexedVariable(self, node):
+        self.boxSlot(node.slot)
+        return f"indexValue({self.variableName(node.name, node.slot)}, {node.name!r}, {self.visit(node.indexes)}, {node.lineno})"
+
+    def visit_MatrixInitiator(self, node):
+        return f"initMatrix({node.matrixType!r}, {self.boxed(node.size)}, {node.lineno})"
+
+def compiles(source):
+    # Python limits how deeply an expression may nest, which long chains of vector operations can exceed
+    try:
+        compile(source, "<generated>", "exec")
+    except (SyntaxError, RecursionError, MemoryError):
+        return False
+    return True
+
+def box(value):
+    return ScalarValue(scalarTypes[value.__class__], value)
+
+def iterateRange(start, end):
+    currentStep = start
+    while currentStep <= end:
+        yield currentStep
+        currentStep += 1
+
+def forRange(start, end):
+    if start.__class__ is int and end.__class__ is int:
+        return range(start, end + 1)
+    return iterateRange(start, end)
+
+class PythonRuntime(object):
+    def __init__(self, interpreter=None):
+        # the interpreter provides the calculator and the runtime semantics of vectors and matrices
+        self.interpreter = interpreter if interpreter is not None else Interpreter()
+
+    def load(self, source, filename="<generated>"):
+        interpreter = self.interpreter
+        namespace = {
+            "ScalarValue": ScalarValue,
+            "ReturnException": ReturnException,
+            "undefined": UndefinedValue(),
+            "box": box,
+            "stored": stored,
+            "forRange": forRange,
+            "printValue": interpreter.printValue,
+            "indexValue": interpreter.indexValue,
+            "assignIndexed": interpreter.assignIndexed,
+            "compoundAssign": self.compoundAssign,
+            "buildIndexList": interpreter.buildIndexList,
+            "buildVector": interpreter.buildVector,
+            "packedValues": interpreter.packedValues,
+            "array": array,
+            "vector": interpreter.vector,
+            "valueList": interpreter.valueList,
+            "arithmetic": interpreter.arithmetic,
+            "calculate": interpreter.calculator.calculate,
+            "initMatrix": interpreter.initMatrix,
+            "makeRange": interpreter.makeRange,
+        }
+        exec(compile(source, filename, "exec"), namespace)
+        return namespace["program"]
+
+    def run(self, program):
+        return self.interpreter.run(program)
+
+    def compoundAssign(self, variable, name, action, valueInfo, lineno):
+        if variable.isType(UndefinedValue):
+            raise RuntimeException(f"Line {lineno}: variable {name} is undefined")
+        if variable.indexIterator is not None:
+            self.interpreter.assignIndexed(variable, action, variable, valueInfo, lineno)
+            return variable
+        newValue = self.interpreter.updatedValue(action, variable, valueInfo, lineno)
+        newValue.name = name
+        return newValue
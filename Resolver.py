@@ -0,0 +1,134 @@
+from TypeChecker import NodeVisitor
+
+import AST
+
+class Resolver(NodeVisitor):
+    # gives every variable a slot in one flat frame; an assignment binds its name in the innermost block unless an
+    # enclosing block already has it, as the scopes of the tree walker did, and every block lists the slots it binds
+    # so backends can clear them when the block is entered again
+    def __init__(self):
+        self.scopes = [{}]
+        self.frameSize = 0
+
+    def resolve(self, ast):
+        self.scopes = [{}]
+        self.frameSize = 0
+        self.visit(ast)
+        return self.frameSize
+
+    def newSlot(self):
+        self.frameSize += 1
+        return self.frameSize - 1
+
+    def lookup(self, name):
+        for scope in reversed(self.scopes):
+            slot = scope.get(name)
+            if slot is not None:
+                return slot
+        return None
+
+    def slotOf(self, name):
+        # a name read before anything binds it gets a slot of its own that stays undefined
+        slot = self.lookup(name)
+        return self.newSlot() if slot is None else slot
+
+    def bind(self, name):
+        slot = self.lookup(name)
+        if slot is None:
+            slot = self.scopes[-1][name] = self.newSlot()
+        return slot
+
+    def visit_ValueNode(self, node):
+        pass
+
+    def visit_StartNode(self, node):
+        for block in node.blocks:
+            self.visit(block)
+
+    def visit_Statement(self, node):
+        for statement in node.statements:
+            self.visit(statement)
+
+    def visit_BlockStatement(self, node):
+        self.scopes.append({})
+        self.visit(node.nextStatements)
+        node.localSlots = tuple(self.scopes.pop().values())
+
+    def visit_AssignStatement(self, node):
+        self.visit(node.newValue)
+        if node.action == "=" and isinstance(node.variableId, AST.Variable):
+            node.variableId.slot = self.bind(node.variableId.name)
+        else:
+            self.visit(node.variableId)
+
+    def visit_ReturnValue(self, node):
+        self.visit(node.value)
+
+    def visit_PrintValue(self, node):
+        self.visit(node.value)
+
+    def visit_LoopControlNode(self, node):
+        pass
+
+    def visit_Vector(self, node):
+        while node is not None:
+            self.visit(node.value)
+            node = node.nextItem
+
+    def visit_ValueList(self, node):
+        while node is not None:
+            self.visit(node.value)
+            node = node.nextItem
+
+    def visit_PackedValues(self, node):
+        pass
+
+    def visit_IndexList(self, node):
+        while node is not None:
+            self.visit(node.index)
+            node = node.nextItem
+
+    def visit_ArithmeticExpression(self, node):
+        operand, chain = AST.leftChain(node)
+        self.visit(operand)
+        for expression in chain:
+            self.visit(expression.rightExpr)
+
+    def visit_ComparisonExpression(self, node):
+        self.visit(node.leftExpr)
+        self.visit(node.rightExpr)
+
+    def visit_NegateExpression(self, node):
+        self.visit(node.expr)
+
+    def visit_IfStatement(self, node):
+        self.visit(node.condition)
+        self.visit(node.action)
+        if node.elseAction is not None:
+            self.visit(node.elseAction)
+
+    def visit_WhileStatement(self, node):
+        self.visit(node.condition)
+        self.visit(node.action)
+
+    def visit_ForStatement(self, node):
+        self.visit(node.valueRange)
+        node.loopSlot = self.bind(node.loopVariable)
+        self.visit(node.action)
+
+    def visit_TransposeExpression(self, node):
+        self.visit(node.value)
+
+    def visit_RangeNode(self, node):
+        self.visit(node.rangeStart)
+        self.visit(node.rangeEnd)
+
+    def visit_Variable(self, node):
+        node.slot = self.slotOf(node.name)
+
+    def visit_IndexedVariable(self, node):
+        node.slot = self.slotOf(node.name)
+        self.visit(node.indexes)
+
+    def visit_MatrixInitiator(self, node):
+        self.visit(node.size)
@@ -21,16 +21,14 @@ class TreePrinter:
 
     @addToClass(AST.StartNode)
     def printTree(self, indent=0):
-        self.block.printTree(indent)
-        if self.nextStart is not None:
-            self.nextStart.printTree(indent)
+        for block in self.blocks:
+            block.printTree(indent)
 
     @addToClass(AST.Statement)
     def printTree(self, indent=0, special_name=""):
         if special_name != "": printIndented(special_name, indent)
-        self.statement.printTree(indent)
-        if self.nextStatements is not None:
-            self.nextStatements.printTree(indent)
+        for statement in self.statements:
+            statement.printTree(indent)
 
     @addToClass(AST.BlockStatement)
     def printTree(self, indent=0, special_name=""):
@@ -60,9 +58,15 @@ class TreePrinter:
 
     @addToClass(AST.ValueList)
     def printTree(self, indent=0):
-        self.value.printTree(indent)
-        if self.nextItem is not None:
-            self.nextItem.printTree(indent)
+        node = self
+        while node is not None:
+            node.value.printTree(indent)
+            node = node.nextItem
+
+    @addToClass(AST.PackedValues)
+    def printTree(self, indent=0):
+        for value in self.values:
+            printIndented(value, indent)
 
     @addToClass(AST.IndexList)
     def printTree(self, indent=0):
@@ -75,16 +79,21 @@ class TreePrinter:
 
     @addToClass(AST.Vector)
     def printTree(self, indent=0):
-        printIndented("VECTOR", indent)
-        self.value.printTree(indent + 1)
-        if self.nextItem is not None:
-            self.nextItem.printTree(indent)
+        node = self
+        while node is not None:
+            printIndented("VECTOR", indent)
+            node.value.printTree(indent + 1)
+            node = node.nextItem
 
     @addToClass(AST.ArithmeticExpression)
     def printTree(self, indent=0):
-        printIndented(f"{self.action}", indent)
-        self.leftExpr.printTree(indent + 1)
-        self.rightExpr.printTree(indent + 1)
+        # the operators of a chain go down one level each, their right operands come back up in reverse
+        operand, chain = AST.leftChain(self)
+        for level, expression in enumerate(reversed(chain)):
+            printIndented(f"{expression.action}", indent + level)
+        operand.printTree(indent + len(chain))
+        for level, expression in reversed(list(enumerate(reversed(chain)))):
+            expression.rightExpr.printTree(indent + level + 1)
 
     @addToClass(AST.ComparisonExpression)
     def printTree(self, indent=0):
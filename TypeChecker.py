@@ -1,7 +1,10 @@
 from SymbolTable import VariableSymbol, SymbolTable, TypeTable
-from AST import Vector, IndexedVariable
+from AST import Vector, IndexedVariable, leftChain
 
 class TypeInfo(object):
+    # no __dict__, types and the runtime values derived from them are made for every node and every operation
+    __slots__ = ("entityType", "typeOfValue", "shapeOfValue", "content", "name")
+
     def __init__(self, entityType, typeOfValue=None, shapeOfValue=None, content=None, name=None):
         # entity type is "undefined", "scalar", "vector", "matrix", "boolean" for variables
         # and "ok" or "err" for statements without distinct type like loops and assign statements
@@ -14,10 +17,14 @@ class TypeInfo(object):
     def isType(self, other): return isinstance(self, other)
 
 class UndefinedType(TypeInfo):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("undefined")
 
 class ScalarType(TypeInfo):
+    __slots__ = ()
+
     def __init__(self, typeOfValue, value, name=None):
         super().__init__("scalar", typeOfValue=typeOfValue, shapeOfValue=(), content=value, name=name)
 
@@ -26,6 +33,8 @@ class ScalarType(TypeInfo):
     def correctShapes(self, other): return True
 
 class VectorType(TypeInfo):
+    __slots__ = ("isProperVector",)
+
     def __init__(self, typeOfValue, length, value, isProperVector=True, name=None):
         super().__init__("vector", typeOfValue=typeOfValue, shapeOfValue=(length,), content=value, name=name)
         self.isProperVector = isProperVector
@@ -45,6 +54,8 @@ class VectorType(TypeInfo):
         return self.shapeOfValue[0] == other.shapeOfValue[0]
 
 class MatrixType(TypeInfo):
+    __slots__ = ()
+
     def __init__(self, typeOfValue, rows, columns, value, name=None):
         super().__init__("matrix", typeOfValue=typeOfValue, shapeOfValue=(rows, columns), content=value, name=name)
 
@@ -58,10 +69,7 @@ class MatrixType(TypeInfo):
         if column is None:
             return self.content[row]
         if row == ":":
-            values = ()
-            for vector in self.content:
-                values = (*values, vector[column])
-            return values
+            return tuple(vector[column] for vector in self.content)
         return self.content[row][column]
 
     def correctShapes(self, other):
@@ -75,25 +83,76 @@ class MatrixType(TypeInfo):
 
         return self.shapeOfValue[0] == other.shapeOfValue[0] and self.shapeOfValue[1] == other.shapeOfValue[1]
 
+def matrixProductShape(leftShape, rightShape):
+    # a vector takes part as a row on the left side and as a column on the right side
+    leftInner, rightInner = leftShape[-1], rightShape[0]
+    if leftInner is not None and rightInner is not None and leftInner != rightInner:
+        return None
+    return leftShape[:-1] + rightShape[1:]
+
+def broadcastShape(leftShape, rightShape):
+    # shape of an elementwise operation: a scalar goes with every element of the other side and a vector with every
+    # row of a matrix as wide as the vector is long, None if the shapes do not match
+    if len(leftShape) < len(rightShape):
+        leftShape, rightShape = rightShape, leftShape
+    shape = list(leftShape)
+    for position in range(1, len(rightShape) + 1):
+        left, right = leftShape[-position], rightShape[-position]
+        if left is None:
+            shape[-position] = right
+        elif right is not None and left != right:
+            return None
+    return tuple(shape)
+
+def shapedType(typeOfValue, shape):
+    if not shape:
+        return ScalarType(typeOfValue, value=None)
+    if len(shape) == 1:
+        return VectorType(typeOfValue, shape[0], value=None)
+    return MatrixType(typeOfValue, shape[0], shape[1], value=None)
+
+def isMatrixProduct(action, leftObject, rightObject):
+    return action == "*" and {leftObject.entityType, rightObject.entityType} in ({"matrix"}, {"matrix", "vector"})
+
 class RangeType(TypeInfo):
+    __slots__ = ("start", "end")
+
     def __init__(self, start=None, end=None):
         super().__init__("range")
         self.start = start
         self.end = end
 
 class ErrorType(TypeInfo):
+    __slots__ = ()
+    reported = True
+    log = None # when set to a list, reported reasons are also collected in it
+
     def __init__(self, reason):
         super().__init__("err", content=reason)
-        print(reason)
+        if ErrorType.reported:
+            print(reason)
+            if ErrorType.log is not None:
+                ErrorType.log.append(reason)
 
 class SuccessType(TypeInfo):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("ok")
 
 class NodeVisitor(object):
+    # visit_<node class> functions of a visitor class by node class, looked up by name once per node class
+    handlers = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.handlers = {}
+
     def visit(self, node):
-        response = node.visit(self)
-        return response
+        handler = self.handlers.get(node.__class__)
+        if handler is None:
+            handler = self.handlers[node.__class__] = getattr(self.__class__, f"visit_{node.__class__.__name__}")
+        return handler(self, node)
 
 class TypeChecker(NodeVisitor):
     def __init__(self):
@@ -104,17 +163,18 @@ class TypeChecker(NodeVisitor):
         return ScalarType(node.typeOfValue, value=node.value)
 
     def visit_StartNode(self, node):
-        output = self.visit(node.block)
-        if node.nextStart is not None:
-            newOutput = self.visit(node.nextStart)
-            if newOutput.isType(ErrorType):
-                output = newOutput
-        return output
+        return self.visitSequence(node.blocks)
 
     def visit_Statement(self, node):
-        output = self.visit(node.statement)
-        if node.nextStatements is not None:
-            newOutput = self.visit(node.nextStatements)
+        return self.visitSequence(node.statements)
+
+    def visitSequence(self, nodes):
+        # every node is checked, the result is the last error found or the first node's output
+        if not nodes:
+            return SuccessType()
+        output = self.visit(nodes[0])
+        for idx in range(1, len(nodes)):
+            newOutput = self.visit(nodes[idx])
             if newOutput.isType(ErrorType):
                 output = newOutput
         return output
@@ -135,6 +195,8 @@ class TypeChecker(NodeVisitor):
             return valueInfo
         if valueInfo.isType(UndefinedType):
             return ErrorType(f"Line {node.lineno}: right side of assignment is undefined")
+        if isinstance(node.variableId, IndexedVariable) and variableInfo.entityType == valueInfo.entityType and not variableInfo.correctShapes(valueInfo):
+            return ErrorType(f"Line {node.lineno}: trying to assign a value of shape {valueInfo.shapeOfValue} to an index of shape {variableInfo.shapeOfValue}")
 
         if node.action == "=":
             if isinstance(node.variableId, IndexedVariable):
@@ -143,7 +205,9 @@ class TypeChecker(NodeVisitor):
                 return SuccessType()
             self.scopes.put(node.variableId.name, valueInfo)
         else: # assign based on previous value
-            if variableInfo.entityType != valueInfo.entityType:
+            # a vector or a matrix can be updated with a value that broadcasts to its shape, see broadcastShape
+            if variableInfo.entityType != valueInfo.entityType and not (variableInfo.isType((VectorType, MatrixType))
+                    and len(valueInfo.shapeOfValue) < len(variableInfo.shapeOfValue) and broadcastShape(variableInfo.shapeOfValue, valueInfo.shapeOfValue) is not None):
                 return ErrorType(f"Line {node.lineno}: conflicting constructs {variableInfo.entityType} {node.action} {valueInfo.entityType}")
             if variableInfo.isType(UndefinedType):
                 return ErrorType(f"Line {node.lineno}: operation-assignment to undefined variable {node.variableId.name}")
@@ -155,7 +219,9 @@ class TypeChecker(NodeVisitor):
 
             if isinstance(node.variableId, IndexedVariable):
                 return SuccessType()
-            self.scopes.put(variableInfo.name, valueInfo)
+            # sizes that do not match are reported at run time, the variable keeps its own shape until then
+            shape = broadcastShape(variableInfo.shapeOfValue, valueInfo.shapeOfValue)
+            self.scopes.put(node.variableId.name, shapedType(newType, variableInfo.shapeOfValue if shape is None else shape))
         return SuccessType()
 
     def visit_ReturnValue(self, node):
@@ -180,55 +246,73 @@ class TypeChecker(NodeVisitor):
         return SuccessType()
 
     def visit_Vector(self, node):
-        valueInfo = self.visit(node.value)
-        if valueInfo.isType(ErrorType):
-            return valueInfo
-        if valueInfo.isType(UndefinedType):
-            return ErrorType(f"Line {node.lineno}: value of a vector is undefined")
-
         if node.isMatrixHead:
+            valueInfo = self.visit(node.value)
+            if valueInfo.isType(ErrorType):
+                return valueInfo
+            if valueInfo.isType(UndefinedType):
+                return ErrorType(f"Line {node.lineno}: value of a vector is undefined")
             if valueInfo.isType(MatrixType):
                 return valueInfo
-            else:
-                return MatrixType(valueInfo.typeOfValue, rows=1, columns=valueInfo.columns(), value=(valueInfo.content,))
-
-        if node.nextItem is None:
-            if valueInfo.isType(VectorType):
-                return VectorType(valueInfo.typeOfValue, length=valueInfo.columns(), value=valueInfo.content)
-            else:
-                return VectorType(valueInfo.typeOfValue, length=1, value=(valueInfo.content,))
+            return MatrixType(valueInfo.typeOfValue, rows=1, columns=valueInfo.columns(), value=(valueInfo.content,))
 
-        nextValueInfo = self.visit(node.nextItem)
-        if nextValueInfo.isType(ErrorType):
-            return nextValueInfo
-        if nextValueInfo.isType(UndefinedType):
-            return ErrorType(f"Line {node.lineno}: value of a vector is undefined")
-
-        if valueInfo.typeOfValue != nextValueInfo.typeOfValue or valueInfo.columns() != nextValueInfo.columns():
-            return ErrorType(f"Line {node.lineno}: inconsistent types {valueInfo.typeOfValue} and {nextValueInfo.typeOfValue} or shapes {valueInfo.shapeOfValue} and {(nextValueInfo.shapeOfValue[-1],)}")
-
-        nextValue = (valueInfo.content, *nextValueInfo.content) if not nextValueInfo.isType(VectorType) else (valueInfo.content, nextValueInfo.content)
-
-        return MatrixType(valueInfo.typeOfValue, rows=nextValueInfo.rows() + 1, columns=nextValueInfo.columns(), value=nextValue)
+        # the rows are checked in one pass over the chain instead of nesting a visit for every next row
+        links, rows = [], []
+        while node is not None:
+            valueInfo = self.visit(node.value)
+            if valueInfo.isType(ErrorType):
+                return valueInfo
+            if valueInfo.isType(UndefinedType):
+                return ErrorType(f"Line {node.lineno}: value of a vector is undefined")
+            links.append(node)
+            rows.append(valueInfo)
+            node = node.nextItem
+
+        last = rows[-1]
+        if last.isType(VectorType):
+            columns, lastValue = last.columns(), last.content
+        else:
+            columns, lastValue = 1, (last.content,)
+        if len(rows) == 1:
+            return VectorType(last.typeOfValue, length=columns, value=lastValue)
+
+        # every row has the columns of the last one, mismatches are reported from the end as nested checks would
+        for idx in range(len(rows) - 2, -1, -1):
+            valueInfo, nextTypeOfValue = rows[idx], rows[idx + 1].typeOfValue
+            if valueInfo.typeOfValue != nextTypeOfValue or valueInfo.columns() != columns:
+                return ErrorType(f"Line {links[idx].lineno}: inconsistent types {valueInfo.typeOfValue} and {nextTypeOfValue} or shapes {valueInfo.shapeOfValue} and {(columns,)}")
+
+        value = (*(valueInfo.content for valueInfo in rows[:-1]), lastValue)
+        return MatrixType(rows[0].typeOfValue, rows=len(rows), columns=columns, value=value)
 
     def visit_ValueList(self, node):
-        valueInfo = self.visit(node.value)
-        if valueInfo.isType(ErrorType) or valueInfo.isType(UndefinedType):
-            return valueInfo
+        links, values = [], []
+        while node is not None:
+            valueInfo = self.visit(node.value)
+            if valueInfo.isType(ErrorType) or valueInfo.isType(UndefinedType):
+                return valueInfo
+            links.append(node)
+            values.append(valueInfo)
+            node = node.nextItem
 
-        if node.nextItem is None:
-            return valueInfo
-        
-        nextValueInfo = self.visit(node.nextItem)
-        if nextValueInfo.isType(ErrorType) or nextValueInfo.isType(UndefinedType):
-            return nextValueInfo
+        if len(values) == 1:
+            return values[0]
 
-        if not node.weak and valueInfo.typeOfValue != nextValueInfo.typeOfValue:
-            return ErrorType(f"Line {node.lineno}: types {valueInfo.typeOfValue} and {nextValueInfo.typeOfValue} are inconsistent")
+        for idx in range(len(values) - 2, -1, -1):
+            if not links[idx].weak and values[idx].typeOfValue != values[idx + 1].typeOfValue:
+                return ErrorType(f"Line {links[idx].lineno}: types {values[idx].typeOfValue} and {values[idx + 1].typeOfValue} are inconsistent")
 
-        nextValue = (valueInfo.content, *nextValueInfo.content) if not nextValueInfo.isType(ScalarType) else (valueInfo.content, nextValueInfo.content)
+        last = values[-1]
+        value = [valueInfo.content for valueInfo in values[:-1]]
+        if last.isType(ScalarType):
+            value.append(last.content)
+        else:
+            value.extend(last.content)
+        return VectorType(values[0].typeOfValue, length=last.columns() + len(values) - 1, value=tuple(value), isProperVector=False)
 
-        return VectorType(valueInfo.typeOfValue, length=nextValueInfo.columns() + 1, value=nextValue, isProperVector=False)
+    def visit_PackedValues(self, node):
+        # the array is shared as the content, it is never modified
+        return VectorType(node.typeOfValue, length=len(node.values), value=node.values, isProperVector=False)
 
     def visit_IndexList(self, node):
         valueInfo = self.visit(node.index)
@@ -236,6 +320,8 @@ class TypeChecker(NodeVisitor):
             return valueInfo
         if valueInfo.isType(UndefinedType):
             return ErrorType(f"Line {node.lineno}: first index is undefined")
+        if valueInfo.isType(RangeType): # kept as an index like ":" is
+            valueInfo = ScalarType("integer", slice(valueInfo.start, valueInfo.end))
 
         if node.nextItem is None:
             if not valueInfo.isType(ScalarType) or valueInfo.typeOfValue != "integer":
@@ -254,7 +340,16 @@ class TypeChecker(NodeVisitor):
         return VectorType("integer", length=2, value=(valueInfo.content, nextValueInfo.content))
 
     def visit_ArithmeticExpression(self, node):
-        leftObject = self.visit(node.leftExpr)
+        operand, chain = leftChain(node)
+        leftObject = self.visit(operand)
+        for expression in chain:
+            leftObject = self.record(expression, self.checkArithmetic(expression, leftObject))
+        return leftObject
+
+    def record(self, node, typeInfo):
+        return typeInfo
+
+    def checkArithmetic(self, node, leftObject):
         if leftObject.isType(ErrorType):
             return leftObject
         if leftObject.isType(UndefinedType):
@@ -266,7 +361,10 @@ class TypeChecker(NodeVisitor):
         if rightObject.isType(UndefinedType):
             return ErrorType(f"Line {node.lineno}: right side of arithmetic expression is undefined")
 
-        if leftObject.entityType != rightObject.entityType:
+        if isMatrixProduct(node.action, leftObject, rightObject):
+            return self.checkMatrixProduct(node, leftObject, rightObject)
+
+        if leftObject.entityType != rightObject.entityType and "." not in node.action:
             return ErrorType(f"Line {node.lineno}: cant do arithmetics between {leftObject.entityType} and {rightObject.entityType}")
 
         if (leftObject.entityType != "scalar") and "." not in node.action:
@@ -281,15 +379,23 @@ class TypeChecker(NodeVisitor):
         if newType is None:
             return ErrorType(f"Line {node.lineno}: cant do arithmetic {leftObject.typeOfValue} {node.action} {rightObject.typeOfValue}")
 
-        if "." in node.action:
-            if not leftObject.correctShapes(rightObject):
-                return ErrorType(f"Line {node.lineno}: incompatible shapes {leftObject.shapeOfValue} and {rightObject.shapeOfValue}")
+        shape = broadcastShape(leftObject.shapeOfValue, rightObject.shapeOfValue)
+        if shape is None:
+            return ErrorType(f"Line {node.lineno}: incompatible shapes {leftObject.shapeOfValue} and {rightObject.shapeOfValue}")
+        return shapedType(newType, shape)
 
-        if leftObject.isType(ScalarType):
-            return ScalarType(newType, value=None)
-        if leftObject.isType(VectorType):
-            return VectorType(newType, leftObject.columns(), value=None)
-        return MatrixType(newType, leftObject.rows(), leftObject.columns(), value=None)
+    def checkMatrixProduct(self, node, leftObject, rightObject):
+        newType = self.typeTable.getType(leftObject.typeOfValue, node.action, rightObject.typeOfValue)
+        if newType not in ("integer", "float"):
+            return ErrorType(f"Line {node.lineno}: cant multiply {leftObject.typeOfValue} {leftObject.entityType} by {rightObject.typeOfValue} {rightObject.entityType}")
+
+        shape = matrixProductShape(leftObject.shapeOfValue, rightObject.shapeOfValue)
+        if shape is None:
+            return ErrorType(f"Line {node.lineno}: incompatible shapes {leftObject.shapeOfValue} and {rightObject.shapeOfValue} for matrix multiplication")
+
+        if len(shape) == 2:
+            return MatrixType(newType, shape[0], shape[1], value=None)
+        return VectorType(newType, shape[0], value=None)
 
     def visit_ComparisonExpression(self, node):
         leftType = self.visit(node.leftExpr)
@@ -419,6 +525,11 @@ class TypeChecker(NodeVisitor):
         if indexes.content == ":" or indexes.content == (":", ":"):
             return variable
 
+        if indexes.isType(ScalarType) and indexes.content.__class__ is slice:
+            if variable.isType(VectorType):
+                return self.indexRanges(node, variable, 0, indexes.content)
+            return self.indexRanges(node, variable, indexes.content, ":")
+
         if indexes.isType(ScalarType):
             if indexes.content is not None and indexes.content >= variable.columns():
                 return ErrorType(f"Line {node.lineno}: index {indexes.content} out of range for {variable.columns()}")
@@ -430,6 +541,9 @@ class TypeChecker(NodeVisitor):
         if variable.isType(VectorType):
             return ErrorType(f"Line {node.lineno}: too many indexes")
 
+        if indexes.content[0].__class__ is slice or indexes.content[1].__class__ is slice:
+            return self.indexRanges(node, variable, *indexes.content)
+
         if indexes.content[0] is not None and indexes.content[0] != ":" and indexes.content[0] > variable.rows():
             return ErrorType(f"Line {node.lineno}: row index out of bounds {indexes.content[0]} for matrix of shape {variable.shapeOfValue}")
         if indexes.content[1] is not None and indexes.content[1] != ":" and indexes.content[1] > variable.columns():
@@ -442,6 +556,25 @@ class TypeChecker(NodeVisitor):
 
         return ScalarType(variable.typeOfValue, value=variable.valueAt(*indexes.content), name=node.name)
 
+    def indexRanges(self, node, variable, rowIndex, columnIndex):
+        # indexes with a range among them select a block of a matrix, part of one of its rows or columns, or part of a vector
+        for index, size, dimension in ((rowIndex, variable.rows(), "row"), (columnIndex, variable.columns(), "column")):
+            if index.__class__ is slice:
+                if not rangeFits(index, size):
+                    return ErrorType(f"Line {node.lineno}: {dimension} range {index.start}:{index.stop} out of bounds for {variable.entityType} of shape {variable.shapeOfValue}")
+            elif index not in (None, ":") and size is not None and index >= size:
+                return ErrorType(f"Line {node.lineno}: {dimension} index out of bounds {index} for {variable.entityType} of shape {variable.shapeOfValue}")
+
+        if variable.isType(VectorType):
+            return VectorType(variable.typeOfValue, length=selectedLength(columnIndex, variable.columns()), value=selectedValues(variable.content, columnIndex), name=node.name)
+        rowValues = selectedValues(variable.content, rowIndex)
+        if rowIndex.__class__ is not slice and rowIndex != ":":
+            return VectorType(variable.typeOfValue, length=selectedLength(columnIndex, variable.columns()), value=selectedValues(rowValues, columnIndex), name=node.name)
+        values = None if rowValues is None or not knownIndex(columnIndex) else [selectedValues(row, columnIndex) for row in rowValues]
+        if columnIndex.__class__ is not slice and columnIndex != ":":
+            return VectorType(variable.typeOfValue, length=selectedLength(rowIndex, variable.rows()), value=values, name=node.name)
+        return MatrixType(variable.typeOfValue, rows=selectedLength(rowIndex, variable.rows()), columns=selectedLength(columnIndex, variable.columns()), value=values, name=node.name)
+
     def visit_MatrixInitiator(self, node):
         matrixSize = self.visit(node.size)
         if matrixSize.isType(MatrixType) or matrixSize.typeOfValue != "integer":
@@ -452,6 +585,57 @@ class TypeChecker(NodeVisitor):
             return ErrorType(f"Line {node.lineno}: too many values while initiating the matrix")
         return MatrixType("integer", rows=matrixSize.content[0], columns=matrixSize.content[1], value=getMatrixValues(node.matrixType, matrixSize.content[0], matrixSize.content[1]))
 
+class TypeAnnotator(TypeChecker):
+    # type checker that remembers the static type computed for every node; it runs on trees
+    # the TypeChecker has already accepted, so the errors it finds are not reported again
+    def __init__(self):
+        super().__init__()
+        self.types = {}
+
+    def annotate(self, ast):
+        ErrorType.reported = False
+        try:
+            self.visit(ast)
+        finally:
+            ErrorType.reported = True
+        return self.types
+
+    def visit(self, node):
+        typeInfo = super().visit(node)
+        self.types[node] = typeInfo
+        return typeInfo
+
+    def record(self, node, typeInfo):
+        # operators inside a chain are checked without a visit of their own
+        self.types[node] = typeInfo
+        return typeInfo
+
+def knownIndex(index):
+    return index is not None and (index.__class__ is not slice or (index.start is not None and index.stop is not None))
+
+def rangeFits(index, size):
+    # a range a:b selects at least one position and ends at the size at most; bounds computed at run time are checked then
+    if index.start is not None and index.start < 0:
+        return False
+    if index.stop is not None and size is not None and index.stop > size:
+        return False
+    return not knownIndex(index) or index.start < index.stop
+
+def selectedLength(index, size):
+    if index == ":":
+        return size
+    if index.__class__ is slice:
+        return index.stop - index.start if knownIndex(index) else None
+    return 1
+
+def selectedValues(values, index):
+    # what an index selects of values known to the checker: one value, all of them or a range of them
+    if values is None or not knownIndex(index):
+        return None
+    if index == ":":
+        return values
+    return values[index]
+
 def getMatrixValues(valueType, rows, columns):
     if rows is None or columns is None:
         return None
@@ -0,0 +1,121 @@
+from Compiler import *
+from Interpreter import Interpreter, ScalarValue, ReturnException, UndefinedValue, TRUE, FALSE, stored
+
+class VirtualMachine(object):
+    def __init__(self, interpreter=None):
+        # the interpreter provides memory, the calculator and the runtime semantics of complex instructions
+        self.interpreter = interpreter if interpreter is not None else Interpreter()
+
+    def run(self, code):
+        return self.interpreter.run(self.execute, code)
+
+    def execute(self, code):
+        interpreter = self.interpreter
+        slots = interpreter.scopes.slots
+        calculator = interpreter.calculator
+        operationTable = calculator.operationTable
+        getType = calculator.typeTable.getType
+        constants = {} # position of a LOAD_CONST -> its value, made once per run; 0.0 and -0.0 are equal arguments
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+
+        while True:
+            opcode, argument = code[pc]
+            pc += 1
+            if opcode == LOAD_CONST:
+                constant = constants.get(pc)
+                if constant is None:
+                    constant = constants[pc] = ScalarValue(argument[0], argument[1])
+                push(constant)
+            elif opcode == LOAD_VAR:
+                variableInfo = slots[argument]
+                push(UndefinedValue() if variableInfo is None else variableInfo)
+            elif opcode == BINARY_OP:
+                rightObject = pop()
+                leftObject = stack[-1]
+                action = argument[0]
+                if leftObject.__class__ is ScalarValue and rightObject.__class__ is ScalarValue:
+                    stack[-1] = ScalarValue(getType(leftObject.typeOfValue, action, rightObject.typeOfValue), operationTable[action](leftObject.content, rightObject.content))
+                else:
+                    stack[-1] = interpreter.arithmetic(action, leftObject, rightObject, argument[1])
+            elif opcode == COMPARE:
+                rightObject = pop()
+                leftObject = stack[-1]
+                if leftObject.__class__ is ScalarValue:
+                    stack[-1] = TRUE if operationTable[argument](leftObject.content, rightObject.content) else FALSE
+                else:
+                    stack[-1] = calculator.calculate(argument, [leftObject, rightObject])
+            elif opcode == ASSIGN:
+                valueInfo = pop()
+                variableInfo = pop()
+                slot, name, isIndexed, action = argument[0], argument[1], argument[2], argument[3]
+                if isIndexed:
+                    interpreter.assign(slot, name, isIndexed, action, variableInfo, valueInfo, argument[4])
+                elif action == "=":
+                    if valueInfo.__class__ is ScalarValue:
+                        valueInfo.name = name
+                    else:
+                        valueInfo = stored(valueInfo, name)
+                    slots[slot] = valueInfo
+                elif variableInfo.__class__ is ScalarValue and variableInfo.indexIterator is None:
+                    operation = action[0]
+                    newValue = ScalarValue(getType(variableInfo.typeOfValue, operation, valueInfo.typeOfValue), operationTable[operation](variableInfo.content, valueInfo.content))
+                    newValue.name = name
+                    slots[slot] = newValue
+                else:
+                    interpreter.assign(slot, name, isIndexed, action, variableInfo, valueInfo, argument[4])
+            elif opcode == JUMP_IF_FALSE:
+                if not pop().content:
+                    pc = argument
+            elif opcode == JUMP:
+                pc = argument
+            elif opcode == FOR_ITER:
+                loopVariableValue = stack[-1].getNext()
+                if loopVariableValue is None:
+                    pc = argument[1]
+                else:
+                    slots[argument[0]] = ScalarValue("integer", value=loopVariableValue)
+            elif opcode == LOAD_INDEXED:
+                indexes = pop()
+                push(interpreter.indexVariable(argument[0], argument[1], indexes, argument[2]))
+            elif opcode == BUILD_INDEX:
+                if argument[0]:
+                    nextValueInfo = pop()
+                    stack[-1] = interpreter.buildIndexList(stack[-1], nextValueInfo, argument[1])
+                else:
+                    stack[-1] = interpreter.buildIndexList(stack[-1], None, argument[1])
+            elif opcode == BUILD_LIST:
+                items = stack[-argument:]
+                del stack[-argument:]
+                push(interpreter.valueList(items))
+            elif opcode == LOAD_PACKED:
+                push(interpreter.packedValues(argument[0], argument[1]))
+            elif opcode == BUILD_VECTOR:
+                if argument[0]:
+                    stack[-1] = interpreter.buildVector(stack[-1], True)
+                else:
+                    rows = stack[-argument[1]:]
+                    del stack[-argument[1]:]
+                    push(interpreter.vector(rows))
+            elif opcode == NEGATE:
+                stack[-1] = calculator.calculate("-", [stack[-1]])
+            elif opcode == TRANSPOSE:
+                stack[-1] = calculator.calculate("'", [stack[-1]])
+            elif opcode == INIT_MATRIX:
+                stack[-1] = interpreter.initMatrix(argument[0], stack[-1], argument[1])
+            elif opcode == MAKE_RANGE:
+                valueEnd = pop()
+                stack[-1] = interpreter.makeRange(stack[-1], valueEnd, argument)
+            elif opcode == PRINT:
+                interpreter.printValue(pop())
+            elif opcode == RETURN:
+                raise ReturnException(pop().content)
+            elif opcode == POP_TOP:
+                pop()
+            elif opcode == CLEAR_SLOTS:
+                for slot in argument:
+                    slots[slot] = None
+            elif opcode == HALT:
+                return
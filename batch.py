@@ -0,0 +1,120 @@
+# checks and runs many programs over a pool of worker processes and writes one JSON report,
+# e.g. `python batch.py real-programs test-programs/* --backend closure --output report.json`;
+# the report lists the programs in the order they were given, whatever order they finish in
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from main import loadProgram, runProgram, captured, numpy
+from TypeChecker import ErrorType
+from Interpreter import RuntimeException
+from Cache import Cache
+
+cache = None
+
+def expandPaths(patterns):
+    # directories stand for the files in them and patterns for the files they match, both sorted by name
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(path for path in glob.glob(os.path.join(pattern, "*")) if os.path.isfile(path))
+        elif glob.has_magic(pattern):
+            matches = sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+        else:
+            matches = [pattern]
+        for path in matches:
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+def startWorker(args):
+    # imports the parser (and with it its tables) once per worker instead of once per program
+    global cache
+    import scanner, parser
+    cache = None if args.no_cache else Cache(args.cache_dir, args.cache_size)
+
+def runFile(args, filename):
+    ErrorType.log, RuntimeException.log = [], []
+
+    def run():
+        with open(filename, "r") as file:
+            text = file.read()
+        runProgram(args, loadProgram(args, text, cache), filename)
+
+    start = time.perf_counter()
+    _, status, stdout, stderr = captured(run)
+    seconds = time.perf_counter() - start
+
+    report = {
+        "file": filename,
+        "status": status or 0,
+        "stdout": stdout,
+        "stderr": stderr,
+        "typeErrors": ErrorType.log,
+        "runtimeErrors": RuntimeException.log,
+    }
+    if args.timing:
+        report["seconds"] = round(seconds, 6)
+    ErrorType.log, RuntimeException.log = None, None
+    return report
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser(description="check and run many programs in parallel and report the results as JSON")
+    argParser.add_argument("paths", nargs="+",
+                           help="programs, directories of programs or glob patterns")
+    argParser.add_argument("--backend", choices=["tree", "vm", "closure", "python"], default="tree",
+                           help="execute by walking the AST (reference), on the bytecode stack VM, as prebuilt closures or as generated Python code")
+    argParser.add_argument("--optimize", action="store_true",
+                           help="fold constant expressions, drop neutral operands and dead if branches before running")
+    argParser.add_argument("--storage", choices=["numpy", "list"], default="numpy" if numpy is not None else "list",
+                           help="keep numeric vectors and matrices in NumPy arrays or in nested Python lists")
+    argParser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                           help="number of worker processes (default: the number of CPUs)")
+    argParser.add_argument("--output", default=None,
+                           help="file the JSON report is written to (default: standard output)")
+    argParser.add_argument("--no-timing", dest="timing", action="store_false",
+                           help="leave the run times out, so that the report of the same programs is always the same")
+    argParser.add_argument("--no-cache", action="store_true",
+                           help="always lex, parse and check the programs instead of using the on-disk cache")
+    argParser.add_argument("--cache-dir", default=None,
+                           help="directory of the cache of checked programs (default: $XDG_CACHE_HOME/compiler-theory)")
+    argParser.add_argument("--cache-size", type=int, default=64 * 1024 * 1024,
+                           help="size in bytes above which least recently used cache entries are evicted")
+    argParser.set_defaults(dump_bytecode=False, dump_python=False, profile=False)
+    args = argParser.parse_args()
+
+    if args.storage == "numpy" and numpy is None:
+        argParser.error("--storage numpy requires NumPy to be installed")
+    if args.jobs < 1:
+        argParser.error("--jobs must be at least 1")
+
+    filenames = expandPaths(args.paths)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(args.jobs, max(len(filenames), 1)),
+                             initializer=startWorker, initargs=(args,)) as executor:
+        # map yields the results in the order of the files, not in the order the workers finish them
+        results = list(executor.map(runFile, [args] * len(filenames), filenames))
+    seconds = time.perf_counter() - start
+
+    failed = [result["file"] for result in results if result["status"] != 0 or result["typeErrors"] or result["runtimeErrors"]]
+    report = {
+        "backend": args.backend,
+        "optimize": args.optimize,
+        "storage": args.storage,
+        "programs": results,
+        "failed": failed,
+    }
+    if args.timing:
+        report["seconds"] = round(seconds, 6)
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    print(f"{len(results) - len(failed)} of {len(results)} programs ran without errors", file=sys.stderr)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,17 @@
+# break/continue on almost every iteration; time with: time python main.py benchmarks/break-heavy.m
+count = 0;
+for n = 1:50000 {
+    for d = 1:10 {
+        if (d == 2) {
+            continue;
+        }
+        if (d == 3) {
+            break;
+        }
+    }
+    while (1 == 1) {
+        count += 1;
+        break;
+    }
+}
+return count;
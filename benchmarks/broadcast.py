@@ -0,0 +1,94 @@
+# memory allocated and time taken by elementwise operations of a square matrix with a scalar and with a vector that
+# are broadcast, against the matrix of the same values a script had to build for them before, kept in lists and in
+# NumPy arrays, then of programs scaling and shifting a matrix in a loop both ways on the tree walker and the
+# virtual machine:
+#   python benchmarks/broadcast.py --size 500 --iterations 20
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from scanner import FastScanner
+from parser import Parser
+from TypeChecker import TypeChecker
+from Interpreter import Interpreter, ScalarValue, VectorValue, MatrixValue
+from suite import compileFor, execute
+
+storages = (("list", False), ("numpy", True))
+
+def parse(text):
+    ast = Parser().parse(FastScanner().tokenize(text))
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        TypeChecker().visit(ast)
+    return ast
+
+def best(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def measure(function, repeat):
+    # bytes allocated at the peak of one call, and the best time of a few calls
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, best(function, repeat)
+
+def operationTimings(size, useArrays, repeat):
+    interpreter = Interpreter(useArrays=useArrays)
+    calculator = interpreter.calculator
+    matrix = MatrixValue("float", size, size, calculator.store("float", [[1.5] * size for _ in range(size)], 2))
+    row = [float(column) for column in range(size)]
+    vector = VectorValue("float", size, calculator.store("float", row, 1))
+
+    def scalarMatrix():
+        return MatrixValue("integer", size, size, calculator.getMatrixValues("ones", size, size))
+
+    def rowMatrix():
+        return MatrixValue("float", size, size, calculator.store("float", [list(row) for _ in range(size)], 2))
+
+    operations = {
+        "A .+ 1": (lambda: interpreter.arithmetic(".+", matrix, ScalarValue("integer", 1), 1),
+                   lambda: interpreter.arithmetic(".+", matrix, scalarMatrix(), 1)),
+        "A .* v": (lambda: interpreter.arithmetic(".*", matrix, vector, 1),
+                   lambda: interpreter.arithmetic(".*", matrix, rowMatrix(), 1)),
+    }
+    return {name: (measure(built, repeat), measure(broadcast, repeat)) for name, (broadcast, built) in operations.items()}
+
+def programs(size, iterations):
+    # B is assigned before the loop, as a variable first assigned in the loop's block is not defined after it
+    broadcast = f"A = ones({size});\nB = A;\nfor k = 1:{iterations} {{\n    B = A .* 2;\n    B = B .- 0.5;\n}}\nprint B[0, 0];"
+    built = (f"A = ones({size});\nB = A;\nfor k = 1:{iterations} {{\n    B = A .* (ones({size}) .+ ones({size}));\n"
+             f"    B = B .- ones({size}) ./ 2;\n}}\nprint B[0, 0];")
+    return parse(built), parse(broadcast)
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--size", type=int, default=500)
+    argParser.add_argument("--iterations", type=int, default=20)
+    argParser.add_argument("--repeat", type=int, default=3)
+    args = argParser.parse_args()
+
+    print(f"{args.size} x {args.size} matrix, KiB allocated at the peak and ms per operation, built operand -> broadcast")
+    for storage, useArrays in storages:
+        for name, ((oldPeak, oldTime), (peak, seconds)) in operationTimings(args.size, useArrays, args.repeat).items():
+            print(f"  {storage:<6} {name:<8} {oldPeak / 1024:10.1f} -> {peak / 1024:8.1f} KiB {oldTime * 1000:10.2f} -> {seconds * 1000:8.2f} ms")
+
+    print(f"scaling and shifting {args.iterations} times, ms")
+    built, broadcast = programs(args.size, args.iterations)
+    for backend in ("tree", "vm"):
+        compiledBuilt, compiledBroadcast = compileFor(backend, built), compileFor(backend, broadcast)
+        for storage, useArrays in storages:
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                old = best(lambda: execute(backend, useArrays, compiledBuilt), args.repeat)
+                new = best(lambda: execute(backend, useArrays, compiledBroadcast), args.repeat)
+            print(f"  {backend:<4} {storage:<6} {old * 1000:10.1f} -> {new * 1000:8.1f}   {old / new:6.1f}x")
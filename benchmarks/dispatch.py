@@ -0,0 +1,123 @@
+# cost of dispatching a visit on the node class, per node of real-programs/: NodeVisitor.visit with its handler
+# table against the getattr of Node.visit, and visit.Dispatcher with resolved targets against looking them up
+# on every call, then the same comparison for a type check of every program and a tree-walker run of pi.m:
+#   python benchmarks/dispatch.py --repeat 20
+import os
+import sys
+import glob
+import time
+import argparse
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import AST
+from scanner import FastScanner
+from parser import Parser
+from visit import Dispatcher
+from TypeChecker import NodeVisitor, TypeChecker
+from Interpreter import Interpreter
+from Resolver import Resolver
+
+def legacyMethod(dispatcher):
+    # Dispatcher.__call__ behind the wrapper made by when(), as they were before targets were resolved once per class
+    def call(*args, **kw):
+        typ = args[dispatcher.param_index].__class__
+        d = dispatcher.targets.get(typ)
+        if d is not None:
+            return d(*args, **kw)
+        return [t(*args, **kw) for k, t in dispatcher.targets.items() if issubclass(typ, k)]
+
+    def ff(*args, **kw):
+        return call(*args, **kw)
+    return ff
+
+def legacyVisit(self, node):
+    return node.visit(self)
+
+def parse(text):
+    return Parser().parse(FastScanner().tokenize(text))
+
+def programs():
+    for path in sorted(glob.glob(os.path.join(root, "real-programs", "*.m"))):
+        with open(path, "r") as file:
+            yield file.read()
+
+def nodesOf(ast):
+    nodes, pending = [], [ast]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, AST.Node):
+            nodes.append(node)
+            pending.extend(getattr(node, name, None) for cls in type(node).__mro__ for name in getattr(cls, "__slots__", ()))
+        elif isinstance(node, list):
+            pending.extend(node)
+    return nodes
+
+def best(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def perNode(dispatch, visitor, nodes, repeat):
+    def walk():
+        for node in nodes:
+            dispatch(visitor, node)
+    return best(walk, repeat) / len(nodes) * 1e9
+
+def noop(self, node):
+    return None
+
+class NoopVisitor(NodeVisitor):
+    pass
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--repeat", type=int, default=20)
+    argParser.add_argument("--iterations", type=int, default=20000, help="loop iterations of the tree-walker run of pi.m")
+    args = argParser.parse_args()
+
+    texts = list(programs())
+    nodes = [node for text in texts for node in nodesOf(parse(text))] * 20
+    nodeClasses = {node.__class__ for node in nodes}
+    for nodeClass in nodeClasses:
+        setattr(NoopVisitor, f"visit_{nodeClass.__name__}", noop)
+    dispatcher = Dispatcher("node", noop)
+    for nodeClass in nodeClasses:
+        dispatcher.add_target(nodeClass, noop)
+
+    visitor = NoopVisitor()
+    print(f"{len(nodes)} nodes of {len(nodeClasses)} classes, ns per node")
+    print(f"  calling the handler directly     {perNode(noop, visitor, nodes, args.repeat):7.1f}")
+    print(f"  Node.visit (getattr)             {perNode(legacyVisit, visitor, nodes, args.repeat):7.1f}")
+    print(f"  NodeVisitor.visit (table)        {perNode(NodeVisitor.visit, visitor, nodes, args.repeat):7.1f}")
+    print(f"  Dispatcher, looked up per call   {perNode(legacyMethod(dispatcher), visitor, nodes, args.repeat):7.1f}")
+    print(f"  Dispatcher, resolved per class   {perNode(dispatcher.method(), visitor, nodes, args.repeat):7.1f}")
+
+    asts = [parse(text) for text in texts]
+    with open(os.path.join(root, "real-programs", "pi.m"), "r") as file:
+        pi = parse(file.read().replace("100000", str(args.iterations)))
+    frameSize = Resolver().resolve(pi)
+
+    def typeCheck():
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            for ast in asts:
+                TypeChecker().visit(ast)
+
+    def walk():
+        interpreter = Interpreter(useArrays=False)
+        interpreter.scopes.reserve(frameSize)
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            interpreter.visit(pi)
+
+    current = best(typeCheck, args.repeat), best(walk, 3)
+    tableVisit, dispatchingVisit = NodeVisitor.visit, Interpreter.visit
+    NodeVisitor.visit, Interpreter.visit = legacyVisit, legacyMethod(Interpreter.visit.dispatcher)
+    legacy = best(typeCheck, args.repeat), best(walk, 3)
+    NodeVisitor.visit, Interpreter.visit = tableVisit, dispatchingVisit
+    print(f"type check of real-programs/   {legacy[0] * 1000:8.2f} ms -> {current[0] * 1000:8.2f} ms   {legacy[0] / current[0]:.2f}x")
+    print(f"tree walk of pi.m ({args.iterations})  {legacy[1] * 1000:8.2f} ms -> {current[1] * 1000:8.2f} ms   {legacy[1] / current[1]:.2f}x")
@@ -0,0 +1,107 @@
+# memory allocated and time taken by compound assignments to a whole square matrix, to a block of it and to one of its
+# columns, kept in lists and in NumPy arrays, updated in place against calculating a new value and writing it back,
+# then of a program accumulating a matrix in a loop on the tree walker and the virtual machine:
+#   python benchmarks/inplace.py --size 500 --iterations 20
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from scanner import FastScanner
+from parser import Parser
+from TypeChecker import TypeChecker
+from Interpreter import Interpreter, VectorValue
+from Resolver import Resolver
+from suite import compileFor, execute
+
+storages = (("list", False), ("numpy", True))
+
+def parse(text):
+    ast = Parser().parse(FastScanner().tokenize(text))
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        TypeChecker().visit(ast)
+    return ast
+
+def matrices(size, useArrays):
+    ast = parse(f"D = ones({size});\nE = ones({size});")
+    interpreter = Interpreter(useArrays=useArrays)
+    interpreter.scopes.reserve(Resolver().resolve(ast))
+    interpreter.visit(ast)
+    return interpreter, interpreter.scopes.get(0), interpreter.scopes.get(1)
+
+def copying():
+    # makes compound assignments calculate a new value, which is what they did for every shape before
+    saved = Interpreter.updateRange
+    Interpreter.updateRange = lambda self, variable, indexRange, action, variableInfo, valueInfo: False
+    return saved
+
+def restore(saved):
+    Interpreter.updateRange = saved
+
+def best(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def measure(function, repeat):
+    # bytes allocated at the peak of one call, and the best time of a few calls
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, best(function, repeat)
+
+def compoundTimings(size, useArrays, repeat):
+    interpreter, matrix, other = matrices(size, useArrays)
+    half = size // 2
+    index = lambda variable, name, indexes: interpreter.indexValue(variable, name, VectorValue("integer", 2, indexes), 1)
+    block = index(other, "E", [slice(0, half), slice(0, half)])
+    column = index(other, "E", [":", 0])
+    statements = {
+        "D += E": lambda: interpreter.assign(0, "D", False, "+=", interpreter.scopes.get(0), other, 1),
+        "D[a:b, c:d] += X": lambda: interpreter.assignIndexed(matrix, "+=", index(matrix, "D", [slice(half, size), slice(half, size)]), block, 1),
+        "D[:, j] += v": lambda: interpreter.assignIndexed(matrix, "+=", index(matrix, "D", [":", 1]), column, 1),
+    }
+    return {name: measure(statement, repeat) for name, statement in statements.items()}
+
+def accumulation(size, iterations):
+    half = size // 2
+    return (f"D = zeros({size});\nE = ones({size});\nfor k = 1:{iterations} {{\n    D += E;\n"
+            f"    D[0:{half}, 0:{half}] -= E[{half}:{2 * half}, {half}:{2 * half}];\n    D[:, 0] += E[:, 1];\n}}\nprint D[0, 0];")
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--size", type=int, default=500)
+    argParser.add_argument("--iterations", type=int, default=20)
+    argParser.add_argument("--repeat", type=int, default=3)
+    args = argParser.parse_args()
+
+    print(f"{args.size} x {args.size} matrix, KiB allocated at the peak and ms per assignment, new value -> in place")
+    for storage, useArrays in storages:
+        inPlace = compoundTimings(args.size, useArrays, args.repeat)
+        saved = copying()
+        newValue = compoundTimings(args.size, useArrays, args.repeat)
+        restore(saved)
+        for name in inPlace:
+            (oldPeak, oldTime), (peak, seconds) = newValue[name], inPlace[name]
+            print(f"  {storage:<6} {name:<18} {oldPeak / 1024:10.1f} -> {peak / 1024:8.1f} KiB {oldTime * 1000:10.2f} -> {seconds * 1000:8.2f} ms")
+
+    print(f"accumulating {args.iterations} times, ms")
+    ast = parse(accumulation(args.size, args.iterations))
+    for backend in ("tree", "vm"):
+        compiled = compileFor(backend, ast)
+        for storage, useArrays in storages:
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                inPlace = best(lambda: execute(backend, useArrays, compiled), args.repeat)
+                saved = copying()
+                newValue = best(lambda: execute(backend, useArrays, compiled), args.repeat)
+                restore(saved)
+            print(f"  {backend:<4} {storage:<6} {newValue * 1000:10.1f} -> {inPlace * 1000:8.1f}   {newValue / inPlace:6.1f}x")
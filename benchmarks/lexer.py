@@ -0,0 +1,102 @@
+# checks that FastScanner, reading the whole text or a stream of chunks, produces exactly the tokens, diagnostics
+# and final line number of the sly Scanner on every sample program, then times both on a multi-megabyte input:
+#   python benchmarks/lexer.py --megabytes 4
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+from io import StringIO
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from scanner import Scanner, FastScanner
+
+def samples():
+    paths = sorted(glob.glob(os.path.join(root, "real-programs", "*")) + glob.glob(os.path.join(root, "test-programs", "*")))
+    for path in paths:
+        with open(path, "r") as file:
+            yield os.path.relpath(path, root), file.read()
+    # what the sample programs do not contain: illegal characters, keywords inside names, numbers next to names
+    yield "<edge cases>", "a = 1.5e3 + .5 - 3. ;\n\n# comment $\nif_x = $x @ 2e;\r\nb = \"s # t\";\t'x' !== .+.-"
+    yield "<quotes>", 'x = "a\nb"; y = ""; z = "" "c" "\n$ "; w = "unterminated $\n y = 1;\n'
+
+def tokens(scanner, text, chunkSize=None):
+    output = StringIO()
+    with redirect_stdout(output):
+        tokenStream = scanner.tokenize(text) if chunkSize is None else scanner.tokenizeFile(StringIO(text), chunkSize)
+        stream = [(token.type, token.value, token.lineno, token.index, token.end) for token in tokenStream]
+    return stream, output.getvalue(), scanner.lineno
+
+def check():
+    # the streaming tokenizer is checked with chunks small enough to split every kind of lexeme
+    mismatches = 0
+    for name, text in samples():
+        expected = tokens(Scanner(), text)
+        for chunkSize in (None, 1, 2, 3, 5, 64):
+            if tokens(FastScanner(), text, chunkSize) != expected:
+                mismatches += 1
+                print(f"{name}: the scanners differ" + (f" with chunks of {chunkSize}" if chunkSize else ""), file=sys.stderr)
+    return mismatches
+
+def timeScanner(scannerClass, text, repeat):
+    timings = []
+    for _ in range(repeat):
+        scanner = scannerClass()
+        start = time.perf_counter()
+        for _ in scanner.tokenize(text):
+            pass
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def peakMemory(path, stream):
+    # maximum resident set size in MB of a fresh process that tokenizes the file whole or chunk by chunk (Linux only)
+    code = "\n".join([
+        "import sys",
+        f"sys.path.insert(0, {root!r})",
+        "from scanner import FastScanner",
+        f"file = open({path!r}, 'r')",
+        f"tokens = FastScanner().tokenizeFile(file) if {stream} else FastScanner().tokenize(file.read())",
+        "for _ in tokens: pass",
+        # unlike ru_maxrss, which Linux carries over from the parent across exec, VmHWM starts anew
+        "print(next(int(line.split()[1]) for line in open('/proc/self/status') if line.startswith('VmHWM')) / 1024)",
+    ])
+    return float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--megabytes", type=float, default=4.0, help="size of the timed input")
+    argParser.add_argument("--repeat", type=int, default=3)
+    args = argParser.parse_args()
+
+    mismatches = check()
+    if mismatches:
+        sys.exit(f"{mismatches} inputs are tokenized differently")
+    print("both scanners produce the same tokens on every sample")
+
+    # concatenated programs without their illegal characters, which would print a message each
+    programs = [text for name, text in samples() if name.startswith("real-programs")]
+    unit = "\n".join(programs) + "\n"
+    text = unit * max(1, int(args.megabytes * 1024 * 1024 / len(unit)))
+    count = sum(1 for _ in FastScanner().tokenize(text))
+    print(f"input of {len(text) / 1024 / 1024:.1f} MB, {count} tokens")
+    slow = timeScanner(Scanner, text, args.repeat)
+    fast = timeScanner(FastScanner, text, args.repeat)
+    print(f"Scanner      {slow:7.3f} s   {count / slow / 1e6:5.2f} M tokens/s")
+    print(f"FastScanner  {fast:7.3f} s   {count / fast / 1e6:5.2f} M tokens/s   {slow / fast:.2f}x")
+
+    with tempfile.NamedTemporaryFile("w", suffix=".m") as file:
+        file.write(text)
+        file.flush()
+        start = time.perf_counter()
+        with open(file.name, "r") as streamed:
+            for _ in FastScanner().tokenizeFile(streamed):
+                pass
+        print(f"FastScanner.tokenizeFile {time.perf_counter() - start:7.3f} s")
+        print(f"peak memory of tokenizing the file: read whole {peakMemory(file.name, False):.0f} MB, "
+              f"streamed {peakMemory(file.name, True):.0f} MB")
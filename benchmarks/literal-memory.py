@@ -0,0 +1,70 @@
+# memory of a script with a large literal matrix: the AST kept after parsing, the peak while parsing and the
+# peak of type checking and running it, with the values packed into arrays and as chains of ValueList nodes:
+#   python benchmarks/literal-memory.py --rows 200 --columns 500
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import parser
+from scanner import FastScanner
+from TypeChecker import TypeChecker
+from Interpreter import Interpreter
+from Resolver import Resolver
+
+def literalMatrix(rows, columns):
+    lines = ["A = ["]
+    for row in range(rows):
+        values = ", ".join(str(row * columns + column) for column in range(columns))
+        lines.append(f"    [{values}]" + ("," if row < rows - 1 else ""))
+    lines.append("];")
+    lines.append("print A[0, 0] + A[%d, %d];" % (rows - 1, columns - 1))
+    return "\n".join(lines)
+
+def measure(text):
+    results = {}
+    tokens = list(FastScanner().tokenize(text))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    ast = parser.Parser().parse(iter(tokens))
+    results["parse seconds"] = time.perf_counter() - start
+    results["AST MB"], results["parse peak MB"] = (size / 1024 / 1024 for size in tracemalloc.get_traced_memory())
+
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    TypeChecker().visit(ast)
+    results["typecheck peak MB"] = (tracemalloc.get_traced_memory()[1] - before) / 1024 / 1024
+
+    interpreter = Interpreter(useArrays=False)
+    interpreter.scopes.reserve(Resolver().resolve(ast))
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        interpreter.visit(ast)
+    results["run peak MB"] = (tracemalloc.get_traced_memory()[1] - before) / 1024 / 1024
+    tracemalloc.stop()
+    return results
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--rows", type=int, default=200)
+    argParser.add_argument("--columns", type=int, default=500)
+    args = argParser.parse_args()
+
+    text = literalMatrix(args.rows, args.columns)
+    print(f"{args.rows} x {args.columns} literal matrix, {len(text) / 1024 / 1024:.1f} MB of source")
+    packed = measure(text)
+    parser.packedTypes = {} # every row becomes a chain of ValueList nodes again,
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * args.columns + 10 * args.rows)) # which visitors recurse along
+    chained = measure(text)
+    print(f"{'':<20} {'packed':>10} {'chained':>10}")
+    for name in packed:
+        print(f"{name:<20} {packed[name]:>10.2f} {chained[name]:>10.2f}")
+    print(f"AST bytes per element: packed {packed['AST MB'] * 1024 * 1024 / (args.rows * args.columns):.1f}, "
+          f"chained {chained['AST MB'] * 1024 * 1024 / (args.rows * args.columns):.1f}")
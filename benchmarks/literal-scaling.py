@@ -0,0 +1,60 @@
+# time to check and evaluate literals that are not packed into arrays (a vector of negated numbers and a matrix of
+# many rows) for growing sizes; construction is linear when the time per element stays flat, and the growth exponent
+# between the smallest and the largest size is close to 1:
+#   python benchmarks/literal-scaling.py --sizes 1000 2000 4000 8000 16000
+import os
+import sys
+import math
+import time
+import argparse
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from scanner import FastScanner
+from parser import Parser
+from TypeChecker import TypeChecker
+from suite import compileFor, execute
+
+def vectorLiteral(size):
+    # negated numbers are expressions, so the values stay a chain of ValueList nodes
+    return "v = [" + ", ".join(f"-{k}" for k in range(size)) + "];\nprint v[0];"
+
+def matrixLiteral(size):
+    return "M = [" + ", ".join(f"[{k}, {k + 1}]" for k in range(size)) + "];\nprint M[0, 0];"
+
+literals = [("vector", vectorLiteral), ("matrix", matrixLiteral)]
+phases = ["typecheck", "tree", "vm"]
+
+def timePhases(text, repeat):
+    ast = Parser().parse(FastScanner().tokenize(text))
+    compiled = {backend: compileFor(backend, ast) for backend in ("tree", "vm")}
+    timings = dict.fromkeys(phases, math.inf)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            TypeChecker().visit(ast)
+            timings["typecheck"] = min(timings["typecheck"], time.perf_counter() - start)
+            for backend in ("tree", "vm"):
+                start = time.perf_counter()
+                execute(backend, False, compiled[backend])
+                timings[backend] = min(timings[backend], time.perf_counter() - start)
+    return timings
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 4000, 8000, 16000])
+    argParser.add_argument("--repeat", type=int, default=3)
+    args = argParser.parse_args()
+
+    for name, generate in literals:
+        print(f"{name} literal, µs per element")
+        print(f"{'elements':>10} " + " ".join(f"{phase:>10}" for phase in phases))
+        results = {}
+        for size in args.sizes:
+            results[size] = timePhases(generate(size), args.repeat)
+            print(f"{size:>10} " + " ".join(f"{results[size][phase] / size * 1e6:>10.2f}" for phase in phases))
+        smallest, largest = min(args.sizes), max(args.sizes)
+        exponents = [math.log(results[largest][phase] / results[smallest][phase]) / math.log(largest / smallest) for phase in phases]
+        print(f"{'exponent':>10} " + " ".join(f"{exponent:>10.2f}" for exponent in exponents))
@@ -0,0 +1,101 @@
+# cost per element of reading and writing a block D[a:b, c:d] of a square matrix kept in lists and in NumPy arrays,
+# with the slice assignments of assignListRange and assignArrayRange against setting the elements one by one
+# through the index generator, then of a program copying blocks in a loop on the tree walker and the virtual machine:
+#   python benchmarks/slices.py --size 1000 --iterations 20
+import os
+import sys
+import time
+import argparse
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import Interpreter as interpreterModule
+from scanner import FastScanner
+from parser import Parser
+from TypeChecker import TypeChecker
+from Interpreter import Interpreter, VectorValue, ScalarValue
+from Resolver import Resolver
+from suite import compileFor, execute
+
+storages = (("list", False), ("numpy", True))
+
+def parse(text):
+    ast = Parser().parse(FastScanner().tokenize(text))
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        TypeChecker().visit(ast)
+    return ast
+
+def matrices(size, useArrays):
+    ast = parse(f"D = ones({size});\nE = zeros({size});")
+    interpreter = Interpreter(useArrays=useArrays)
+    interpreter.scopes.reserve(Resolver().resolve(ast))
+    interpreter.visit(ast)
+    return interpreter, interpreter.scopes.get(0), interpreter.scopes.get(1)
+
+def best(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def elementByElement():
+    # makes assignIndexed fall back to the index generator, which is what it did for every shape before
+    saved = interpreterModule.assignListRange, interpreterModule.assignArrayRange
+    interpreterModule.assignListRange = interpreterModule.assignArrayRange = lambda variable, indexRange, valueInfo: False
+    return saved
+
+def restore(saved):
+    interpreterModule.assignListRange, interpreterModule.assignArrayRange = saved
+
+def blockTimings(size, useArrays, repeat):
+    interpreter, matrix, other = matrices(size, useArrays)
+    half = size // 2
+    block = interpreter.indexValue(matrix, "D", VectorValue("integer", 2, [slice(0, half), slice(half, size)]), 1)
+    values = {
+        "scalar": ScalarValue("integer", 7),
+        "row": interpreter.indexValue(other, "E", VectorValue("integer", 2, [0, slice(0, half)]), 1),
+        "block": interpreter.indexValue(other, "E", VectorValue("integer", 2, [slice(half, size), slice(0, half)]), 1),
+    }
+    elements = half * (size - half)
+    timings = {"read": best(lambda: interpreter.indexValue(matrix, "D", VectorValue("integer", 2, [slice(0, half), slice(half, size)]), 1).content, repeat)}
+    for name, valueInfo in values.items():
+        timings[name] = best(lambda: interpreter.assignIndexed(matrix, "=", block, valueInfo, 1), repeat)
+    return {name: seconds / elements * 1e9 for name, seconds in timings.items()}
+
+def blockCopies(size, iterations):
+    half = size // 2
+    return f"D = ones({size});\nfor k = 1:{iterations} {{\n    D[0:{half}, 0:{half}] = D[{half}:{2 * half}, {half}:{2 * half}];\n}}\nprint D[0, 0];"
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--size", type=int, default=1000)
+    argParser.add_argument("--iterations", type=int, default=20)
+    argParser.add_argument("--repeat", type=int, default=3)
+    args = argParser.parse_args()
+
+    kinds = ["read", "scalar", "row", "block"]
+    print(f"{args.size // 2} x {args.size - args.size // 2} block of a {args.size} x {args.size} matrix, ns per element")
+    print(f"{'':<24} " + " ".join(f"{kind:>8}" for kind in kinds))
+    for storage, useArrays in storages:
+        sliced = blockTimings(args.size, useArrays, args.repeat)
+        saved = elementByElement()
+        single = blockTimings(args.size, useArrays, args.repeat)
+        restore(saved)
+        print(f"{storage + ', sliced':<24} " + " ".join(f"{sliced[kind]:>8.1f}" for kind in kinds))
+        print(f"{storage + ', element by element':<24} " + " ".join(f"{single[kind]:>8.1f}" for kind in kinds))
+
+    print(f"copying a block {args.iterations} times, ms")
+    ast = parse(blockCopies(args.size, args.iterations))
+    for backend in ("tree", "vm"):
+        compiled = compileFor(backend, ast)
+        for storage, useArrays in storages:
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                sliced = best(lambda: execute(backend, useArrays, compiled), args.repeat)
+                saved = elementByElement()
+                single = best(lambda: execute(backend, useArrays, compiled), args.repeat)
+                restore(saved)
+            print(f"  {backend:<4} {storage:<6} {single * 1000:10.1f} -> {sliced * 1000:8.1f}   {single / sliced:6.1f}x")
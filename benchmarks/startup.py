@@ -0,0 +1,27 @@
+# startup cost of the parser: loading the tables generated by `python parser.py` against building them with sly
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+cases = [
+    ("interpreter start", "pass"),
+    ("precomputed tables", "import parser"),
+    ("tables built by sly", "import sys; sys.modules['parsetab'] = None; import parser"),
+]
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--runs", type=int, default=20)
+    args = argParser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for name, code in cases:
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{name:<22} median {statistics.median(timings):7.1f} ms   min {min(timings):7.1f} ms")
@@ -0,0 +1,255 @@
+# times the lex, parse, typecheck, compile and execute phases of real-programs/ and of synthetic scaled-up
+# programs, writes the results as JSON and compares them with a baseline written by an earlier run:
+#   python benchmarks/suite.py --output baseline.json
+#   python benchmarks/suite.py --baseline baseline.json --threshold 10
+import os
+import gc
+import sys
+import glob
+import json
+import math
+import time
+import argparse
+import platform
+import statistics
+import tracemalloc
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from scanner import FastScanner
+from parser import Parser
+from TypeChecker import TypeChecker, ErrorType
+from Interpreter import Interpreter, numpy
+from Compiler import Compiler
+from VirtualMachine import VirtualMachine
+from ClosureCompiler import ClosureCompiler
+from PythonGenerator import PythonGenerator, PythonRuntime
+from Resolver import Resolver
+
+phases = ["lex", "parse", "typecheck", "compile", "execute"]
+
+def bigMatrix(scale):
+    n = 40 * scale
+    return "\n".join([
+        f"N = {n};",
+        "A = zeros(N);",
+        "for i = 0:N-1 {",
+        "    for j = 0:N-1 {",
+        "        A[i, j] = i * N + j;",
+        "    }",
+        "}",
+        "B = A' .* A .+ eye(N);",
+        "C = (B .- A) ./ ones(N);",
+        "print C[N - 1, N - 1];",
+    ])
+
+def longLoop(scale):
+    return "\n".join([
+        "s = 0;",
+        "k = 0;",
+        f"while (k < {10000 * scale}) {{",
+        "    k += 1;",
+        "    if (k > 10) {",
+        "        s += k * 2 - 1;",
+        "    } else {",
+        "        s -= 1;",
+        "    }",
+        "}",
+        "print s;",
+    ])
+
+def deepNesting(scale):
+    # nested loops around a chain of nested ifs; the depth grows with the scale, the iterations stay the same
+    depth = 8 * scale
+    lines = ["s = 0;"]
+    for level in range(4):
+        lines.append("    " * level + f"for i{level} = 1:6 {{")
+    for level in range(depth):
+        lines.append("    " * (4 + level) + f"if (i0 + {level} > 0) {{")
+    lines.append("    " * (4 + depth) + "s += 1;")
+    for level in reversed(range(4 + depth)):
+        lines.append("    " * level + "}")
+    lines.append("print s;")
+    return "\n".join(lines)
+
+synthetic = [("big-matrix", bigMatrix), ("long-loop", longLoop), ("deep-nesting", deepNesting)]
+
+def programs(scale):
+    for path in sorted(glob.glob(os.path.join(root, "real-programs", "*.m"))):
+        with open(path, "r") as file:
+            yield os.path.basename(path), file.read()
+    for name, generate in synthetic:
+        yield f"{name}-x{scale}", generate(scale)
+
+def compileFor(backend, ast):
+    frameSize = Resolver().resolve(ast)
+    if backend == "vm":
+        return frameSize, Compiler().compile(ast)
+    if backend == "python":
+        return frameSize, PythonGenerator().generate(ast)
+    return frameSize, ast
+
+def execute(backend, useArrays, compiled):
+    frameSize, program = compiled
+    interpreter = Interpreter(useArrays=useArrays)
+    interpreter.scopes.reserve(frameSize)
+    try:
+        if backend == "vm":
+            VirtualMachine(interpreter).run(program)
+        elif backend == "python":
+            pythonRuntime = PythonRuntime(interpreter)
+            pythonRuntime.run(pythonRuntime.load(program, "<benchmark>"))
+        elif backend == "closure":
+            closureCompiler = ClosureCompiler(interpreter)
+            closureCompiler.run(closureCompiler.compile(program))
+        else:
+            interpreter.visit(program)
+    except SystemExit: # a runtime error ends the program, which is a valid benchmark too
+        pass
+
+def runPhases(text, args, record):
+    # record(phase, function) runs one phase and returns its result
+    tokens = record("lex", lambda: list(FastScanner().tokenize(text)))
+    ast = record("parse", lambda: Parser().parse(iter(tokens)))
+    if ast is None:
+        raise ValueError("syntax error")
+    if isinstance(record("typecheck", lambda: TypeChecker().visit(ast)), ErrorType):
+        raise ValueError("type error")
+    compiled = record("compile", lambda: compileFor(args.backend, ast))
+    record("execute", lambda: execute(args.backend, args.storage == "numpy", compiled))
+
+def timePhases(text, args):
+    timings = {}
+
+    def record(phase, function):
+        start = time.perf_counter()
+        result = function()
+        timings[phase] = time.perf_counter() - start
+        return result
+
+    runPhases(text, args, record)
+    return timings
+
+def peakMemory(text, args):
+    # a separate traced run, tracing slows everything down too much to be timed at the same time
+    peaks = {}
+
+    def record(phase, function):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = function()
+        peaks[phase] = tracemalloc.get_traced_memory()[1] - before
+        return result
+
+    tracemalloc.start()
+    try:
+        runPhases(text, args, record)
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+def percentile(samples, fraction):
+    # nearest-rank percentile
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+def benchmark(text, args):
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for _ in range(args.warmup):
+            timePhases(text, args)
+        samples = []
+        for _ in range(args.repeat):
+            gc.collect()
+            samples.append(timePhases(text, args))
+        peaks = peakMemory(text, args)
+
+    results = {}
+    for phase in phases:
+        timings = [sample[phase] for sample in samples]
+        results[phase] = {
+            "median": statistics.median(timings),
+            "p95": percentile(timings, 0.95),
+            "peakBytes": peaks[phase],
+        }
+    results["total"] = {
+        "median": statistics.median(sum(sample.values()) for sample in samples),
+        "p95": percentile([sum(sample.values()) for sample in samples], 0.95),
+        "peakBytes": max(peaks.values()),
+    }
+    return results
+
+def compare(results, baseline, threshold, minSeconds):
+    # a phase regresses when its median is more than threshold percent slower than in the baseline;
+    # phases faster than minSeconds in the baseline are shown but too noisy to be judged
+    regressions = []
+    print(f"{'benchmark':<22} {'phase':<10} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, current in results["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            continue
+        for phase, stats in current.items():
+            if phase not in previous:
+                continue
+            before, after = previous[phase]["median"], stats["median"]
+            change = (after - before) / before * 100 if before > 0 else 0.0
+            judged = before >= minSeconds
+            marker = "  REGRESSION" if judged and change > threshold else ""
+            if marker:
+                regressions.append((name, phase, change))
+            print(f"{name:<22} {phase:<10} {before * 1000:8.2f}ms {after * 1000:8.2f}ms {change:+7.1f}%{marker}")
+    return regressions
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser(description="time every phase of the benchmark programs")
+    argParser.add_argument("--backend", choices=["tree", "vm", "closure", "python"], default="tree")
+    argParser.add_argument("--storage", choices=["numpy", "list"], default="numpy" if numpy is not None else "list")
+    argParser.add_argument("--repeat", type=int, default=5, help="timed runs of every benchmark")
+    argParser.add_argument("--warmup", type=int, default=1, help="untimed runs before the timed ones")
+    argParser.add_argument("--scale", type=int, default=1, help="size multiplier of the synthetic programs")
+    argParser.add_argument("--only", default=None, help="run only the benchmarks whose name contains this")
+    argParser.add_argument("--output", default=None, help="file the JSON results are written to")
+    argParser.add_argument("--baseline", default=None, help="JSON results of an earlier run to compare with")
+    argParser.add_argument("--threshold", type=float, default=10.0,
+                           help="slowdown of a median in percent reported as a regression")
+    argParser.add_argument("--min-seconds", type=float, default=0.001,
+                           help="baseline medians below this are not judged")
+    args = argParser.parse_args()
+
+    if args.storage == "numpy" and numpy is None:
+        argParser.error("--storage numpy requires NumPy to be installed")
+    if args.repeat < 1:
+        argParser.error("--repeat must be at least 1")
+
+    results = {
+        "python": platform.python_version(),
+        "backend": args.backend,
+        "storage": args.storage,
+        "repeat": args.repeat,
+        "scale": args.scale,
+        "benchmarks": {},
+    }
+    for name, text in programs(args.scale):
+        if args.only is not None and args.only not in name:
+            continue
+        results["benchmarks"][name] = stats = benchmark(text, args)
+        total = stats["total"]
+        print(f"{name:<22} median {total['median'] * 1000:9.2f} ms   p95 {total['p95'] * 1000:9.2f} ms   "
+              f"peak {total['peakBytes'] / 1024:9.1f} KiB", file=sys.stderr)
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        if (baseline.get("backend"), baseline.get("storage")) != (args.backend, args.storage):
+            print(f"warning: the baseline was measured with --backend {baseline.get('backend')} "
+                  f"--storage {baseline.get('storage')}", file=sys.stderr)
+        regressions = compare(results, baseline, args.threshold, args.min_seconds)
+        if regressions:
+            print(f"{len(regressions)} regressions above {args.threshold}%", file=sys.stderr)
+            sys.exit(1)
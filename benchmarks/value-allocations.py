@@ -0,0 +1,82 @@
+# runtime values made in every loop iteration of real-programs/pi.m on every backend and the bytes they take,
+# the size of each value class being measured with tracemalloc:
+#   python benchmarks/value-allocations.py --iterations 20000
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from scanner import FastScanner
+from parser import Parser
+from TypeChecker import TypeChecker
+from Interpreter import ScalarValue, VectorValue, MatrixValue, RangeValue
+from suite import compileFor, execute
+
+valueClasses = {
+    "ScalarValue": (ScalarValue, lambda: ScalarValue("float", 1.5)),
+    "VectorValue": (VectorValue, lambda: VectorValue("float", 2, None)),
+    "MatrixValue": (MatrixValue, lambda: MatrixValue("float", 2, 2, None)),
+    "RangeValue": (RangeValue, lambda: RangeValue(1, 2)),
+}
+made = dict.fromkeys(valueClasses, 0)
+
+def countInstances(name, valueClass):
+    # wraps the constructor of the class itself, constructors of base classes are not counted again
+    constructor = valueClass.__init__
+
+    def counted(self, *args, **kw):
+        made[name] += 1
+        constructor(self, *args, **kw)
+    valueClass.__init__ = counted
+
+def instanceBytes(make, count=10000):
+    tracemalloc.start()
+    values = [None] * count
+    before = tracemalloc.get_traced_memory()[0]
+    for idx in range(count):
+        values[idx] = make()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size / count
+
+def piProgram(iterations):
+    with open(os.path.join(root, "real-programs", "pi.m"), "r") as file:
+        return file.read().replace("100000", str(iterations))
+
+def run(backend, iterations):
+    ast = Parser().parse(FastScanner().tokenize(piProgram(iterations)))
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        TypeChecker().visit(ast)
+        compiled = compileFor(backend, ast)
+        for name in made:
+            made[name] = 0
+        start = time.perf_counter()
+        execute(backend, False, compiled)
+        seconds = time.perf_counter() - start
+    return dict(made), seconds
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--iterations", type=int, default=20000)
+    args = argParser.parse_args()
+
+    sizes = {name: instanceBytes(make) for name, (_, make) in valueClasses.items()}
+    print("bytes per instance: " + ", ".join(f"{name} {size:.0f}" for name, size in sizes.items()))
+    for name, (valueClass, _) in valueClasses.items():
+        countInstances(name, valueClass)
+
+    print(f"{'backend':<10} {'values/iteration':>17} {'bytes/iteration':>16} {'µs/iteration':>13}")
+    for backend in ("tree", "vm", "closure", "python"):
+        # the difference of two runs leaves out what is made once, outside of the loop
+        few, fewSeconds = run(backend, args.iterations)
+        many, manySeconds = run(backend, 2 * args.iterations)
+        perIteration = {name: (many[name] - few[name]) / args.iterations for name in made}
+        values = sum(perIteration.values())
+        size = sum(count * sizes[name] for name, count in perIteration.items())
+        microseconds = (manySeconds - fewSeconds) / args.iterations * 1e6
+        print(f"{backend:<10} {values:>17.2f} {size:>16.0f} {microseconds:>13.2f}")
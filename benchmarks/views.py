@@ -0,0 +1,84 @@
+# cost of indexing a row, a column and the whole of a tall matrix kept in lists and in NumPy arrays, then of
+# programs that copy and add columns of it in a loop on the tree walker and the virtual machine:
+#   python benchmarks/views.py --rows 10000 --iterations 50
+import os
+import sys
+import time
+import argparse
+from contextlib import redirect_stdout
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from scanner import FastScanner
+from parser import Parser
+from TypeChecker import TypeChecker
+from Interpreter import Interpreter, VectorValue, ScalarValue
+from Resolver import Resolver
+from suite import compileFor, execute
+
+indexes = {
+    "D[:, 1]": VectorValue("integer", 2, [":", 1]),
+    "D[1, :]": VectorValue("integer", 2, [1, ":"]),
+    "D[1]": ScalarValue("integer", 1),
+    "D[:]": ScalarValue("integer", ":"),
+}
+
+def parse(text):
+    ast = Parser().parse(FastScanner().tokenize(text))
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        TypeChecker().visit(ast)
+    return ast
+
+def tallMatrix(rows, useArrays):
+    ast = parse(f"D = ones([{rows}, 4]);")
+    interpreter = Interpreter(useArrays=useArrays)
+    interpreter.scopes.reserve(Resolver().resolve(ast))
+    interpreter.visit(ast)
+    return interpreter, interpreter.scopes.get(0)
+
+def best(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def perRead(interpreter, matrix, index, repeat, count):
+    def read():
+        for _ in range(count):
+            interpreter.indexValue(matrix, "D", index, 1)
+    return best(read, repeat) / count * 1e6
+
+def columnPrograms(rows, iterations):
+    return [
+        ("copy a column", f"D = ones([{rows}, 4]);\nfor k = 1:{iterations} {{\n    D[:, 0] = D[:, 1];\n}}\nprint D[0, 0];"),
+        ("add two columns", f"D = ones([{rows}, 4]);\nfor k = 1:{iterations} {{\n    D[:, 0] += D[:, 1] .+ D[:, 2];\n}}\nprint D[0, 0];"),
+    ]
+
+if __name__ == "__main__":
+    argParser = argparse.ArgumentParser()
+    argParser.add_argument("--rows", type=int, default=10000)
+    argParser.add_argument("--iterations", type=int, default=50)
+    argParser.add_argument("--reads", type=int, default=1000)
+    argParser.add_argument("--repeat", type=int, default=3)
+    args = argParser.parse_args()
+
+    print(f"{args.rows} x 4 matrix, µs per read")
+    print(f"{'':<10} " + " ".join(f"{name:>10}" for name in indexes))
+    for storage, useArrays in (("list", False), ("numpy", True)):
+        interpreter, matrix = tallMatrix(args.rows, useArrays)
+        print(f"{storage:<10} " + " ".join(f"{perRead(interpreter, matrix, index, args.repeat, args.reads):>10.2f}" for index in indexes.values()))
+
+    print(f"programs of {args.iterations} iterations, ms")
+    print(f"{'':<16} " + " ".join(f"{backend + ' ' + storage:>12}" for backend in ("tree", "vm") for storage in ("list", "numpy")))
+    for name, text in columnPrograms(args.rows, args.iterations):
+        ast = parse(text)
+        timings = []
+        for backend in ("tree", "vm"):
+            compiled = compileFor(backend, ast)
+            for useArrays in (False, True):
+                with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                    timings.append(best(lambda: execute(backend, useArrays, compiled), args.repeat) * 1000)
+        print(f"{name:<16} " + " ".join(f"{timing:>12.1f}" for timing in timings))
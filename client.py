@@ -0,0 +1,42 @@
+# thin client of Daemon.py: `python client.py [main.py options] file.m` prints what `python main.py ...` would,
+# a file name of - sends the program text read from standard input
+import os
+import sys
+import marshal
+import socket
+
+def defaultSocketPath():
+    if "COMPILER_THEORY_SOCKET" in os.environ:
+        return os.environ["COMPILER_THEORY_SOCKET"]
+    directory = os.environ.get("XDG_RUNTIME_DIR", os.environ.get("TMPDIR", "/tmp"))
+    return os.path.join(directory, f"compiler-theory-{os.getuid()}.sock")
+
+def receiveAll(connection):
+    chunks = []
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+def request(argv, source=None, socketPath=None):
+    # messages are marshalled dicts: both ends are the same local Python and marshal needs no imports
+    message = {"argv": argv, "cwd": os.getcwd()}
+    if source is not None:
+        message["source"] = source
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socketPath if socketPath is not None else defaultSocketPath())
+        connection.sendall(marshal.dumps(message))
+        connection.shutdown(socket.SHUT_WR)
+        return marshal.loads(receiveAll(connection))
+
+if __name__ == '__main__':
+    argv = sys.argv[1:]
+    source = sys.stdin.read() if "-" in argv else None
+    try:
+        response = request(argv, source)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sys.exit(f"No daemon is listening on {defaultSocketPath()}, start it with `python Daemon.py`")
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["status"])
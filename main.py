@@ -1,25 +1,31 @@
 import sys
-from scanner import Scanner
-from parser import Parser
+import argparse
+import traceback
+from io import StringIO
+from contextlib import redirect_stdout, redirect_stderr
 from TreePrinter import TreePrinter
 from TypeChecker import TypeChecker, ErrorType
-from Interpreter import Interpreter
+from Interpreter import Interpreter, numpy
+from Compiler import Compiler, disassemble
+from VirtualMachine import VirtualMachine
+from ClosureCompiler import ClosureCompiler
+from PythonGenerator import PythonGenerator, PythonRuntime, compiles
+from Resolver import Resolver
+from Optimizer import Optimizer
+from Cache import Cache
+from Profiler import Profiler
 
-if __name__ == '__main__':
-    try:
-        filename = sys.argv[1] if len(sys.argv) > 1 else "example.txt"
-        file = open(filename, "r")
-    except IOError:
-        print("Cannot open {0} file".format(filename))
-        sys.exit(0)
+def checkProgram(text, optimize=False):
+    # text is the program, or a file it is lexed from chunk by chunk without reading it whole;
+    # the parser module builds its tables when imported, so it is only loaded when there is something to parse
+    from scanner import FastScanner
+    from parser import Parser
 
-    text = file.read()
-    lexer = Scanner()
+    lexer = FastScanner()
     parser = Parser()
     typeChecker = TypeChecker()
-    interpreter = Interpreter()
 
-    ast = parser.parse(lexer.tokenize(text))
+    ast = parser.parse(lexer.tokenize(text) if isinstance(text, str) else lexer.tokenizeFile(text))
 
     if ast is None:
         sys.exit("Bledne wejscie! Nie mozna utworzyc AST")
@@ -31,4 +37,174 @@ if __name__ == '__main__':
     if isinstance(typeCheckOutput, ErrorType):
         sys.exit("Wykryto blad podczas analizy programu. Popraw go i wroc tu za moment :)")
 
-    interpreter.visit(ast)
+    if optimize:
+        ast, removedNodes = Optimizer().optimize(ast)
+        print(f"Optimizer removed {removedNodes} AST nodes", file=sys.stderr)
+
+    return ast
+
+def compileProgram(text, kind, optimize=False):
+    # returns the frame size and the program in the form the backend runs: an AST, bytecode or Python source
+    ast = checkProgram(text, optimize)
+    frameSize = Resolver().resolve(ast)
+    if kind == "bytecode":
+        return frameSize, Compiler().compile(ast)
+    if kind == "python":
+        source = PythonGenerator().generate(ast)
+        if compiles(source):
+            return frameSize, source
+        print("Python cannot compile the translated program, it is run by the tree walker", file=sys.stderr)
+    return frameSize, ast
+
+def captured(function, *args):
+    # returns the function's result, the exit status if it stopped the program, and everything it printed
+    stdout, stderr = StringIO(), StringIO()
+    result, status = None, None
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            result = function(*args)
+        except SystemExit as exit:
+            if exit.code is None or isinstance(exit.code, int):
+                status = exit.code or 0
+            else:
+                print(exit.code, file=sys.stderr)
+                status = 1
+        except Exception:
+            traceback.print_exc()
+            status = 1
+    return result, status, stdout.getvalue(), stderr.getvalue()
+
+def argumentParser(prog=None):
+    argParser = argparse.ArgumentParser(prog=prog)
+    argParser.add_argument("filename", nargs="?", default="example.txt")
+    argParser.add_argument("--backend", choices=["tree", "vm", "closure", "python"], default="tree",
+                           help="execute by walking the AST (reference), on the bytecode stack VM, as prebuilt closures or as generated Python code")
+    argParser.add_argument("--dump-bytecode", action="store_true",
+                           help="print the compiled bytecode before running it on the VM")
+    argParser.add_argument("--dump-python", action="store_true",
+                           help="print the generated Python code before running it")
+    argParser.add_argument("--optimize", action="store_true",
+                           help="fold constant expressions, drop neutral operands and dead if branches before running")
+    argParser.add_argument("--storage", choices=["numpy", "list"], default="numpy" if numpy is not None else "list",
+                           help="keep numeric vectors and matrices in NumPy arrays or in nested Python lists; with lists the "
+                                "matrix product * runs in Python and is many times slower on large matrices")
+    argParser.add_argument("--profile", action="store_true",
+                           help="time every node the tree walker visits and print the hottest source lines and node types at exit")
+    argParser.add_argument("--profile-top", type=int, default=20,
+                           help="number of source lines in the profile (default: 20)")
+    argParser.add_argument("--profile-stacks", default=None,
+                           help="also write the profile as collapsed stacks for flamegraph.pl or speedscope to this file")
+    argParser.add_argument("--stream", action="store_true",
+                           help="lex the file chunk by chunk while parsing it instead of reading it whole first, implies --no-cache")
+    argParser.add_argument("--no-cache", action="store_true",
+                           help="always lex, parse and check the program instead of using the on-disk cache")
+    argParser.add_argument("--cache-dir", default=None,
+                           help="directory of the cache of checked programs (default: $XDG_CACHE_HOME/compiler-theory)")
+    argParser.add_argument("--cache-size", type=int, default=64 * 1024 * 1024,
+                           help="size in bytes above which least recently used cache entries are evicted")
+    return argParser
+
+def programKind(args):
+    if args.backend == "vm" or args.dump_bytecode:
+        return "bytecode"
+    if args.backend == "python" or args.dump_python:
+        return "python"
+    return "ast"
+
+class Transcript(object):
+    # stands in for sys.stdout or sys.stderr, writing to it and recording what was written where, in order
+    def __init__(self, stream, streamName, transcript):
+        self.stream = stream
+        self.streamName = streamName
+        self.transcript = transcript
+
+    def write(self, text):
+        self.transcript.append((self.streamName, text))
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+def loadProgram(args, text, cache=None):
+    # what compiling printed (illegal characters, the Optimizer's report) is kept with the program and printed
+    # again whenever it is loaded from the cache, so a program prints the same whether it was cached or not
+    kind = programKind(args)
+    cacheKey = cache.key(text, kind, args.optimize) if cache is not None else None
+    entry = cache.load(cacheKey) if cache is not None else None
+    if entry is None:
+        transcript = []
+        with redirect_stdout(Transcript(sys.stdout, "stdout", transcript)), redirect_stderr(Transcript(sys.stderr, "stderr", transcript)):
+            compiled = compileProgram(text, kind, args.optimize)
+        if cache is not None:
+            cache.store(cacheKey, (compiled, transcript))
+        return compiled
+    compiled, transcript = entry
+    for streamName, output in transcript:
+        getattr(sys, streamName).write(output)
+    return compiled
+
+def reportProfile(args, profiler, filename):
+    try:
+        with open(filename, "r") as file:
+            sourceLines = file.read().splitlines()
+    except IOError: # the program was read from standard input
+        sourceLines = None
+    sys.stdout.flush()
+    profiler.report(sourceLines, args.profile_top)
+    if args.profile_stacks is not None:
+        with open(args.profile_stacks, "w") as file:
+            profiler.writeStacks(file)
+
+def runProgram(args, compiled, filename):
+    frameSize, program = compiled
+    interpreter = (Profiler if args.profile else Interpreter)(useArrays=args.storage == "numpy")
+    interpreter.scopes.reserve(frameSize)
+    kind = programKind(args)
+
+    if args.profile:
+        try:
+            interpreter.visit(program)
+        finally:
+            reportProfile(args, interpreter, filename)
+        return
+
+    if kind == "bytecode":
+        if args.dump_bytecode:
+            print(disassemble(program))
+        VirtualMachine(interpreter).run(program)
+    elif kind == "python" and isinstance(program, str): # not when the tree walker runs it, see compileProgram
+        if args.dump_python:
+            print(program)
+        pythonRuntime = PythonRuntime(interpreter)
+        pythonRuntime.run(pythonRuntime.load(program, f"<{filename} translated to Python>"))
+    elif args.backend == "closure":
+        closureCompiler = ClosureCompiler(interpreter)
+        closureCompiler.run(closureCompiler.compile(program))
+    else:
+        interpreter.visit(program)
+
+if __name__ == '__main__':
+    argParser = argumentParser()
+    args = argParser.parse_args()
+
+    if args.storage == "numpy" and numpy is None:
+        argParser.error("--storage numpy requires NumPy to be installed")
+    if args.profile and (args.backend != "tree" or programKind(args) != "ast"):
+        argParser.error("--profile instruments the tree walker and works only with --backend tree")
+
+    try:
+        filename = args.filename
+        file = open(filename, "r")
+    except IOError:
+        print("Cannot open {0} file".format(filename))
+        sys.exit(0)
+
+    if args.stream:
+        # the cache is keyed by the whole text, which is what streaming avoids reading
+        with file:
+            compiled = compileProgram(file, programKind(args), args.optimize)
+    else:
+        text = file.read()
+        cache = None if args.no_cache else Cache(args.cache_dir, args.cache_size)
+        compiled = loadProgram(args, text, cache)
+    runProgram(args, compiled, filename)
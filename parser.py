@@ -1,12 +1,37 @@
+import hashlib
+from array import array
+from types import SimpleNamespace
 from sly import Parser as SlyParser
+from sly.yacc import Production, YaccError, _collect_grammar_rules
 from scanner import Scanner
 from AST import *
 
+try:
+    import parsetab
+except ImportError:
+    parsetab = None
+
+packedTypes = {"integer": "q", "float": "d"}
+
+def valueList(exprs):
+    # numeric literals of one type are packed into an array, anything else becomes a chain of ValueList nodes
+    typeOfValue = exprs[0].typeOfValue if isinstance(exprs[0], ValueNode) else None
+    if len(exprs) > 1 and typeOfValue in packedTypes and all(expr.__class__ is ValueNode and expr.typeOfValue == typeOfValue for expr in exprs):
+        try:
+            return PackedValues(array(packedTypes[typeOfValue], [expr.value for expr in exprs]), typeOfValue, lineno=exprs[0].lineno)
+        except OverflowError: # integers beyond 64 bits
+            pass
+    node = None
+    for expr in reversed(exprs):
+        node = ValueList(expr, node, lineno=expr.lineno)
+    return node
+
 class Parser(SlyParser):
 
     tokens = Scanner.tokens
 
-    debugfile = 'parser.out'
+    # set to a file name to get the grammar and LALR tables dumped whenever they are built
+    debugfile = None
 
     precedence = (
         ("right", ",", "]"),
@@ -21,17 +46,68 @@ class Parser(SlyParser):
     def __init__(self):
         self.names = { }
 
+    @classmethod
+    def _build(cls, definitions):
+        # called by sly's metaclass when the class is created; loads the tables generated by
+        # `python parser.py` instead of building them when they were generated from this grammar
+        cls._rules = [(name, value) for name, value in definitions if callable(value) and hasattr(value, "rules")]
+        productions = [(prodname, syms) for _, func in cls._rules for _, _, _, prodname, syms in _collect_grammar_rules(func)]
+        cls._signature = hashlib.sha256(repr((sorted(cls.tokens), cls.precedence, productions)).encode()).hexdigest()
+
+        if parsetab is not None and parsetab.signature == cls._signature:
+            functions = [func for _, func in cls._rules for func, _, _, _, _ in _collect_grammar_rules(func)]
+            cls._grammar = SimpleNamespace(Productions=[
+                Production(number, name, symbols, func=functions[number - 1] if number else None)
+                for number, (name, symbols) in enumerate(parsetab.productions)
+            ])
+            cls._lrtable = SimpleNamespace(lr_action=parsetab.action, lr_goto=parsetab.goto, defaulted_states=parsetab.defaulted)
+            return
+
+        if parsetab is not None:
+            cls.log.warning("parsetab.py was generated from a different grammar, run `python parser.py` to regenerate it")
+        cls.buildTables()
+
+    @classmethod
+    def buildTables(cls):
+        # the steps of sly's own Parser._build, which skips subclasses that define _build
+        if not cls._Parser__validate_specification():
+            raise YaccError("Invalid parser specification")
+        cls._Parser__build_grammar(cls._rules)
+        if not cls._Parser__build_lrtables():
+            raise YaccError("Can't build parsing tables")
+
+        if cls.debugfile:
+            with open(cls.debugfile, "w") as file:
+                file.write(str(cls._grammar))
+                file.write("\n")
+                file.write(str(cls._lrtable))
+            cls.log.info("Parser debugging for %s written to %s", cls.__qualname__, cls.debugfile)
+
+    @classmethod
+    def writeTables(cls, filename):
+        productions = [(production.name, production.prod) for production in cls._grammar.Productions]
+        with open(filename, "w") as file:
+            file.write("# LALR tables of parser.Parser, generated by `python parser.py`, do not edit\n")
+            file.write(f"signature = {cls._signature!r}\n")
+            file.write(f"productions = {productions!r}\n")
+            file.write(f"action = {cls._lrtable.lr_action!r}\n")
+            file.write(f"goto = {cls._lrtable.lr_goto!r}\n")
+            file.write(f"defaulted = {cls._lrtable.defaulted_states!r}\n")
+
+    # sequences are left recursive and collected into Python lists, so their length
+    # is not bounded by the parser stack or by recursion in the visitors
     @_('block')
     def start(self, p):
-        return StartNode(p.block, lineno=p.lineno)
+        return StartNode([p.block], lineno=p.lineno)
 
-    @_('block start')
+    @_('start block')
     def start(self, p):
-        return StartNode(p.block, p.start, lineno=p.lineno)
+        p.start.blocks.append(p.block)
+        return p.start
 
     @_('statement')
     def block(self, p):
-        return Statement(p.statement, lineno=p.lineno)
+        return Statement([p.statement], lineno=p.lineno)
 
     @_('"{" next_statements "}"')
     def block(self, p):
@@ -39,11 +115,12 @@ class Parser(SlyParser):
 
     @_('statement')
     def next_statements(self, p):
-        return Statement(p.statement, lineno=p.lineno)
+        return Statement([p.statement], lineno=p.lineno)
 
-    @_('statement next_statements')
+    @_('next_statements statement')
     def next_statements(self, p):
-        return Statement(p.statement, p.next_statements, lineno=p.lineno)
+        p.next_statements.statements.append(p.statement)
+        return p.next_statements
 
     @_('action_statement ";"', 'flow_control_statement')
     def statement(self, p):
@@ -56,8 +133,9 @@ class Parser(SlyParser):
 
     @_('PRINT values')
     def action_statement(self, p):
-        p.values.weak = True
-        return PrintValue(p.values, lineno=p.lineno)
+        values = valueList(p.values)
+        values.weak = True
+        return PrintValue(values, lineno=p.lineno)
 
     @_('RETURN expr')
     def action_statement(self, p):
@@ -67,33 +145,35 @@ class Parser(SlyParser):
     def action_statement(self, p):
         return LoopControlNode(p[0], lineno=p.lineno)
 
+    # values are collected into a Python list as well and turned into nodes by valueList where they are used
     @_('expr')
     def values(self, p):
-        return ValueList(p.expr, lineno=p.lineno)
+        return [p.expr]
 
-    @_('expr "," values')
+    @_('values "," expr')
     def values(self, p):
-        return ValueList(p.expr, p.values, lineno=p.lineno)
+        p.values.append(p.expr)
+        return p.values
 
     @_('"[" values "]"')
     def expr(self, p):
-        return Vector(p.values, lineno=p.lineno)
+        return Vector(valueList(p.values), lineno=p.lineno)
 
     @_('"[" "[" values "]" "]"')
     def expr(self, p):
-        return Vector(Vector(p.values, lineno=p.lineno), isMatrixHead=True, lineno=p.lineno)
+        return Vector(Vector(valueList(p.values), lineno=p.lineno), isMatrixHead=True, lineno=p.lineno)
 
     @_('"[" "[" values "]" , next_values "]"')
     def expr(self, p):
-        return Vector(Vector(p.values, p.next_values, lineno=p.lineno), isMatrixHead=True, lineno=p.lineno)
+        return Vector(Vector(valueList(p.values), p.next_values, lineno=p.lineno), isMatrixHead=True, lineno=p.lineno)
 
     @_('"[" values "]"')
     def next_values(self, p):
-        return Vector(p.values, lineno=p.lineno)
+        return Vector(valueList(p.values), lineno=p.lineno)
 
     @_('"[" values "]" , next_values')
     def next_values(self, p):
-        return Vector(p.values, p.next_values, lineno=p.lineno)
+        return Vector(valueList(p.values), p.next_values, lineno=p.lineno)
 
     @_('IF "(" expr ")" block %prec IFX')
     def flow_control_statement(self, p):
@@ -164,6 +244,15 @@ class Parser(SlyParser):
     def idx_values(self, p):
         return IndexList(ValueNode(p[0], "integer"), p.idx_values, lineno=p.lineno)
 
+    # a range a:b selects the positions from a up to, but not including, b
+    @_('range')
+    def idx_values(self, p):
+        return IndexList(p.range, lineno=p.lineno)
+
+    @_('range "," idx_values')
+    def idx_values(self, p):
+        return IndexList(p.range, p.idx_values, lineno=p.lineno)
+
     @_('id_expr')
     def expr(self, p):
         return p.id_expr
@@ -182,12 +271,24 @@ class Parser(SlyParser):
 
     @_('ZEROS "(" values ")"')
     def expr(self, p):
-        return MatrixInitiator(p.ZEROS, p.values, lineno=p.lineno)
+        return MatrixInitiator(p.ZEROS, valueList(p.values), lineno=p.lineno)
 
     @_('ONES "(" values ")"') 
     def expr(self, p):
-        return MatrixInitiator(p.ONES, p.values, lineno=p.lineno)
+        return MatrixInitiator(p.ONES, valueList(p.values), lineno=p.lineno)
 
     @_('EYE "(" values ")"')
     def expr(self, p):
-        return MatrixInitiator(p.EYE, p.values, lineno=p.lineno)
+        return MatrixInitiator(p.EYE, valueList(p.values), lineno=p.lineno)
+
+if __name__ == "__main__":
+    import os
+    import argparse
+
+    argParser = argparse.ArgumentParser(description="regenerate parsetab.py, the precomputed LALR tables of the parser")
+    argParser.add_argument("--debugfile", default=None, help="also dump the grammar and the tables to this file")
+    args = argParser.parse_args()
+
+    Parser.debugfile = args.debugfile
+    Parser.buildTables()
+    Parser.writeTables(os.path.join(os.path.dirname(os.path.abspath(__file__)), "parsetab.py"))
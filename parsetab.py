@@ -0,0 +1,6 @@
+# LALR tables of parser.Parser, generated by `python parser.py`, do not edit
+signature = 'ce134b00b51dd9cbfa026610ba5a7e8a98ddb37d5478669a5bb4270d79e3c15c'
+productions = [("S'", ('start',)), ('start', ('start', 'block')), ('start', ('block',)), ('block', ('{', 'next_statements', '}')), ('block', ('statement',)), ('next_statements', ('next_statements', 'statement')), ('next_statements', ('statement',)), ('statement', ('flow_control_statement',)), ('statement', ('action_statement', ';')), ('action_statement', ('BREAK',)), ('action_statement', ('CONTINUE',)), ('action_statement', ('RETURN', 'expr')), ('action_statement', ('PRINT', 'values')), ('action_statement', ('id_expr', 'DASSIGN', 'expr')), ('action_statement', ('id_expr', 'TASSIGN', 'expr')), ('action_statement', ('id_expr', 'MASSIGN', 'expr')), ('action_statement', ('id_expr', 'PASSIGN', 'expr')), ('action_statement', ('id_expr', '=', 'expr')), ('values', ('values', ',', 'expr')), ('values', ('expr',)), ('expr', ('EYE', '(', 'values', ')')), ('expr', ('ONES', '(', 'values', ')')), ('expr', ('ZEROS', '(', 'values', ')')), ('expr', ('(', 'expr', ')')), ('expr', ('id_expr',)), ('expr', ('INT',)), ('expr', ('FLOAT',)), ('expr', ('STRING',)), ('expr', ('expr', 'NEQ', 'expr')), ('expr', ('expr', 'EQ', 'expr')), ('expr', ('expr', 'GEQ', 'expr')), ('expr', ('expr', '>', 'expr')), ('expr', ('expr', 'LEQ', 'expr')), ('expr', ('expr', '<', 'expr')), ('expr', ('expr', "'")), ('expr', ('-', 'expr')), ('expr', ('expr', 'MDIVIDE', 'expr')), ('expr', ('expr', 'MTIMES', 'expr')), ('expr', ('expr', 'MMINUS', 'expr')), ('expr', ('expr', 'MPLUS', 'expr')), ('expr', ('expr', '/', 'expr')), ('expr', ('expr', '*', 'expr')), ('expr', ('expr', '-', 'expr')), ('expr', ('expr', '+', 'expr')), ('expr', ('[', '[', 'values', ']', ',', 'next_values', ']')), ('expr', ('[', '[', 'values', ']', ']')), ('expr', ('[', 'values', ']')), ('next_values', ('[', 'values', ']', ',', 'next_values')), ('next_values', ('[', 'values', ']')), ('flow_control_statement', ('FOR', 'ID', '=', 'range', 'block')), ('flow_control_statement', ('WHILE', '(', 'expr', ')', 'block')), ('flow_control_statement', ('IF', '(', 'expr', ')', 'block', 'ELSE', 'block')), ('flow_control_statement', ('IF', '(', 'expr', ')', 'block')), ('range', ('expr', ':', 'expr')), ('idx_values', ('range', ',', 'idx_values')), ('idx_values', ('range',)), ('idx_values', (':', ',', 'idx_values')), ('idx_values', ('expr', ',', 'idx_values')), ('idx_values', (':',)), ('idx_values', ('expr',)), ('id_expr', ('ID', '[', 'idx_values', ']')), ('id_expr', ('ID',))]
+action = {0: {'{': 3, 'FOR': 7, 'WHILE': 9, 'IF': 10, 'BREAK': 11, 'CONTINUE': 12, 'RETURN': 13, 'PRINT': 14, 'ID': 8}, 1: {'$end': 0, '{': 3, 'FOR': 7, 'WHILE': 9, 'IF': 10, 'BREAK': 11, 'CONTINUE': 12, 'RETURN': 13, 'PRINT': 14, 'ID': 8}, 2: {'{': -2, 'FOR': -2, 'WHILE': -2, 'IF': -2, 'BREAK': -2, 'CONTINUE': -2, 'RETURN': -2, 'PRINT': -2, 'ID': -2, '$end': -2}, 3: {'FOR': 7, 'WHILE': 9, 'IF': 10, 'BREAK': 11, 'CONTINUE': 12, 'RETURN': 13, 'PRINT': 14, 'ID': 8}, 4: {'{': -4, 'FOR': -4, 'WHILE': -4, 'IF': -4, 'BREAK': -4, 'CONTINUE': -4, 'RETURN': -4, 'PRINT': -4, 'ID': -4, '$end': -4, '}': -4, 'ELSE': -4}, 5: {'{': -7, 'FOR': -7, 'WHILE': -7, 'IF': -7, 'BREAK': -7, 'CONTINUE': -7, 'RETURN': -7, 'PRINT': -7, 'ID': -7, '$end': -7, '}': -7, 'ELSE': -7}, 6: {';': 19}, 7: {'ID': 20}, 8: {'[': 21, 'DASSIGN': -61, 'TASSIGN': -61, 'MASSIGN': -61, 'PASSIGN': -61, '=': -61, 'NEQ': -61, 'EQ': -61, 'GEQ': -61, '>': -61, 'LEQ': -61, '<': -61, "'": -61, 'MDIVIDE': -61, 'MTIMES': -61, 'MMINUS': -61, 'MPLUS': -61, '/': -61, '*': -61, '-': -61, '+': -61, ';': -61, ',': -61, ':': -61, ']': -61, ')': -61, '{': -61, 'FOR': -61, 'WHILE': -61, 'IF': -61, 'BREAK': -61, 'CONTINUE': -61, 'RETURN': -61, 'PRINT': -61, 'ID': -61}, 9: {'(': 22}, 10: {'(': 23}, 11: {';': -9}, 12: {';': -10}, 13: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 14: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 15: {'DASSIGN': 37, 'TASSIGN': 38, 'MASSIGN': 39, 'PASSIGN': 40, '=': 41}, 16: {'{': -1, 'FOR': -1, 'WHILE': -1, 'IF': -1, 'BREAK': -1, 'CONTINUE': -1, 'RETURN': -1, 'PRINT': -1, 'ID': -1, '$end': -1}, 17: {'}': 42, 'FOR': 7, 'WHILE': 9, 'IF': 10, 'BREAK': 11, 'CONTINUE': 12, 'RETURN': 13, 'PRINT': 14, 'ID': 8}, 18: {'}': -6, 'FOR': -6, 'WHILE': -6, 'IF': -6, 'BREAK': -6, 'CONTINUE': -6, 'RETURN': -6, 'PRINT': -6, 'ID': -6}, 19: {'{': -8, 'FOR': -8, 'WHILE': -8, 'IF': -8, 'BREAK': -8, 'CONTINUE': -8, 'RETURN': -8, 'PRINT': -8, 'ID': -8, '$end': -8, '}': -8, 'ELSE': -8}, 20: {'=': 44}, 21: {':': 47, 'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 22: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 23: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 24: {';': -11, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 25: {'(': 66}, 26: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 27: {'(': 68}, 28: {'(': 69}, 29: {'NEQ': -24, 'EQ': -24, 'GEQ': -24, '>': -24, 'LEQ': -24, '<': -24, "'": -24, 'MDIVIDE': -24, 'MTIMES': -24, 'MMINUS': -24, 'MPLUS': -24, '/': -24, '*': -24, '-': -24, '+': -24, ';': -24, ',': -24, ':': -24, ']': -24, ')': -24, '{': -24, 'FOR': -24, 'WHILE': -24, 'IF': -24, 'BREAK': -24, 'CONTINUE': -24, 'RETURN': -24, 'PRINT': -24, 'ID': -24}, 30: {'NEQ': -25, 'EQ': -25, 'GEQ': -25, '>': -25, 'LEQ': -25, '<': -25, "'": -25, 'MDIVIDE': -25, 'MTIMES': -25, 'MMINUS': -25, 'MPLUS': -25, '/': -25, '*': -25, '-': -25, '+': -25, ';': -25, ',': -25, ':': -25, ']': -25, ')': -25, '{': -25, 'FOR': -25, 'WHILE': -25, 'IF': -25, 'BREAK': -25, 'CONTINUE': -25, 'RETURN': -25, 'PRINT': -25, 'ID': -25}, 31: {'NEQ': -26, 'EQ': -26, 'GEQ': -26, '>': -26, 'LEQ': -26, '<': -26, "'": -26, 'MDIVIDE': -26, 'MTIMES': -26, 'MMINUS': -26, 'MPLUS': -26, '/': -26, '*': -26, '-': -26, '+': -26, ';': -26, ',': -26, ':': -26, ']': -26, ')': -26, '{': -26, 'FOR': -26, 'WHILE': -26, 'IF': -26, 'BREAK': -26, 'CONTINUE': -26, 'RETURN': -26, 'PRINT': -26, 'ID': -26}, 32: {'NEQ': -27, 'EQ': -27, 'GEQ': -27, '>': -27, 'LEQ': -27, '<': -27, "'": -27, 'MDIVIDE': -27, 'MTIMES': -27, 'MMINUS': -27, 'MPLUS': -27, '/': -27, '*': -27, '-': -27, '+': -27, ';': -27, ',': -27, ':': -27, ']': -27, ')': -27, '{': -27, 'FOR': -27, 'WHILE': -27, 'IF': -27, 'BREAK': -27, 'CONTINUE': -27, 'RETURN': -27, 'PRINT': -27, 'ID': -27}, 33: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 34: {'[': 71, 'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, 'ID': 8}, 35: {';': -12, ',': 73}, 36: {',': -19, ';': -19, ']': -19, ')': -19, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 37: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 38: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 39: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 40: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 41: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 42: {'{': -3, 'FOR': -3, 'WHILE': -3, 'IF': -3, 'BREAK': -3, 'CONTINUE': -3, 'RETURN': -3, 'PRINT': -3, 'ID': -3, '$end': -3, '}': -3, 'ELSE': -3}, 43: {'}': -5, 'FOR': -5, 'WHILE': -5, 'IF': -5, 'BREAK': -5, 'CONTINUE': -5, 'RETURN': -5, 'PRINT': -5, 'ID': -5}, 44: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 45: {']': 81}, 46: {',': 82, ']': -55}, 47: {',': 83, ']': -58}, 48: {',': 84, ']': -59, ':': 85, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 49: {')': 86, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 50: {')': 87, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 51: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 52: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 53: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 54: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 55: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 56: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 57: {'NEQ': -34, 'EQ': -34, 'GEQ': -34, '>': -34, 'LEQ': -34, '<': -34, "'": -34, 'MDIVIDE': -34, 'MTIMES': -34, 'MMINUS': -34, 'MPLUS': -34, '/': -34, '*': -34, '-': -34, '+': -34, ';': -34, ',': -34, ':': -34, ']': -34, ')': -34, '{': -34, 'FOR': -34, 'WHILE': -34, 'IF': -34, 'BREAK': -34, 'CONTINUE': -34, 'RETURN': -34, 'PRINT': -34, 'ID': -34}, 58: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 59: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 60: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 61: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 62: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 63: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 64: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 65: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 66: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 67: {')': 103, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 68: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 69: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 70: {'NEQ': -35, 'EQ': -35, 'GEQ': -35, '>': -35, 'LEQ': -35, '<': -35, "'": 57, 'MDIVIDE': -35, 'MTIMES': -35, 'MMINUS': -35, 'MPLUS': -35, '/': -35, '*': -35, '-': -35, '+': -35, ';': -35, ',': -35, ':': -35, ']': -35, ')': -35, '{': -35, 'FOR': -35, 'WHILE': -35, 'IF': -35, 'BREAK': -35, 'CONTINUE': -35, 'RETURN': -35, 'PRINT': -35, 'ID': -35}, 71: {'[': 71, 'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, 'ID': 8}, 72: {']': 107, ',': 73}, 73: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 74: {';': -13, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 75: {';': -14, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 76: {';': -15, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 77: {';': -16, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 78: {';': -17, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 79: {'{': 3, 'FOR': 7, 'WHILE': 9, 'IF': 10, 'BREAK': 11, 'CONTINUE': 12, 'RETURN': 13, 'PRINT': 14, 'ID': 8}, 80: {':': 85, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 81: {'DASSIGN': -60, 'TASSIGN': -60, 'MASSIGN': -60, 'PASSIGN': -60, '=': -60, 'NEQ': -60, 'EQ': -60, 'GEQ': -60, '>': -60, 'LEQ': -60, '<': -60, "'": -60, 'MDIVIDE': -60, 'MTIMES': -60, 'MMINUS': -60, 'MPLUS': -60, '/': -60, '*': -60, '-': -60, '+': -60, ';': -60, ',': -60, ':': -60, ']': -60, ')': -60, '{': -60, 'FOR': -60, 'WHILE': -60, 'IF': -60, 'BREAK': -60, 'CONTINUE': -60, 'RETURN': -60, 'PRINT': -60, 'ID': -60}, 82: {':': 47, 'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 83: {':': 47, 'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 84: {':': 47, 'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 85: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 86: {'{': 3, 'FOR': 7, 'WHILE': 9, 'IF': 10, 'BREAK': 11, 'CONTINUE': 12, 'RETURN': 13, 'PRINT': 14, 'ID': 8}, 87: {'{': 3, 'FOR': 7, 'WHILE': 9, 'IF': 10, 'BREAK': 11, 'CONTINUE': 12, 'RETURN': 13, 'PRINT': 14, 'ID': 8}, 88: {'NEQ': None, 'EQ': None, 'GEQ': None, '>': None, 'LEQ': None, '<': None, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65, ';': -28, ',': -28, ':': -28, ']': -28, ')': -28, '{': -28, 'FOR': -28, 'WHILE': -28, 'IF': -28, 'BREAK': -28, 'CONTINUE': -28, 'RETURN': -28, 'PRINT': -28, 'ID': -28}, 89: {'NEQ': None, 'EQ': None, 'GEQ': None, '>': None, 'LEQ': None, '<': None, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65, ';': -29, ',': -29, ':': -29, ']': -29, ')': -29, '{': -29, 'FOR': -29, 'WHILE': -29, 'IF': -29, 'BREAK': -29, 'CONTINUE': -29, 'RETURN': -29, 'PRINT': -29, 'ID': -29}, 90: {'NEQ': None, 'EQ': None, 'GEQ': None, '>': None, 'LEQ': None, '<': None, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65, ';': -30, ',': -30, ':': -30, ']': -30, ')': -30, '{': -30, 'FOR': -30, 'WHILE': -30, 'IF': -30, 'BREAK': -30, 'CONTINUE': -30, 'RETURN': -30, 'PRINT': -30, 'ID': -30}, 91: {'NEQ': None, 'EQ': None, 'GEQ': None, '>': None, 'LEQ': None, '<': None, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65, ';': -31, ',': -31, ':': -31, ']': -31, ')': -31, '{': -31, 'FOR': -31, 'WHILE': -31, 'IF': -31, 'BREAK': -31, 'CONTINUE': -31, 'RETURN': -31, 'PRINT': -31, 'ID': -31}, 92: {'NEQ': None, 'EQ': None, 'GEQ': None, '>': None, 'LEQ': None, '<': None, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65, ';': -32, ',': -32, ':': -32, ']': -32, ')': -32, '{': -32, 'FOR': -32, 'WHILE': -32, 'IF': -32, 'BREAK': -32, 'CONTINUE': -32, 'RETURN': -32, 'PRINT': -32, 'ID': -32}, 93: {'NEQ': None, 'EQ': None, 'GEQ': None, '>': None, 'LEQ': None, '<': None, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65, ';': -33, ',': -33, ':': -33, ']': -33, ')': -33, '{': -33, 'FOR': -33, 'WHILE': -33, 'IF': -33, 'BREAK': -33, 'CONTINUE': -33, 'RETURN': -33, 'PRINT': -33, 'ID': -33}, 94: {'NEQ': -36, 'EQ': -36, 'GEQ': -36, '>': -36, 'LEQ': -36, '<': -36, "'": 57, 'MDIVIDE': -36, 'MTIMES': -36, 'MMINUS': -36, 'MPLUS': -36, '/': -36, '*': -36, '-': -36, '+': -36, ';': -36, ',': -36, ':': -36, ']': -36, ')': -36, '{': -36, 'FOR': -36, 'WHILE': -36, 'IF': -36, 'BREAK': -36, 'CONTINUE': -36, 'RETURN': -36, 'PRINT': -36, 'ID': -36}, 95: {'NEQ': -37, 'EQ': -37, 'GEQ': -37, '>': -37, 'LEQ': -37, '<': -37, "'": 57, 'MDIVIDE': -37, 'MTIMES': -37, 'MMINUS': -37, 'MPLUS': -37, '/': -37, '*': -37, '-': -37, '+': -37, ';': -37, ',': -37, ':': -37, ']': -37, ')': -37, '{': -37, 'FOR': -37, 'WHILE': -37, 'IF': -37, 'BREAK': -37, 'CONTINUE': -37, 'RETURN': -37, 'PRINT': -37, 'ID': -37}, 96: {'NEQ': -38, 'EQ': -38, 'GEQ': -38, '>': -38, 'LEQ': -38, '<': -38, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': -38, 'MPLUS': -38, '/': 62, '*': 63, '-': -38, '+': -38, ';': -38, ',': -38, ':': -38, ']': -38, ')': -38, '{': -38, 'FOR': -38, 'WHILE': -38, 'IF': -38, 'BREAK': -38, 'CONTINUE': -38, 'RETURN': -38, 'PRINT': -38, 'ID': -38}, 97: {'NEQ': -39, 'EQ': -39, 'GEQ': -39, '>': -39, 'LEQ': -39, '<': -39, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': -39, 'MPLUS': -39, '/': 62, '*': 63, '-': -39, '+': -39, ';': -39, ',': -39, ':': -39, ']': -39, ')': -39, '{': -39, 'FOR': -39, 'WHILE': -39, 'IF': -39, 'BREAK': -39, 'CONTINUE': -39, 'RETURN': -39, 'PRINT': -39, 'ID': -39}, 98: {'NEQ': -40, 'EQ': -40, 'GEQ': -40, '>': -40, 'LEQ': -40, '<': -40, "'": 57, 'MDIVIDE': -40, 'MTIMES': -40, 'MMINUS': -40, 'MPLUS': -40, '/': -40, '*': -40, '-': -40, '+': -40, ';': -40, ',': -40, ':': -40, ']': -40, ')': -40, '{': -40, 'FOR': -40, 'WHILE': -40, 'IF': -40, 'BREAK': -40, 'CONTINUE': -40, 'RETURN': -40, 'PRINT': -40, 'ID': -40}, 99: {'NEQ': -41, 'EQ': -41, 'GEQ': -41, '>': -41, 'LEQ': -41, '<': -41, "'": 57, 'MDIVIDE': -41, 'MTIMES': -41, 'MMINUS': -41, 'MPLUS': -41, '/': -41, '*': -41, '-': -41, '+': -41, ';': -41, ',': -41, ':': -41, ']': -41, ')': -41, '{': -41, 'FOR': -41, 'WHILE': -41, 'IF': -41, 'BREAK': -41, 'CONTINUE': -41, 'RETURN': -41, 'PRINT': -41, 'ID': -41}, 100: {'NEQ': -42, 'EQ': -42, 'GEQ': -42, '>': -42, 'LEQ': -42, '<': -42, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': -42, 'MPLUS': -42, '/': 62, '*': 63, '-': -42, '+': -42, ';': -42, ',': -42, ':': -42, ']': -42, ')': -42, '{': -42, 'FOR': -42, 'WHILE': -42, 'IF': -42, 'BREAK': -42, 'CONTINUE': -42, 'RETURN': -42, 'PRINT': -42, 'ID': -42}, 101: {'NEQ': -43, 'EQ': -43, 'GEQ': -43, '>': -43, 'LEQ': -43, '<': -43, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': -43, 'MPLUS': -43, '/': 62, '*': 63, '-': -43, '+': -43, ';': -43, ',': -43, ':': -43, ']': -43, ')': -43, '{': -43, 'FOR': -43, 'WHILE': -43, 'IF': -43, 'BREAK': -43, 'CONTINUE': -43, 'RETURN': -43, 'PRINT': -43, 'ID': -43}, 102: {')': 116, ',': 73}, 103: {'NEQ': -23, 'EQ': -23, 'GEQ': -23, '>': -23, 'LEQ': -23, '<': -23, "'": -23, 'MDIVIDE': -23, 'MTIMES': -23, 'MMINUS': -23, 'MPLUS': -23, '/': -23, '*': -23, '-': -23, '+': -23, ';': -23, ',': -23, ':': -23, ']': -23, ')': -23, '{': -23, 'FOR': -23, 'WHILE': -23, 'IF': -23, 'BREAK': -23, 'CONTINUE': -23, 'RETURN': -23, 'PRINT': -23, 'ID': -23}, 104: {')': 117, ',': 73}, 105: {')': 118, ',': 73}, 106: {']': 119, ',': 73}, 107: {'NEQ': -46, 'EQ': -46, 'GEQ': -46, '>': -46, 'LEQ': -46, '<': -46, "'": -46, 'MDIVIDE': -46, 'MTIMES': -46, 'MMINUS': -46, 'MPLUS': -46, '/': -46, '*': -46, '-': -46, '+': -46, ';': -46, ',': -46, ':': -46, ']': -46, ')': -46, '{': -46, 'FOR': -46, 'WHILE': -46, 'IF': -46, 'BREAK': -46, 'CONTINUE': -46, 'RETURN': -46, 'PRINT': -46, 'ID': -46}, 108: {',': -18, ';': -18, ']': -18, ')': -18, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 109: {'{': -49, 'FOR': -49, 'WHILE': -49, 'IF': -49, 'BREAK': -49, 'CONTINUE': -49, 'RETURN': -49, 'PRINT': -49, 'ID': -49, '$end': -49, '}': -49, 'ELSE': -49}, 110: {']': -54}, 111: {']': -56}, 112: {']': -57}, 113: {',': -53, ']': -53, '{': -53, 'FOR': -53, 'WHILE': -53, 'IF': -53, 'BREAK': -53, 'CONTINUE': -53, 'RETURN': -53, 'PRINT': -53, 'ID': -53, 'NEQ': 51, 'EQ': 52, 'GEQ': 53, '>': 54, 'LEQ': 55, '<': 56, "'": 57, 'MDIVIDE': 58, 'MTIMES': 59, 'MMINUS': 60, 'MPLUS': 61, '/': 62, '*': 63, '-': 64, '+': 65}, 114: {'{': -50, 'FOR': -50, 'WHILE': -50, 'IF': -50, 'BREAK': -50, 'CONTINUE': -50, 'RETURN': -50, 'PRINT': -50, 'ID': -50, '$end': -50, '}': -50, 'ELSE': -50}, 115: {'ELSE': 120, '{': -52, 'FOR': -52, 'WHILE': -52, 'IF': -52, 'BREAK': -52, 'CONTINUE': -52, 'RETURN': -52, 'PRINT': -52, 'ID': -52, '$end': -52, '}': -52}, 116: {'NEQ': -20, 'EQ': -20, 'GEQ': -20, '>': -20, 'LEQ': -20, '<': -20, "'": -20, 'MDIVIDE': -20, 'MTIMES': -20, 'MMINUS': -20, 'MPLUS': -20, '/': -20, '*': -20, '-': -20, '+': -20, ';': -20, ',': -20, ':': -20, ']': -20, ')': -20, '{': -20, 'FOR': -20, 'WHILE': -20, 'IF': -20, 'BREAK': -20, 'CONTINUE': -20, 'RETURN': -20, 'PRINT': -20, 'ID': -20}, 117: {'NEQ': -21, 'EQ': -21, 'GEQ': -21, '>': -21, 'LEQ': -21, '<': -21, "'": -21, 'MDIVIDE': -21, 'MTIMES': -21, 'MMINUS': -21, 'MPLUS': -21, '/': -21, '*': -21, '-': -21, '+': -21, ';': -21, ',': -21, ':': -21, ']': -21, ')': -21, '{': -21, 'FOR': -21, 'WHILE': -21, 'IF': -21, 'BREAK': -21, 'CONTINUE': -21, 'RETURN': -21, 'PRINT': -21, 'ID': -21}, 118: {'NEQ': -22, 'EQ': -22, 'GEQ': -22, '>': -22, 'LEQ': -22, '<': -22, "'": -22, 'MDIVIDE': -22, 'MTIMES': -22, 'MMINUS': -22, 'MPLUS': -22, '/': -22, '*': -22, '-': -22, '+': -22, ';': -22, ',': -22, ':': -22, ']': -22, ')': -22, '{': -22, 'FOR': -22, 'WHILE': -22, 'IF': -22, 'BREAK': -22, 'CONTINUE': -22, 'RETURN': -22, 'PRINT': -22, 'ID': -22}, 119: {',': 122, ']': 121, 'NEQ': -46, 'EQ': -46, 'GEQ': -46, '>': -46, 'LEQ': -46, '<': -46, "'": -46, 'MDIVIDE': -46, 'MTIMES': -46, 'MMINUS': -46, 'MPLUS': -46, '/': -46, '*': -46, '-': -46, '+': -46}, 120: {'{': 3, 'FOR': 7, 'WHILE': 9, 'IF': 10, 'BREAK': 11, 'CONTINUE': 12, 'RETURN': 13, 'PRINT': 14, 'ID': 8}, 121: {'NEQ': -45, 'EQ': -45, 'GEQ': -45, '>': -45, 'LEQ': -45, '<': -45, "'": -45, 'MDIVIDE': -45, 'MTIMES': -45, 'MMINUS': -45, 'MPLUS': -45, '/': -45, '*': -45, '-': -45, '+': -45, ';': -45, ',': -45, ':': -45, ']': -45, ')': -45, '{': -45, 'FOR': -45, 'WHILE': -45, 'IF': -45, 'BREAK': -45, 'CONTINUE': -45, 'RETURN': -45, 'PRINT': -45, 'ID': -45}, 122: {'[': 124}, 123: {'{': -51, 'FOR': -51, 'WHILE': -51, 'IF': -51, 'BREAK': -51, 'CONTINUE': -51, 'RETURN': -51, 'PRINT': -51, 'ID': -51, '$end': -51, '}': -51, 'ELSE': -51}, 124: {'EYE': 25, 'ONES': 27, 'ZEROS': 28, '(': 26, 'INT': 30, 'FLOAT': 31, 'STRING': 32, '-': 33, '[': 34, 'ID': 8}, 125: {']': 127}, 126: {']': 128, ',': 73}, 127: {'NEQ': -44, 'EQ': -44, 'GEQ': -44, '>': -44, 'LEQ': -44, '<': -44, "'": -44, 'MDIVIDE': -44, 'MTIMES': -44, 'MMINUS': -44, 'MPLUS': -44, '/': -44, '*': -44, '-': -44, '+': -44, ';': -44, ',': -44, ':': -44, ']': -44, ')': -44, '{': -44, 'FOR': -44, 'WHILE': -44, 'IF': -44, 'BREAK': -44, 'CONTINUE': -44, 'RETURN': -44, 'PRINT': -44, 'ID': -44}, 128: {',': 129, ']': -48}, 129: {'[': 124}, 130: {']': -47}}
+goto = {0: {'start': 1, 'block': 2, 'statement': 4, 'flow_control_statement': 5, 'action_statement': 6, 'id_expr': 15}, 1: {'block': 16, 'statement': 4, 'flow_control_statement': 5, 'action_statement': 6, 'id_expr': 15}, 2: {}, 3: {'next_statements': 17, 'statement': 18, 'flow_control_statement': 5, 'action_statement': 6, 'id_expr': 15}, 4: {}, 5: {}, 6: {}, 7: {}, 8: {}, 9: {}, 10: {}, 11: {}, 12: {}, 13: {'expr': 24, 'id_expr': 29}, 14: {'values': 35, 'expr': 36, 'id_expr': 29}, 15: {}, 16: {}, 17: {'statement': 43, 'flow_control_statement': 5, 'action_statement': 6, 'id_expr': 15}, 18: {}, 19: {}, 20: {}, 21: {'idx_values': 45, 'range': 46, 'expr': 48, 'id_expr': 29}, 22: {'expr': 49, 'id_expr': 29}, 23: {'expr': 50, 'id_expr': 29}, 24: {}, 25: {}, 26: {'expr': 67, 'id_expr': 29}, 27: {}, 28: {}, 29: {}, 30: {}, 31: {}, 32: {}, 33: {'expr': 70, 'id_expr': 29}, 34: {'values': 72, 'expr': 36, 'id_expr': 29}, 35: {}, 36: {}, 37: {'id_expr': 29, 'expr': 74}, 38: {'id_expr': 29, 'expr': 75}, 39: {'id_expr': 29, 'expr': 76}, 40: {'id_expr': 29, 'expr': 77}, 41: {'id_expr': 29, 'expr': 78}, 42: {}, 43: {}, 44: {'range': 79, 'expr': 80, 'id_expr': 29}, 45: {}, 46: {}, 47: {}, 48: {}, 49: {}, 50: {}, 51: {'expr': 88, 'id_expr': 29}, 52: {'expr': 89, 'id_expr': 29}, 53: {'expr': 90, 'id_expr': 29}, 54: {'expr': 91, 'id_expr': 29}, 55: {'expr': 92, 'id_expr': 29}, 56: {'expr': 93, 'id_expr': 29}, 57: {}, 58: {'expr': 94, 'id_expr': 29}, 59: {'expr': 95, 'id_expr': 29}, 60: {'expr': 96, 'id_expr': 29}, 61: {'expr': 97, 'id_expr': 29}, 62: {'expr': 98, 'id_expr': 29}, 63: {'expr': 99, 'id_expr': 29}, 64: {'expr': 100, 'id_expr': 29}, 65: {'expr': 101, 'id_expr': 29}, 66: {'values': 102, 'expr': 36, 'id_expr': 29}, 67: {}, 68: {'values': 104, 'expr': 36, 'id_expr': 29}, 69: {'values': 105, 'expr': 36, 'id_expr': 29}, 70: {}, 71: {'values': 106, 'expr': 36, 'id_expr': 29}, 72: {}, 73: {'expr': 108, 'id_expr': 29}, 74: {}, 75: {}, 76: {}, 77: {}, 78: {}, 79: {'block': 109, 'statement': 4, 'flow_control_statement': 5, 'action_statement': 6, 'id_expr': 15}, 80: {}, 81: {}, 82: {'range': 46, 'idx_values': 110, 'expr': 48, 'id_expr': 29}, 83: {'idx_values': 111, 'range': 46, 'expr': 48, 'id_expr': 29}, 84: {'expr': 48, 'idx_values': 112, 'range': 46, 'id_expr': 29}, 85: {'expr': 113, 'id_expr': 29}, 86: {'block': 114, 'statement': 4, 'flow_control_statement': 5, 'action_statement': 6, 'id_expr': 15}, 87: {'block': 115, 'statement': 4, 'flow_control_statement': 5, 'action_statement': 6, 'id_expr': 15}, 88: {}, 89: {}, 90: {}, 91: {}, 92: {}, 93: {}, 94: {}, 95: {}, 96: {}, 97: {}, 98: {}, 99: {}, 100: {}, 101: {}, 102: {}, 103: {}, 104: {}, 105: {}, 106: {}, 107: {}, 108: {}, 109: {}, 110: {}, 111: {}, 112: {}, 113: {}, 114: {}, 115: {}, 116: {}, 117: {}, 118: {}, 119: {}, 120: {'block': 123, 'statement': 4, 'flow_control_statement': 5, 'action_statement': 6, 'id_expr': 15}, 121: {}, 122: {'next_values': 125}, 123: {}, 124: {'values': 126, 'expr': 36, 'id_expr': 29}, 125: {}, 126: {}, 127: {}, 128: {}, 129: {'next_values': 130}, 130: {}}
+defaulted = {11: -9, 12: -10, 110: -54, 111: -56, 112: -57, 130: -47}
@@ -8,7 +8,7 @@ D[0, 0] = 42;
 D[0, 1] += 3;
 D[2] += [1,2,3,4];
 D[:, 1] += [1,2,3];
-#D[1:3, 2:4] = 7; # opcjonalnie dla zainteresowanych
+D[1:3, 2:4] = 7;
 print D;
 print D[2];
 print D[2, 1];
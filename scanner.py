@@ -1,3 +1,7 @@
+import re
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
 from sly import Lexer
 
 
@@ -74,3 +78,132 @@ class Scanner(Lexer):
     def INT(self, t):
         t.value = int(t.value)
         return t
+
+
+# tokens of FastScanner, read by the parser through the same attributes as sly's
+Token = namedtuple("Token", ["type", "value", "lineno", "index", "end"])
+
+def lexemePattern():
+    # Scanner's master pattern without its groups, between the ignored characters and the literals it is
+    # tried in by sly and a single illegal character, so that the lexemes it finds cover the whole text
+    rules = re.sub(r"\(\?P<\w+>", "(?:", Scanner._master_re.pattern)
+    rules = re.sub(r"\((?!\?)", "(?:", rules)
+    literals = "".join(re.escape(literal) for literal in sorted(Scanner.literals))
+    return re.compile(f"[{re.escape(Scanner.ignore)}]+|{rules}|[{literals}]|[\\s\\S]")
+
+def lexemeKinds():
+    # the kind of a lexeme is known from its whole text for operators, literals and keywords and otherwise
+    # from its first character; only strings and numbers starting with a dot need another look
+    exact = {literal: literal for literal in Scanner.literals}
+    for name, pattern in Scanner._rules:
+        if isinstance(pattern, str) and re.fullmatch(r"(\[.\]|[^\\()\[\]|*+?])+", pattern): # fixed text, e.g. [.][+] or <=
+            exact[re.sub(r"\[(.)\]", r"\1", pattern)] = name
+    exact.update(Scanner._remapping["ID"])
+    first = {character: "ID" for character in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_"}
+    first.update({digit: "INT" for digit in "0123456789"})
+    first.update({character: "ignore" for character in Scanner.ignore})
+    first.update({"#": "comment", "\n": "newline", "\"": "STRING", ".": "FLOAT"})
+    return exact, first
+
+class FastScanner(object):
+    # produces the same tokens as Scanner with a single findall of Scanner's rules over the whole text,
+    # leaving only the classification of every lexeme and the building of a tuple per token to Python;
+    # tokenizeFile does the same chunk by chunk, so that the text is never held in memory as a whole
+    pattern = lexemePattern()
+    exact, first = lexemeKinds()
+
+    error = Scanner.error
+
+    def __init__(self):
+        self.reset("", 1, 0)
+
+    def reset(self, text, lineno, index):
+        # a scanner is reused for many texts, so nothing of the previous text's positions may remain; columns count
+        # the lines the text has before index, as Scanner.find_column does
+        self.text = text
+        self.lineno = lineno
+        self.index = index
+        self.lineStarts = array("q", [0])
+        self.lineStarts.extend(position + 1 for position, character in enumerate(text[:index]) if character == "\n")
+
+    # same column as Scanner.find_column, looked up in the index of line starts instead of the text
+    def find_column(self, token):
+        lineStart = self.lineStarts[bisect_right(self.lineStarts, token.index) - 1]
+        last_cr = lineStart - 1 if lineStart > 0 else 0
+        return (token.index - last_cr) + 1
+
+    def tokenize(self, text, lineno=1, index=0):
+        self.reset(text, lineno, index)
+        return self.scan([self.pattern.findall(text, index)], lineno, index)
+
+    def tokenizeFile(self, file, chunkSize=1024 * 1024):
+        self.reset("", 1, 0)
+        return self.scan(self.completeLexemes(iter(lambda: file.read(chunkSize), "")))
+
+    # longest string that may still be open at the end of a chunk; a lone quote further back is an illegal
+    # character, so that a stray quote does not keep the rest of the file pending and lexed again with every chunk
+    stringLimit = 64 * 1024
+
+    def completeLexemes(self, chunks):
+        # yields the lexemes of every chunk that no text read later can change: the last three can still become
+        # one float with an exponent (1.5 e + followed by 3), and a lone quote without a closing one yet can
+        # still become the start of a string
+        pending = ""
+        for chunk in chunks:
+            text = pending + chunk
+            lexemes = self.pattern.findall(text)
+            complete = max(len(lexemes) - 3, 0)
+            start = counted = 0
+            try:
+                quote = lexemes.index('"', 0, complete)
+                while True:
+                    start += sum(map(len, lexemes[counted:quote]))
+                    counted = quote
+                    if len(text) - start <= self.stringLimit and (quote + 1 == len(lexemes) or lexemes[quote + 1][0] != '"'): # "" is never a string
+                        break
+                    quote = lexemes.index('"', quote + 1, complete)
+                complete = quote
+            except ValueError:
+                pass
+            pending = text[sum(map(len, lexemes[:complete])):]
+            yield lexemes[:complete]
+        if pending:
+            yield self.pattern.findall(pending)
+
+    def scan(self, batches, lineno=1, index=0):
+        exact, first = self.exact, self.first
+        lineStarts = self.lineStarts
+        make = tuple.__new__
+        try:
+            for lexemes in batches:
+                for lexeme in lexemes:
+                    start = index
+                    index += len(lexeme)
+                    kind = exact.get(lexeme)
+                    if kind is not None:
+                        yield make(Token, (kind, lexeme, lineno, start, index))
+                        continue
+                    kind = first.get(lexeme[0])
+                    if kind == "ID":
+                        yield make(Token, ("ID", lexeme, lineno, start, index))
+                    elif kind == "ignore" or kind == "comment":
+                        pass
+                    elif kind == "newline":
+                        lineno += len(lexeme)
+                        lineStarts.extend(range(start + 1, index + 1))
+                    elif kind == "INT":
+                        if "." in lexeme:
+                            yield make(Token, ("FLOAT", float(lexeme), lineno, start, index))
+                        else:
+                            yield make(Token, ("INT", int(lexeme), lineno, start, index))
+                    elif kind == "FLOAT" and len(lexeme) > 1:
+                        yield make(Token, ("FLOAT", float(lexeme), lineno, start, index))
+                    elif kind == "STRING" and len(lexeme) > 1:
+                        if "\n" in lexeme: # lines inside strings do not count for lineno, but they do for columns
+                            lineStarts.extend(start + offset + 1 for offset, character in enumerate(lexeme) if character == "\n")
+                        yield make(Token, ("STRING", lexeme, lineno, start, index))
+                    else:
+                        self.lineno, self.index = lineno, start
+                        self.error(make(Token, ("ERROR", lexeme, lineno, start, index)))
+        finally:
+            self.lineno, self.index = lineno, index
@@ -19,8 +19,7 @@ def when(param_type):
             dispatcher = dispatcher.dispatcher
         dispatcher.add_target(param_type, fn)
 
-        def ff(*args, **kw):
-            return dispatcher(*args, **kw)
+        ff = dispatcher.method()
         ff.dispatcher = dispatcher
         return ff
     return f
@@ -31,20 +30,48 @@ class Dispatcher(object):
         self.param_index = self.__argspec(fn).args.index(param_name)
         self.param_name = param_name
         self.targets = {}
+        self.resolved = {} # class -> target, found once for every class dispatched on
 
     def __call__(self, *args, **kw):
         typ = args[self.param_index].__class__
+        d = self.resolved.get(typ)
+        if d is None:
+            d = self.resolve(typ)
+        return d(*args, **kw)
+
+    def resolve(self, typ):
         d = self.targets.get(typ)
-        if d is not None:
-            return d(*args, **kw)
-        else:
+        if d is None:
+            # without a target of its own, a class gets the results of the targets of all its base classes
             issub = issubclass
-            t = self.targets
-            ks = iter(t)
-            return [t[k](*args, **kw) for k in ks if issub(typ, k)]
+            ds = [t for k, t in self.targets.items() if issub(typ, k)]
+
+            def d(*args, **kw):
+                return [t(*args, **kw) for t in ds]
+        self.resolved[typ] = d
+        return d
 
     def add_target(self, typ, target):
         self.targets[typ] = target
+        self.resolved.clear()
+
+    def method(self):
+        # function that stands for the dispatcher in the class body; when dispatching on the argument
+        # after self, it calls the target directly instead of packing the arguments for __call__
+        if self.param_index != 1:
+            def ff(*args, **kw):
+                return self(*args, **kw)
+            return ff
+
+        resolved = self.resolved
+        resolve = self.resolve
+
+        def ff(obj, arg):
+            d = resolved.get(arg.__class__)
+            if d is None:
+                d = resolve(arg.__class__)
+            return d(obj, arg)
+        return ff
 
     @staticmethod
     def __argspec(fn):